@@ -1,9 +1,13 @@
 from dagster import ExecutionTargetHandle, check
+from dagster.core.execution.api import clear_pipeline_caches
 from dagster.core.instance import DagsterInstance
+from dagster.utils.lru_cache import LRUCache
 
 from .pipeline_execution_manager import PipelineExecutionManager
 from .reloader import Reloader
 
+CONFIG_EVALUATION_CACHE_SIZE = 32
+
 
 class DagsterGraphQLContext(object):
     def __init__(self, handle, execution_manager, instance, reloader=None, version=None):
@@ -16,6 +20,14 @@ class DagsterGraphQLContext(object):
         self.version = version
         self.repository_definition = self.get_handle().build_repository_definition()
 
+        # Pipeline definitions, keyed by name or by name and solid subset, are built once and reused
+        # until the repository is reloaded, so that their environment schemas and execution plans
+        # can be cached between requests
+        self._pipeline_definitions = {}
+
+        # (pipeline_def, mode) -> IncrementalEvaluation of the config last validated for it
+        self.config_evaluations = LRUCache(CONFIG_EVALUATION_CACHE_SIZE)
+
         self.scheduler_handle = self.get_handle().build_scheduler_handle(
             artifacts_dir=self.instance.schedules_directory()
         )
@@ -30,6 +42,35 @@ class DagsterGraphQLContext(object):
         return self.repository_definition
 
     def get_pipeline(self, pipeline_name):
+        check.str_param(pipeline_name, 'pipeline_name')
+
+        if pipeline_name not in self._pipeline_definitions:
+            self._pipeline_definitions[pipeline_name] = self._build_pipeline(pipeline_name)
+
+        return self._pipeline_definitions[pipeline_name]
+
+    def get_sub_pipeline(self, pipeline_name, solid_subset):
+        check.str_param(pipeline_name, 'pipeline_name')
+        check.opt_list_param(solid_subset, 'solid_subset', of_type=str)
+
+        if solid_subset is None:
+            return self.get_pipeline(pipeline_name)
+
+        key = (pipeline_name, tuple(solid_subset))
+        if key not in self._pipeline_definitions:
+            self._pipeline_definitions[key] = self.get_pipeline(pipeline_name).build_sub_pipeline(
+                solid_subset
+            )
+
+        return self._pipeline_definitions[key]
+
+    def reload(self):
+        self._pipeline_definitions = {}
+        self.config_evaluations.clear()
+        clear_pipeline_caches()
+        return self.reloader.reload()
+
+    def _build_pipeline(self, pipeline_name):
         orig_handle = self.get_handle()
         if orig_handle.is_resolved_to_pipeline:
             pipeline_def = orig_handle.build_pipeline_definition()
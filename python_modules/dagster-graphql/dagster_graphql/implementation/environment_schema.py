@@ -62,7 +62,7 @@ def resolve_is_environment_config_valid(
     check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
 
     validated_config = evaluate_config(
-        environment_schema.environment_type, environment_dict, dagster_pipeline
+        environment_schema.environment_type, environment_dict, dagster_pipeline, compiled=True
     )
 
     dauphin_pipeline = graphene_info.schema.type_named('Pipeline')(dagster_pipeline)
@@ -75,7 +75,7 @@ def get_dagster_pipeline_from_selector(graphene_info, selector):
                     )
                 )
     try:
-        return orig_pipeline.build_sub_pipeline(selector.solid_subset)
+        return graphene_info.context.get_sub_pipeline(selector.name, selector.solid_subset)
     except DagsterInvalidDefinitionError:
         raise UserFacingGraphQLError(
             graphene_info.schema.type_named('InvalidSubsetError')(
@@ -4,12 +4,13 @@ from dagster import RunConfig, check
 from dagster.core.definitions import create_environment_schema
 from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
 from dagster.core.execution.api import create_execution_plan
-from dagster.core.types.evaluator import evaluate_config
+from dagster.core.types.evaluator import evaluate_config, evaluate_config_incremental
 
 from .fetch_pipelines import (
     get_dauphin_pipeline_from_selector_or_raise,
     get_dauphin_pipeline_reference_from_selector,
 )
+from .loader import build_dauphin_runs
 from .utils import UserFacingGraphQLError, capture_dauphin_error
 
 
@@ -25,25 +26,66 @@ def get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode
     environment_schema = create_environment_schema(pipeline, mode)
 
     validated_config = evaluate_config(
-        environment_schema.environment_type, environment_dict, pipeline
+        environment_schema.environment_type, environment_dict, pipeline, compiled=True
     )
 
     if not validated_config.success:
         raise UserFacingGraphQLError(
-            graphene_info.schema.type_named('PipelineConfigValidationInvalid')(
-                pipeline=dauphin_pipeline,
-                errors=[
-                    graphene_info.schema.type_named(
-                        'PipelineConfigValidationError'
-                    ).from_dagster_error(graphene_info, err)
-                    for err in validated_config.errors
-                ],
-            )
+            _config_validation_invalid(graphene_info, dauphin_pipeline, validated_config.errors)
         )
 
     return validated_config
 
 
+def get_validated_config_incremental(
+    graphene_info, dauphin_pipeline, environment_dict, mode, changed_path=None
+):
+    '''Validate config as get_validated_config does, but only re-evaluate the solids.<name> and
+    resources.<name> branches which have changed since config was last validated for the same
+    pipeline and mode.
+
+    Args:
+        changed_path (Optional[List[str]]): The path of the subtree of environment_dict that changed
+            since the last validation, e.g. ['solids', 'a_solid', 'config']. Other branches are
+            re-evaluated only if their values differ from those last validated.
+    '''
+    check.str_param(mode, 'mode')
+    check.opt_list_param(changed_path, 'changed_path', of_type=str)
+
+    pipeline = dauphin_pipeline.get_dagster_pipeline()
+
+    environment_schema = create_environment_schema(pipeline, mode)
+
+    cache_key = (pipeline, mode)
+    evaluation = evaluate_config_incremental(
+        environment_schema.environment_type,
+        environment_dict,
+        previous_evaluation=graphene_info.context.config_evaluations.get(cache_key),
+        changed_path=changed_path,
+        pipeline=pipeline,
+    )
+    graphene_info.context.config_evaluations.put(cache_key, evaluation)
+
+    if not evaluation.result.success:
+        raise UserFacingGraphQLError(
+            _config_validation_invalid(graphene_info, dauphin_pipeline, evaluation.result.errors)
+        )
+
+    return evaluation.result
+
+
+def _config_validation_invalid(graphene_info, dauphin_pipeline, errors):
+    return graphene_info.schema.type_named('PipelineConfigValidationInvalid')(
+        pipeline=dauphin_pipeline,
+        errors=[
+            graphene_info.schema.type_named('PipelineConfigValidationError').from_dagster_error(
+                graphene_info, err
+            )
+            for err in errors
+        ],
+    )
+
+
 def get_run(graphene_info, run_id):
     instance = graphene_info.context.instance
     run = instance.get_run_by_id(run_id)
@@ -84,7 +126,7 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.all_runs(cursor=cursor, limit=limit)
 
-    return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
+    return build_dauphin_runs(graphene_info, runs)
 
 
 @capture_dauphin_error
@@ -94,7 +136,7 @@ def validate_pipeline_config(graphene_info, selector, environment_dict, mode):
     check.opt_str_param(mode, 'mode')
 
     dauphin_pipeline = get_dauphin_pipeline_from_selector_or_raise(graphene_info, selector)
-    get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode)
+    get_validated_config_incremental(graphene_info, dauphin_pipeline, environment_dict, mode)
     return graphene_info.schema.type_named('PipelineConfigValidationValid')(dauphin_pipeline)
 
 
@@ -0,0 +1,71 @@
+from graphql.execution.base import ResolveInfo
+
+from dagster import check
+from dagster.core.definitions.pipeline import ExecutionSelector
+from dagster.core.storage.pipeline_run import PipelineRun
+
+from .fetch_pipelines import get_pipeline_reference_or_raise
+
+
+class BatchRunLoader(object):
+    '''Loads the data which the runs of a list resolved by a single query need, for every run in
+    the list at once.
+
+    Each DauphinPipelineRun in a list shares the list's loader. The first run to resolve a field
+    loads it for the whole list in one storage call, e.g. the stats of every run, and the other
+    runs read it from the loader, so that the number of storage calls made to resolve a page of
+    runs does not grow with the size of the page. Loaders are built per query, so nothing they
+    cache outlives the query.
+    '''
+
+    def __init__(self, pipeline_runs):
+        self._run_ids = [
+            pipeline_run.run_id
+            for pipeline_run in check.list_param(
+                pipeline_runs, 'pipeline_runs', of_type=PipelineRun
+            )
+        ]
+        # For checking runs belong to the list, without scanning it for each run
+        self._run_id_set = frozenset(self._run_ids)
+        self._stats = None
+        # (pipeline name, solid subset) -> DauphinPipelineReference
+        self._pipeline_references = {}
+
+    def get_run_stats(self, graphene_info, run_id):
+        check.inst_param(graphene_info, 'graphene_info', ResolveInfo)
+        check.str_param(run_id, 'run_id')
+        check.invariant(
+            run_id in self._run_id_set, 'Run {run_id} is not loaded'.format(run_id=run_id)
+        )
+
+        if self._stats is None:
+            self._stats = graphene_info.context.instance.get_runs_stats(self._run_ids)
+
+        return self._stats.get(run_id)
+
+    def get_pipeline_reference(self, graphene_info, selector):
+        check.inst_param(graphene_info, 'graphene_info', ResolveInfo)
+        check.inst_param(selector, 'selector', ExecutionSelector)
+
+        key = (
+            selector.name,
+            tuple(selector.solid_subset) if selector.solid_subset is not None else None,
+        )
+        if key not in self._pipeline_references:
+            self._pipeline_references[key] = get_pipeline_reference_or_raise(
+                graphene_info, selector
+            )
+
+        return self._pipeline_references[key]
+
+
+def build_dauphin_runs(graphene_info, pipeline_runs):
+    '''Build a DauphinPipelineRun for each of the runs, sharing a BatchRunLoader.'''
+    check.inst_param(graphene_info, 'graphene_info', ResolveInfo)
+    pipeline_runs = check.list_param(list(pipeline_runs), 'pipeline_runs', of_type=PipelineRun)
+
+    loader = BatchRunLoader(pipeline_runs)
+    return [
+        graphene_info.schema.type_named('PipelineRun')(pipeline_run, loader=loader)
+        for pipeline_run in pipeline_runs
+    ]
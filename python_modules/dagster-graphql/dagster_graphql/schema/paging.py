@@ -10,6 +10,7 @@ class DauphinPageInfo(dauphin.ObjectType):
     class Meta:
         name = 'PageInfo'
 
+    firstCursor = dauphin.Field('Cursor')
     lastCursor = dauphin.Field('Cursor')
     hasNextPage = dauphin.Field(dauphin.Boolean)
     hasPreviousPage = dauphin.Field(dauphin.Boolean)
@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.loader import build_dauphin_runs
 
 from dagster import (
     LoggerDefinition,
@@ -45,7 +46,9 @@ class DauphinPipeline(dauphin.ObjectType):
     description = dauphin.String()
     solids = dauphin.non_null_list('Solid')
     runtime_types = dauphin.non_null_list('RuntimeType')
-    runs = dauphin.non_null_list('PipelineRun')
+    runs = dauphin.Field(
+        dauphin.non_null_list('PipelineRun'), cursor=dauphin.String(), limit=dauphin.Int()
+    )
     modes = dauphin.non_null_list('Mode')
     solid_handles = dauphin.non_null_list('SolidHandle')
     presets = dauphin.non_null_list('PipelinePreset')
@@ -68,11 +71,13 @@ class DauphinPipeline(dauphin.ObjectType):
             key=lambda config_type: config_type.name,
         )
 
-    def resolve_runs(self, graphene_info):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs_with_pipeline_name(self._pipeline.name)
-        ]
+    def resolve_runs(self, graphene_info, **kwargs):
+        return build_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs_with_pipeline_name(
+                self._pipeline.name, cursor=kwargs.get('cursor'), limit=kwargs.get('limit')
+            ),
+        )
 
     def get_dagster_pipeline(self):
         return self._pipeline
@@ -472,7 +472,7 @@ class DauphinReloadDagit(dauphin.Mutation):
     Output = dauphin.NonNull(dauphin.Boolean)
 
     def mutate(self, graphene_info):
-        return graphene_info.context.reloader.reload()
+        return graphene_info.context.reload()
 
 
 class DauphinMutation(dauphin.ObjectType):
@@ -4,7 +4,7 @@ import logging
 
 import yaml
 from dagster_graphql import dauphin
-from dagster_graphql.implementation.fetch_pipelines import get_pipeline_reference_or_raise
+from dagster_graphql.implementation.loader import BatchRunLoader
 
 from dagster import RunConfig, check, seven
 from dagster.core.definitions.events import (
@@ -71,7 +71,20 @@ class DauphinPipelineRun(dauphin.ObjectType):
     status = dauphin.NonNull('PipelineRunStatus')
     pipeline = dauphin.NonNull('PipelineReference')
     stats = dauphin.NonNull('PipelineRunStatsSnapshot')
-    logs = dauphin.NonNull('LogMessageConnection')
+    logs = dauphin.Field(
+        dauphin.NonNull('LogMessageConnection'),
+        first=dauphin.Int(),
+        after=dauphin.Argument('Cursor'),
+        last=dauphin.Int(),
+        before=dauphin.Argument('Cursor'),
+        stepKeys=dauphin.List(dauphin.NonNull(dauphin.String)),
+        minLevel=dauphin.Argument('LogLevel'),
+        description='''
+        The events of the run. With first and after, or last and before, returns a page of the
+        events matching stepKeys and minLevel. Otherwise returns every matching event. Cursors
+        are offsets into the run's log, as for the after argument of pipelineRunLogs.
+        ''',
+    )
     computeLogs = dauphin.Field(
         dauphin.NonNull('ComputeLogs'),
         stepKey=dauphin.Argument(dauphin.NonNull(dauphin.String)),
@@ -86,20 +99,33 @@ class DauphinPipelineRun(dauphin.ObjectType):
     tags = dauphin.non_null_list('PipelineTag')
     canCancel = dauphin.NonNull(dauphin.Boolean)
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        # Runs resolved as part of a list share a loader, see build_dauphin_runs
+        self._loader = check.opt_inst_param(loader, 'loader', BatchRunLoader)
+        if self._loader is None:
+            self._loader = BatchRunLoader([pipeline_run])
 
     def resolve_pipeline(self, graphene_info):
-        return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
-
-    def resolve_logs(self, graphene_info):
-        return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
+        return self._loader.get_pipeline_reference(graphene_info, self._pipeline_run.selector)
+
+    def resolve_logs(self, graphene_info, **kwargs):
+        return graphene_info.schema.type_named('LogMessageConnection')(
+            self._pipeline_run,
+            loader=self._loader,
+            first=kwargs.get('first'),
+            after=kwargs.get('after'),
+            last=kwargs.get('last'),
+            before=kwargs.get('before'),
+            step_keys=kwargs.get('stepKeys'),
+            min_level=kwargs.get('minLevel'),
+        )
 
     def resolve_stats(self, graphene_info):
-        stats = graphene_info.context.instance.get_run_stats(self.run_id)
+        stats = self._loader.get_run_stats(graphene_info, self.run_id)
         return graphene_info.schema.type_named('PipelineRunStatsSnapshot')(stats)
 
     def resolve_computeLogs(self, graphene_info, stepKey):
@@ -233,11 +259,80 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
     nodes = dauphin.non_null_list('PipelineRunEvent')
     pageInfo = dauphin.NonNull('PageInfo')
 
-    def __init__(self, pipeline_run):
+    def __init__(
+        self,
+        pipeline_run,
+        loader=None,
+        first=None,
+        after=None,
+        last=None,
+        before=None,
+        step_keys=None,
+        min_level=None,
+    ):
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._loader = check.opt_inst_param(loader, 'loader', BatchRunLoader)
+        if self._loader is None:
+            self._loader = BatchRunLoader([pipeline_run])
+        self._first = check.opt_int_param(first, 'first')
+        self._after = check.opt_int_param(after, 'after')
+        self._last = check.opt_int_param(last, 'last')
+        self._before = check.opt_int_param(before, 'before')
+        self._step_keys = check.opt_nullable_list_param(step_keys, 'step_keys', of_type=str)
+        check.opt_str_param(min_level, 'min_level')
+        self._min_level = getattr(logging, min_level) if min_level else None
+
+        # Populated by _get_page, so that nodes and pageInfo share a single read of the logs
+        self._entries = None
+        self._has_more = None
+
+    @property
+    def _is_query(self):
+        return any(
+            arg is not None
+            for arg in [
+                self._first,
+                self._after,
+                self._last,
+                self._before,
+                self._step_keys,
+                self._min_level,
+            ]
+        )
+
+    @property
+    def _is_backward(self):
+        return self._first is None and self._last is not None
+
+    def _get_page(self, graphene_info):
+        if self._entries is not None:
+            return self._entries
+
+        # Cursors are offsets into the run's log on every storage, so that a page's cursors may be
+        # passed to the pipelineRunLogs subscription to tail the run from there. One more entry
+        # than the page holds is read to tell whether there are more.
+        limit = self._last if self._is_backward else self._first
+        entries = graphene_info.context.instance.query_logs(
+            self._pipeline_run.run_id,
+            step_keys=self._step_keys,
+            min_level=self._min_level,
+            cursor=self._after if self._after is not None else -1,
+            before_cursor=self._before,
+            limit=limit + 1 if limit is not None else None,
+            newest_first=self._is_backward,
+        )
+
+        self._has_more = limit is not None and len(entries) > limit
+        entries = entries[:limit]
+        self._entries = entries[::-1] if self._is_backward else entries
+        return self._entries
 
     def resolve_nodes(self, graphene_info):
-        pipeline = get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
+        entries = self._get_page(graphene_info)
+        if not entries:
+            return []
+
+        pipeline = self._loader.get_pipeline_reference(graphene_info, self._pipeline_run.selector)
 
         if isinstance(pipeline, DauphinPipeline):
             execution_plan = create_execution_plan(
@@ -250,21 +345,29 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
             execution_plan = None
 
         return [
-            from_event_record(graphene_info, log, pipeline, execution_plan)
-            for log in graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
+            from_event_record(graphene_info, entry.event_record, pipeline, execution_plan)
+            for entry in entries
         ]
 
     def resolve_pageInfo(self, graphene_info):
-        count = len(graphene_info.context.instance.all_logs(self._pipeline_run.run_id))
-        lastCursor = None
-        if count > 0:
-            lastCursor = str(count - 1)
+        entries = self._get_page(graphene_info)
+        count = len(entries)
+
+        total_count = (
+            graphene_info.context.instance.get_logs_count(
+                self._pipeline_run.run_id, step_keys=self._step_keys, min_level=self._min_level
+            )
+            if self._is_query
+            else count
+        )
+
         return graphene_info.schema.type_named('PageInfo')(
-            lastCursor=lastCursor,
-            hasNextPage=None,
-            hasPreviousPage=None,
+            firstCursor=entries[0].cursor if entries else None,
+            lastCursor=entries[-1].cursor if entries else None,
+            hasNextPage=None if self._is_backward else self._has_more,
+            hasPreviousPage=self._has_more if self._is_backward else None,
             count=count,
-            totalCount=count,
+            totalCount=total_count,
         )
 
 
@@ -57,6 +57,33 @@ mutation DeleteRun($runId: String!) {
 }
 '''
 
+PAGINATED_LOGS_QUERY = '''
+query PaginatedLogsQuery(
+  $runId: ID!, $first: Int, $after: Cursor, $last: Int, $before: Cursor, $stepKeys: [String!]
+) {
+  pipelineRunOrError(runId: $runId) {
+    ... on PipelineRun {
+      logs(first: $first, after: $after, last: $last, before: $before, stepKeys: $stepKeys) {
+        nodes {
+          __typename
+          ... on MessageEvent {
+            step { key }
+          }
+        }
+        pageInfo {
+          firstCursor
+          lastCursor
+          hasNextPage
+          hasPreviousPage
+          count
+          totalCount
+        }
+      }
+    }
+  }
+}
+'''
+
 
 def _get_runs_data(result, run_id):
     for run_data in result.data['pipeline']['runs']:
@@ -136,3 +163,121 @@ def test_get_runs_over_graphql():
         read_context, DELETE_RUN_MUTATION, variables={'runId': run_id_two}
     )
     assert result.data['deletePipelineRun']['__typename'] == 'PipelineRunNotFoundError'
+
+
+def _get_logs_page(context, run_id, **kwargs):
+    variables = dict(kwargs, runId=run_id)
+    result = execute_dagster_graphql(context, PAGINATED_LOGS_QUERY, variables=variables)
+    assert not result.errors
+    return result.data['pipelineRunOrError']['logs']
+
+
+def test_get_paginated_logs_over_graphql():
+    payload = sync_execute_get_run_log_data(
+        {
+            'executionParams': {
+                'selector': {'name': 'multi_mode_with_resources'},
+                'mode': 'add_mode',
+                'environmentConfigData': {'resources': {'op': {'config': 2}}},
+            }
+        }
+    )
+    run_id = payload['run']['runId']
+    typenames = [msg['__typename'] for msg in payload['messages']]
+
+    context = define_context(instance=DagsterInstance.local_temp())
+
+    logs = _get_logs_page(context, run_id)
+    assert [log['__typename'] for log in logs['nodes']] == typenames
+    assert logs['pageInfo']['count'] == logs['pageInfo']['totalCount'] == len(typenames)
+
+    # Page forwards through the logs, two at a time
+    nodes = []
+    after = None
+    while True:
+        logs = _get_logs_page(context, run_id, first=2, after=after)
+        assert logs['pageInfo']['totalCount'] == len(typenames)
+        assert logs['pageInfo']['count'] <= 2
+        nodes += logs['nodes']
+        if not logs['pageInfo']['hasNextPage']:
+            break
+        after = logs['pageInfo']['lastCursor']
+    assert [log['__typename'] for log in nodes] == typenames
+
+    # And backwards from the end
+    logs = _get_logs_page(context, run_id, last=3)
+    assert [log['__typename'] for log in logs['nodes']] == typenames[-3:]
+    assert logs['pageInfo']['hasPreviousPage']
+
+    logs = _get_logs_page(context, run_id, last=3, before=logs['pageInfo']['firstCursor'])
+    assert [log['__typename'] for log in logs['nodes']] == typenames[-6:-3]
+
+    step_key = next(
+        msg['step']['key'] for msg in payload['messages'] if msg.get('step') is not None
+    )
+    logs = _get_logs_page(context, run_id, stepKeys=[step_key])
+    assert logs['nodes']
+    assert all(log['step']['key'] == step_key for log in logs['nodes'])
+    assert logs['pageInfo']['totalCount'] == len(logs['nodes'])
+
+
+RUNS_STATS_QUERY = '''
+query PipelineRunsStatsQuery($name: String!, $limit: Int) {
+  pipeline(params: { name: $name }) {
+    ... on Pipeline {
+      runs(limit: $limit) {
+        runId
+        pipeline { name }
+        stats {
+          stepsSucceeded
+          stepsFailed
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def test_get_runs_stats_in_one_call():
+    for config in [2, 3, 4]:
+        sync_execute_get_run_log_data(
+            {
+                'executionParams': {
+                    'selector': {'name': 'multi_mode_with_resources'},
+                    'mode': 'add_mode',
+                    'environmentConfigData': {'resources': {'op': {'config': config}}},
+                }
+            }
+        )
+
+    instance = DagsterInstance.local_temp()
+    calls = []
+
+    def _get_runs_stats(run_ids):
+        calls.append(run_ids)
+        return DagsterInstance.get_runs_stats(instance, run_ids)
+
+    def _get_run_stats(run_id):
+        raise Exception('Stats for run {run_id} fetched on their own'.format(run_id=run_id))
+
+    instance.get_runs_stats = _get_runs_stats
+    instance.get_run_stats = _get_run_stats
+    read_context = define_context(instance=instance)
+
+    result = execute_dagster_graphql(
+        read_context, RUNS_STATS_QUERY, variables={'name': 'multi_mode_with_resources'}
+    )
+    assert not result.errors
+    runs = result.data['pipeline']['runs']
+    assert len(runs) >= 3
+    assert all(run['pipeline']['name'] == 'multi_mode_with_resources' for run in runs)
+    assert all(run['stats']['stepsSucceeded'] > 0 for run in runs)
+    assert calls == [[run['runId'] for run in runs]]
+
+    result = execute_dagster_graphql(
+        read_context, RUNS_STATS_QUERY, variables={'name': 'multi_mode_with_resources', 'limit': 2}
+    )
+    assert not result.errors
+    assert len(result.data['pipeline']['runs']) == 2
+    assert len(calls) == 2 and len(calls[-1]) == 2
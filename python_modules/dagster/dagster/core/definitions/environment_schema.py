@@ -2,6 +2,7 @@ from collections import namedtuple
 
 from dagster import check
 from dagster.core.types.config import ConfigType
+from dagster.utils.lru_cache import LRUCache
 
 from .environment_configs import (
     EnvironmentClassCreationData,
@@ -50,9 +51,31 @@ class EnvironmentSchema(
         return self.config_type_dict_by_key.values()
 
 
+ENVIRONMENT_SCHEMA_CACHE_SIZE = 64
+
+# (pipeline_def, mode) -> EnvironmentSchema. Keys hold the pipeline definition itself, so entries
+# are only shared between calls made with the same definition object.
+_ENVIRONMENT_SCHEMA_CACHE = LRUCache(ENVIRONMENT_SCHEMA_CACHE_SIZE)
+
+
+def clear_environment_schema_cache():
+    _ENVIRONMENT_SCHEMA_CACHE.clear()
+
+
 def create_environment_schema(pipeline_def, mode=None):
     check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
     mode = check.opt_str_param(mode, 'mode', default=pipeline_def.get_default_mode_name())
+
+    cache_key = (pipeline_def, mode)
+    environment_schema = _ENVIRONMENT_SCHEMA_CACHE.get(cache_key)
+    if environment_schema is None:
+        environment_schema = _build_environment_schema(pipeline_def, mode)
+        _ENVIRONMENT_SCHEMA_CACHE.put(cache_key, environment_schema)
+
+    return environment_schema
+
+
+def _build_environment_schema(pipeline_def, mode):
     mode_definition = pipeline_def.get_mode_definition(mode)
 
     environment_cls = define_environment_cls(
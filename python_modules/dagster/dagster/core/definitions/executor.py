@@ -1,6 +1,10 @@
 from dagster import check
-from dagster.core.execution.config import InProcessExecutorConfig, MultiprocessExecutorConfig
-from dagster.core.types import Field, Int
+from dagster.core.execution.config import (
+    InProcessExecutorConfig,
+    MultiprocessExecutorConfig,
+    WorkerPoolConfig,
+)
+from dagster.core.types import Bool, Dict, Field, Int
 from dagster.core.types.field_utils import check_user_facing_opt_field_param
 
 from .config import resolve_config_field
@@ -100,17 +104,63 @@ class _ExecutorDecoratorCallable:
         )
 
 
-@executor(name='in_process')
+RELEASE_INTERMEDIATES_FIELD = Field(
+    Bool,
+    is_optional=True,
+    default_value=False,
+    description='Remove each intermediate as soon as every step that consumes it has completed, '
+    'rather than keeping all intermediates until the end of the run. Outputs that no step in the '
+    'run consumes are always kept. Released intermediates are not available for re-execution.',
+)
+
+
+@executor(name='in_process', config={'release_intermediates': RELEASE_INTERMEDIATES_FIELD})
 def in_process_executor(init_context):
     from dagster.core.engine.init import InitExecutorContext
 
     check.inst_param(init_context, 'init_context', InitExecutorContext)
 
-    return InProcessExecutorConfig()
+    return InProcessExecutorConfig(
+        release_intermediates=init_context.executor_config.get('release_intermediates', False)
+    )
 
 
 @executor(
-    name='multiprocess', config={'max_concurrent': Field(Int, is_optional=True, default_value=0)}
+    name='multiprocess',
+    config={
+        'max_concurrent': Field(Int, is_optional=True, default_value=0),
+        'forward_events': Field(
+            Bool,
+            is_optional=True,
+            default_value=True,
+            description='Send every event from the step processes back to the process executing '
+            'the pipeline. When false, only step failures are sent in full, so the events returned '
+            'to an in-process caller such as execute_pipeline omit the other step events. Every '
+            'event is still stored in the run\'s event log.',
+        ),
+        'worker_pool': Field(
+            Dict(
+                {
+                    'max_steps_per_worker': Field(
+                        Int,
+                        is_optional=True,
+                        description='Recycle a worker process after it has executed this many '
+                        'steps.',
+                    ),
+                    'max_memory_mb': Field(
+                        Int,
+                        is_optional=True,
+                        description='Recycle a worker process once its peak memory usage exceeds '
+                        'this many megabytes.',
+                    ),
+                }
+            ),
+            is_optional=True,
+            description='Execute steps in a pool of long-lived worker processes that load the '
+            'pipeline and execution plan once, rather than in a new process per step.',
+        ),
+        'release_intermediates': RELEASE_INTERMEDIATES_FIELD,
+    },
 )
 def multiprocess_executor(init_context):
     from dagster.core.definitions.handle import ExecutionTargetHandle
@@ -119,8 +169,16 @@ def multiprocess_executor(init_context):
     check.inst_param(init_context, 'init_context', InitExecutorContext)
 
     handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
+
+    worker_pool_config = init_context.executor_config.get('worker_pool')
     return MultiprocessExecutorConfig(
-        handle=handle, max_concurrent=init_context.executor_config['max_concurrent']
+        handle=handle,
+        max_concurrent=init_context.executor_config['max_concurrent'],
+        worker_pool=WorkerPoolConfig(**worker_pool_config)
+        if worker_pool_config is not None
+        else None,
+        release_intermediates=init_context.executor_config['release_intermediates'],
+        forward_events=init_context.executor_config['forward_events'],
     )
 
 
@@ -1,8 +1,8 @@
 '''Facilities for running arbitrary commands in child processes.'''
 
-import multiprocessing
 import os
 import sys
+import time
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 
@@ -12,6 +12,11 @@ from dagster import check
 from dagster.utils import get_multiprocessing_context
 from dagster.utils.error import serializable_error_info_from_exc_info
 
+try:
+    from multiprocessing.connection import wait as _wait_for_ready
+except ImportError:  # Python 2
+    _wait_for_ready = None
+
 
 class ChildProcessEvent:
     pass
@@ -31,6 +36,12 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessTaskDoneEvent(
+    namedtuple('ChildProcessTaskDoneEvent', 'pid retiring'), ChildProcessEvent
+):
+    pass
+
+
 class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     '''Inherit from this class in order to use this library.
 
@@ -43,31 +54,111 @@ class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-in
         Yields a sequence of events to be handled by _execute_command_in_child_process.'''
 
 
+class ChildProcessWorkerCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    '''Inherit from this class in order to execute a sequence of tasks in a long-lived child
+    process using a ChildProcessWorker.
+
+    The object must be picklable; state built in setup is only ever held by the child process.'''
+
+    @abstractmethod
+    def setup(self):
+        '''This method is invoked once in the child process, before any task is executed.'''
+
+    @abstractmethod
+    def execute_task(self, task):
+        '''This method is invoked in the child process for each task sent to the worker.
+
+        Yields a sequence of events to be handled by ChildProcessWorker.execute_task.'''
+
+
 class ChildProcessCrashException(Exception):
     '''Thrown when the child process crashes.'''
 
 
-def _execute_command_in_child_process(queue, command):
+def _execute_command_in_child_process(conn, command):
     '''Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.'''
+    Handles errors and communicates across a pipe with the parent process.'''
 
     check.inst_param(command, 'command', ChildProcessCommand)
 
     pid = os.getpid()
-    queue.put(ChildProcessStartEvent(pid=pid))
+    conn.send(ChildProcessStartEvent(pid=pid))
     try:
         for step_event in command.execute():
-            queue.put(step_event)
-        queue.put(ChildProcessDoneEvent(pid=pid))
+            conn.send(step_event)
+        conn.send(ChildProcessDoneEvent(pid=pid))
     except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
-        queue.put(
+        conn.send(
             ChildProcessSystemErrorEvent(
                 pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
             )
         )
     finally:
-        queue.close()
+        conn.close()
+
+
+def _get_peak_memory_mb():
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return max_rss / (1024.0 * 1024.0)
+    return max_rss / 1024.0
+
+
+def _should_retire_worker(num_tasks, max_tasks, max_memory_mb):
+    if max_tasks and num_tasks >= max_tasks:
+        return True
+
+    if max_memory_mb:
+        peak_memory_mb = _get_peak_memory_mb()
+        return peak_memory_mb is not None and peak_memory_mb >= max_memory_mb
+
+    return False
+
+
+def _execute_worker_command_in_child_process(task_queue, conn, command, max_tasks, max_memory_mb):
+    '''Wraps the execution of a ChildProcessWorkerCommand.
+
+    Executes tasks received over task_queue until a None sentinel is received or the worker
+    retires, communicating events across a pipe with the parent process.'''
+
+    check.inst_param(command, 'command', ChildProcessWorkerCommand)
+
+    pid = os.getpid()
+    conn.send(ChildProcessStartEvent(pid=pid))
+    try:
+        command.setup()
+
+        num_tasks = 0
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            for event in command.execute_task(task):
+                conn.send(event)
+
+            num_tasks += 1
+            retiring = _should_retire_worker(num_tasks, max_tasks, max_memory_mb)
+            conn.send(ChildProcessTaskDoneEvent(pid=pid, retiring=retiring))
+            if retiring:
+                break
+
+        conn.send(ChildProcessDoneEvent(pid=pid))
+    except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
+        conn.send(
+            ChildProcessSystemErrorEvent(
+                pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+            )
+        )
+    finally:
+        conn.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -77,32 +168,79 @@ PROCESS_DEAD_AND_QUEUE_EMPTY = 'PROCESS_DEAD_AND_QUEUE_EMPTY'
 '''Sentinel value.'''
 
 
-def _poll_for_event(process, queue):
+def _poll_for_event(process, conn, timeout=TICK):
     try:
-        return queue.get(block=True, timeout=TICK)
+        if conn.poll(timeout):
+            return conn.recv()
     except KeyboardInterrupt as e:
         return e
-    except multiprocessing.queues.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return queue.get(block=False)
-            except multiprocessing.queues.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+    except EOFError:
+        # The child process has closed its end of the pipe, either on exit or because it
+        # crashed, so no more events will arrive
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process sent
+        # another event and then died. In that case we want to continue
+        # draining the pipe.
+        try:
+            if conn.poll(0):
+                return conn.recv()
+        except EOFError:
+            pass
+        # If the pipe is empty we know that there are no more events
+        # and that the process has died.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
 
     return None
 
 
-def execute_child_process_command(command):
+class ChildProcessEventMultiplexer(object):
+    '''Lets a parent process block on many child processes at once.
+
+    Child process executions registered with the multiplexer poll their pipe without blocking,
+    yielding None when no event is ready. Once a full pass over the in-flight executions has
+    produced nothing, the parent calls wait, which returns as soon as any registered child has an
+    event ready or has exited. This keeps event latency and parent CPU flat as the number of
+    concurrent children grows, rather than blocking for a TICK on each idle child in turn.
+    '''
+
+    def __init__(self):
+        self._waitables = set()
+
+    def register(self, conn, process):
+        self._waitables.add(conn)
+        if hasattr(process, 'sentinel'):
+            self._waitables.add(process.sentinel)
+
+    def unregister(self, conn, process):
+        self._waitables.discard(conn)
+        if hasattr(process, 'sentinel'):
+            self._waitables.discard(process.sentinel)
+
+    def wait(self, timeout=None):
+        '''Block until any registered child process has an event ready or has exited.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to block for.
+        '''
+        if not self._waitables:
+            return
+
+        if _wait_for_ready is None:
+            # Without multiprocessing.connection.wait, fall back to a single tick of polling
+            time.sleep(TICK if timeout is None else min(timeout, TICK))
+            return
+
+        _wait_for_ready(list(self._waitables), timeout)
+
+
+def execute_child_process_command(command, multiplexer=None):
     '''Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -119,37 +257,145 @@ def execute_child_process_command(command):
 
     Args:
         command (ChildProcessCommand): The command to execute in the child process.
+        multiplexer (Optional[ChildProcessEventMultiplexer]): If provided, the pipe is polled
+            without blocking and the caller is responsible for waiting on the multiplexer when
+            none of its child processes have produced an event. Otherwise each poll blocks for up
+            to a TICK.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     '''
 
     check.inst_param(command, 'command', ChildProcessCommand)
+    check.opt_inst_param(multiplexer, 'multiplexer', ChildProcessEventMultiplexer)
 
     multiprocessing_context = get_multiprocessing_context()
-    queue = multiprocessing_context.Queue()
+    reader, writer = multiprocessing_context.Pipe(duplex=False)
 
     process = multiprocessing_context.Process(
-        target=_execute_command_in_child_process, args=(queue, command)
+        target=_execute_command_in_child_process, args=(writer, command)
     )
 
     process.start()
 
+    # Close the parent's copy of the write end so that we see EOF when the child exits
+    writer.close()
+
+    timeout = TICK
+    if multiplexer:
+        multiplexer.register(reader, process)
+        timeout = 0
+
     completed_properly = False
 
-    while not completed_properly:
-        event = _poll_for_event(process, queue)
+    try:
+        while not completed_properly:
+            event = _poll_for_event(process, reader, timeout)
 
-        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-            break
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
 
-        yield event
+            yield event
 
-        if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-            completed_properly = True
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+    finally:
+        if multiplexer:
+            multiplexer.unregister(reader, process)
 
     if not completed_properly:
         # TODO Gather up stderr and the process exit code
         raise ChildProcessCrashException()
 
     process.join()
+    reader.close()
+
+
+class ChildProcessWorker(object):
+    '''A long-lived child process which executes a sequence of tasks.
+
+    Any setup cost incurred by the command is paid once per worker rather than once per task.
+    The worker retires -- finishes its current task and exits -- once it has executed max_tasks
+    tasks or its peak memory usage has exceeded max_memory_mb, whichever happens first.
+
+    Args:
+        command (ChildProcessWorkerCommand): The command to execute in the child process.
+        max_tasks (Optional[int]): Retire the worker after it has executed this many tasks.
+        max_memory_mb (Optional[int]): Retire the worker once its peak resident memory exceeds
+            this many megabytes. Ignored on platforms where this cannot be measured.
+    '''
+
+    def __init__(self, command, max_tasks=None, max_memory_mb=None):
+        check.inst_param(command, 'command', ChildProcessWorkerCommand)
+        check.opt_int_param(max_tasks, 'max_tasks')
+        check.opt_int_param(max_memory_mb, 'max_memory_mb')
+
+        multiprocessing_context = get_multiprocessing_context()
+        self._task_queue = multiprocessing_context.Queue()
+        self._reader, writer = multiprocessing_context.Pipe(duplex=False)
+
+        self._process = multiprocessing_context.Process(
+            target=_execute_worker_command_in_child_process,
+            args=(self._task_queue, writer, command, max_tasks, max_memory_mb),
+        )
+        self._process.start()
+
+        # Close the parent's copy of the write end so that we see EOF when the child exits
+        writer.close()
+
+        self.is_retired = False
+
+    def execute_task(self, task, multiplexer=None):
+        '''Execute a task in the worker's child process.
+
+        Yields the same family of objects as execute_child_process_command, finishing with a
+        ChildProcessTaskDoneEvent, or a ChildProcessSystemErrorEvent if the worker errored.
+
+        Args:
+            task: A picklable value passed to the command's execute_task method.
+            multiplexer (Optional[ChildProcessEventMultiplexer]): As for
+                execute_child_process_command.
+        '''
+        check.invariant(not self.is_retired, 'Cannot execute a task on a retired worker')
+        check.invariant(task is not None, 'None is reserved to signal worker shutdown')
+        check.opt_inst_param(multiplexer, 'multiplexer', ChildProcessEventMultiplexer)
+
+        self._task_queue.put(task)
+
+        timeout = TICK
+        if multiplexer:
+            multiplexer.register(self._reader, self._process)
+            timeout = 0
+
+        try:
+            while True:
+                event = _poll_for_event(self._process, self._reader, timeout)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    self.is_retired = True
+                    raise ChildProcessCrashException()
+
+                yield event
+
+                if isinstance(event, ChildProcessSystemErrorEvent):
+                    self.is_retired = True
+                    return
+
+                if isinstance(event, ChildProcessTaskDoneEvent):
+                    self.is_retired = event.retiring
+                    return
+        finally:
+            if multiplexer:
+                multiplexer.unregister(self._reader, self._process)
+
+    def shutdown(self):
+        '''Signal the worker to exit once idle and wait for the child process to finish.'''
+        if self._process.is_alive() and not self.is_retired:
+            self._task_queue.put(None)
+        self.is_retired = True
+
+        # Drain any trailing events so the child process is not left blocked on a full pipe
+        while _poll_for_event(self._process, self._reader) != PROCESS_DEAD_AND_QUEUE_EMPTY:
+            pass
+        self._process.join()
+        self._reader.close()
@@ -19,7 +19,11 @@ from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
 )
-from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.memoization import (
+    copy_required_intermediates_for_execution,
+    release_intermediates,
+)
+from dagster.core.execution.plan.active import ActiveExecution
 from dagster.core.execution.plan.objects import (
     StepFailureData,
     StepInputData,
@@ -66,13 +70,11 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
 
             failed_or_skipped_steps = set()
 
-            step_levels = execution_plan.execution_step_levels()
+            active_execution = ActiveExecution(execution_plan)
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
-            for step_level in step_levels:
-                for step in step_level:
+            while not active_execution.is_complete:
+                steps = active_execution.get_steps_to_execute()
+                for step in steps:
                     step_context = pipeline_context.for_step(step)
 
                     with mirror_step_io(step_context):
@@ -123,6 +125,18 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
 
                             yield step_event
 
+                # Steps execute serially in this process, so the whole batch has finished here
+                for step in steps:
+                    active_execution.mark_complete(step.key)
+
+                if pipeline_context.executor_config.release_intermediates:
+                    for event in release_intermediates(
+                        pipeline_context,
+                        execution_plan,
+                        active_execution.pop_releasable_output_handles(),
+                    ):
+                        yield event
+
         yield DagsterEvent.engine_event(
             pipeline_context,
             'Finished steps in process (pid: {pid}) in {duration_ms}'.format(
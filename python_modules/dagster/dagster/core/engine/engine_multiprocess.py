@@ -1,12 +1,21 @@
 import os
+from collections import namedtuple
 
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
-from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.execution.api import (
+    create_execution_plan,
+    execute_plan_iterator,
+    flush_events_on_exit,
+)
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
-from dagster.core.execution.memoization import copy_required_intermediates_for_execution
+from dagster.core.execution.memoization import (
+    copy_required_intermediates_for_execution,
+    release_intermediates,
+)
+from dagster.core.execution.plan.active import ActiveExecution
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
@@ -15,12 +24,66 @@ from dagster.utils.timing import format_duration, time_execution_scope
 from .child_process_executor import (
     ChildProcessCommand,
     ChildProcessEvent,
+    ChildProcessEventMultiplexer,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
     execute_child_process_command,
 )
 from .engine_base import Engine
 
 
+MULTIPLEXER_WAIT_TIMEOUT = 1.0
+'''The maximum time in seconds the parent blocks waiting on idle child processes.'''
+
+
+class ChildProcessDagsterEventSummary(
+    namedtuple('_ChildProcessDagsterEventSummary', 'event_type_value step_key')
+):
+    '''Sent to the parent in place of a DagsterEvent yielded in a step's child process, when the
+    executor is not configured to forward events. The event itself is already stored in the run's
+    event log by the child.
+    '''
+
+    def __new__(cls, event_type_value, step_key):
+        return super(ChildProcessDagsterEventSummary, cls).__new__(
+            cls,
+            check.str_param(event_type_value, 'event_type_value'),
+            check.opt_str_param(step_key, 'step_key'),
+        )
+
+    @property
+    def event_type(self):
+        return DagsterEventType(self.event_type_value)
+
+
+def child_process_dagster_event(event, forward_events=True):
+    '''The form in which a DagsterEvent yielded in a step's child process is sent to the parent:
+    the event itself, or only a summary of it if events are not forwarded. Step failures are always
+    sent in full.'''
+    check.inst_param(event, 'event', DagsterEvent)
+    check.bool_param(forward_events, 'forward_events')
+
+    if forward_events or event.is_step_failure:
+        return event
+
+    return ChildProcessDagsterEventSummary(event.event_type_value, event.step_key)
+
+
+def _child_process_step_events(instance, step_events, forward_events):
+    '''Yields the events of a step executing in a child process, to be sent to the parent.
+
+    Events handled in the background are only waited for at the end of the step, so that logging
+    in the step does not wait on storage: before the step's success or failure is sent, since the
+    parent acts on it, and when the step exits, before the parent launches the steps downstream.
+    '''
+    with flush_events_on_exit(instance):
+        for step_event in step_events:
+            if step_event.is_step_success or step_event.is_step_failure:
+                instance.flush_events()
+            yield child_process_dagster_event(step_event, forward_events)
+
+
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
         self, environment_dict, pipeline_run, executor_config, step_key, instance_ref, term_event
@@ -43,28 +106,127 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
             pipeline_def, environment_dict, self.pipeline_run
         ).build_subset_plan([self.step_key])
 
-        for step_event in execute_plan_iterator(
-            execution_plan,
-            self.pipeline_run,
-            environment_dict=environment_dict,
-            instance=DagsterInstance.from_ref(self.instance_ref),
+        instance = DagsterInstance.from_ref(self.instance_ref)
+        for event in _child_process_step_events(
+            instance,
+            execute_plan_iterator(
+                execution_plan,
+                self.pipeline_run,
+                environment_dict=environment_dict,
+                instance=instance,
+            ),
+            self.executor_config.forward_events,
         ):
-            yield step_event
+            yield event
 
 
-def execute_step_out_of_process(step_context, step, errors, term_events):
-    command = InProcessExecutorChildProcessCommand(
-        step_context.environment_dict,
-        step_context.pipeline_run,
-        step_context.executor_config,
-        step.key,
-        step_context.instance.get_ref(),
-        term_events[step.key],
-    )
+class InProcessExecutorChildProcessWorkerCommand(ChildProcessWorkerCommand):
+    '''Executes steps one at a time in a long-lived worker process, loading the pipeline,
+    execution plan and instance only once.'''
+
+    def __init__(self, environment_dict, pipeline_run, executor_config, instance_ref, term_event):
+        self.environment_dict = environment_dict
+        self.executor_config = executor_config
+        self.pipeline_run = pipeline_run
+        self.instance_ref = instance_ref
+        self.term_event = term_event
+
+        # Populated by setup in the worker process
+        self._execution_plan = None
+        self._instance = None
+
+    def setup(self):
+        check.inst(self.executor_config, MultiprocessExecutorConfig)
+        pipeline_def = self.executor_config.handle.build_pipeline_definition()
+        self.environment_dict = dict(self.environment_dict, execution={'in_process': {}})
+
+        start_termination_thread(self.term_event)
+
+        self._execution_plan = create_execution_plan(
+            pipeline_def, self.environment_dict, self.pipeline_run
+        )
+        self._instance = DagsterInstance.from_ref(self.instance_ref)
+
+    def execute_task(self, task):
+        step_key = check.str_param(task, 'task')
+
+        for event in _child_process_step_events(
+            self._instance,
+            execute_plan_iterator(
+                self._execution_plan.build_subset_plan([step_key]),
+                self.pipeline_run,
+                environment_dict=self.environment_dict,
+                instance=self._instance,
+            ),
+            self.executor_config.forward_events,
+        ):
+            yield event
+
 
-    for ret in execute_child_process_command(command):
-        if ret is None or isinstance(ret, DagsterEvent):
+class _PooledWorker(namedtuple('_PooledWorker', 'worker term_event')):
+    pass
+
+
+class StepWorkerPool(object):
+    '''A pool of long-lived worker processes, each of which executes steps of a single run.
+
+    Workers are started lazily as steps are submitted and are recycled once they retire, either
+    because of the step count or the memory ceiling in the WorkerPoolConfig.'''
+
+    def __init__(self, pipeline_context):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        self._pipeline_context = pipeline_context
+        self._config = pipeline_context.executor_config.worker_pool
+        self._idle_workers = []
+        self._all_workers = []
+
+    def acquire(self):
+        if self._idle_workers:
+            return self._idle_workers.pop()
+
+        term_event = get_multiprocessing_context().Event()
+        command = InProcessExecutorChildProcessWorkerCommand(
+            self._pipeline_context.environment_dict,
+            self._pipeline_context.pipeline_run,
+            self._pipeline_context.executor_config,
+            self._pipeline_context.instance.get_ref(),
+            term_event,
+        )
+        pooled_worker = _PooledWorker(
+            ChildProcessWorker(
+                command,
+                max_tasks=self._config.max_steps_per_worker,
+                max_memory_mb=self._config.max_memory_mb,
+            ),
+            term_event,
+        )
+        self._all_workers.append(pooled_worker)
+        return pooled_worker
+
+    def release(self, pooled_worker):
+        check.inst_param(pooled_worker, 'pooled_worker', _PooledWorker)
+        if pooled_worker.worker.is_retired:
+            pooled_worker.worker.shutdown()
+            self._all_workers.remove(pooled_worker)
+        else:
+            self._idle_workers.append(pooled_worker)
+
+    def shutdown(self):
+        for pooled_worker in self._all_workers:
+            pooled_worker.worker.shutdown()
+        self._idle_workers = []
+        self._all_workers = []
+
+
+def _handle_child_process_events(step_context, child_process_events, errors, term_events):
+    for ret in child_process_events:
+        if ret is None:
+            yield ret
+        elif isinstance(ret, DagsterEvent):
             yield ret
+        elif isinstance(ret, ChildProcessDagsterEventSummary):
+            # Events which were not forwarded are already in the run's event log
+            pass
         elif isinstance(ret, ChildProcessEvent):
             if isinstance(ret, ChildProcessSystemErrorEvent):
                 errors[ret.pid] = ret.error_info
@@ -80,22 +242,84 @@ def execute_step_out_of_process(step_context, step, errors, term_events):
             check.failed('Unexpected return value from child process {}'.format(type(ret)))
 
 
-def bounded_parallel_executor(pipeline_context, step_contexts, limit):
-    pending_execution = list(step_contexts)
+def execute_step_out_of_process(step_context, step, errors, term_events, multiplexer=None):
+    command = InProcessExecutorChildProcessCommand(
+        step_context.environment_dict,
+        step_context.pipeline_run,
+        step_context.executor_config,
+        step.key,
+        step_context.instance.get_ref(),
+        term_events[step.key],
+    )
+
+    for ret in _handle_child_process_events(
+        step_context, execute_child_process_command(command, multiplexer), errors, term_events
+    ):
+        yield ret
+
+
+def execute_step_in_worker(
+    step_context, step, worker_pool, pooled_worker, errors, term_events, multiplexer=None
+):
+    try:
+        for ret in _handle_child_process_events(
+            step_context,
+            pooled_worker.worker.execute_task(step.key, multiplexer),
+            errors,
+            term_events,
+        ):
+            yield ret
+    finally:
+        worker_pool.release(pooled_worker)
+
+
+def bounded_parallel_executor(pipeline_context, active_execution, limit, worker_pool=None):
+    intermediates_manager = pipeline_context.intermediates_manager
     active_iters = {}
     errors = {}
     term_events = {}
+    multiplexer = ChildProcessEventMultiplexer()
 
-    while pending_execution or active_iters:
+    while not active_execution.is_complete:
         try:
-            while len(active_iters) < limit and pending_execution:
-                step_context = pending_execution.pop()
-                step = step_context.step
-                term_events[step.key] = get_multiprocessing_context().Event()
-                active_iters[step.key] = execute_step_out_of_process(
-                    step_context, step, errors, term_events
-                )
+            # Launch steps as soon as their upstream steps have finished, rather than waiting for
+            # every step in the previous level of the plan
+            for step in active_execution.get_steps_to_execute(limit - len(active_iters)):
+                step_context = pipeline_context.for_step(step)
 
+                if not intermediates_manager.all_inputs_covered(step_context, step):
+                    uncovered_inputs = intermediates_manager.uncovered_inputs(step_context, step)
+                    step_context.log.error(
+                        (
+                            'Not all inputs covered for {step}. Not executing.'
+                            'Output missing for inputs: {uncovered_inputs}'
+                        ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                    )
+                    active_execution.mark_complete(step.key)
+                    continue
+
+                # The step's events must be stored after those the parent has handled so far
+                pipeline_context.instance.flush_events()
+
+                if worker_pool is not None:
+                    pooled_worker = worker_pool.acquire()
+                    term_events[step.key] = pooled_worker.term_event
+                    active_iters[step.key] = execute_step_in_worker(
+                        step_context,
+                        step,
+                        worker_pool,
+                        pooled_worker,
+                        errors,
+                        term_events,
+                        multiplexer,
+                    )
+                else:
+                    term_events[step.key] = get_multiprocessing_context().Event()
+                    active_iters[step.key] = execute_step_out_of_process(
+                        step_context, step, errors, term_events, multiplexer
+                    )
+
+            made_progress = False
             empty_iters = []
             for key, step_iter in active_iters.items():
                 try:
@@ -103,6 +327,7 @@ def bounded_parallel_executor(pipeline_context, step_contexts, limit):
                     if event_or_none is None:
                         continue
                     else:
+                        made_progress = True
                         yield event_or_none
 
                 except StopIteration:
@@ -111,6 +336,20 @@ def bounded_parallel_executor(pipeline_context, step_contexts, limit):
             for key in empty_iters:
                 del active_iters[key]
                 del term_events[key]
+                active_execution.mark_complete(key)
+
+            if pipeline_context.executor_config.release_intermediates:
+                for event in release_intermediates(
+                    pipeline_context,
+                    active_execution.execution_plan,
+                    active_execution.pop_releasable_output_handles(),
+                ):
+                    yield event
+
+            # Rather than spinning over idle children, block until any of them has an event
+            # ready or exits. The timeout bounds how long we go without re-checking liveness.
+            if active_iters and not made_progress and not empty_iters:
+                multiplexer.wait(timeout=MULTIPLEXER_WAIT_TIMEOUT)
 
         # In the very small chance that we get interrupted in this coordination section and not
         # polling the subprocesses for events - try to clean up greacefully
@@ -144,10 +383,6 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
         check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
         check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
 
-        step_levels = execution_plan.execution_step_levels()
-
-        intermediates_manager = pipeline_context.intermediates_manager
-
         limit = pipeline_context.executor_config.max_concurrent
 
         step_key_set = set(step.key for step in execution_plan.execution_steps())
@@ -162,37 +397,25 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         with time_execution_scope() as timer_result:
             for event in copy_required_intermediates_for_execution(
                 pipeline_context, execution_plan
             ):
                 yield event
 
-            for step_level in step_levels:
-                step_contexts_to_execute = []
-                for step in step_level:
-                    step_context = pipeline_context.for_step(step)
-
-                    if not intermediates_manager.all_inputs_covered(step_context, step):
-                        uncovered_inputs = intermediates_manager.uncovered_inputs(
-                            step_context, step
-                        )
-                        step_context.log.error(
-                            (
-                                'Not all inputs covered for {step}. Not executing.'
-                                'Output missing for inputs: {uncovered_inputs}'
-                            ).format(uncovered_inputs=uncovered_inputs, step=step.key)
-                        )
-                        continue
-
-                    step_contexts_to_execute.append(step_context)
+            worker_pool = (
+                StepWorkerPool(pipeline_context)
+                if pipeline_context.executor_config.worker_pool is not None
+                else None
+            )
+            try:
                 for step_event in bounded_parallel_executor(
-                    pipeline_context, step_contexts_to_execute, limit
+                    pipeline_context, ActiveExecution(execution_plan), limit, worker_pool
                 ):
                     yield step_event
+            finally:
+                if worker_pool is not None:
+                    worker_pool.shutdown()
 
         yield DagsterEvent.engine_event(
             pipeline_context,
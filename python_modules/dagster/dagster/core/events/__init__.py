@@ -73,6 +73,12 @@ PIPELINE_EVENTS = {
     DagsterEventType.PIPELINE_FAILURE,
 }
 
+PIPELINE_END_EVENTS = {
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.PIPELINE_INIT_FAILURE,
+}
+
 
 def _assert_type(method, expected_type, actual_type):
     check.invariant(
@@ -257,6 +263,10 @@ class DagsterEvent(
     def is_pipeline_event(self):
         return self.event_type in PIPELINE_EVENTS
 
+    @property
+    def is_pipeline_end_event(self):
+        return self.event_type in PIPELINE_END_EVENTS
+
     @property
     def step_output_data(self):
         _assert_type('step_output_data', DagsterEventType.STEP_OUTPUT, self.event_type)
@@ -562,6 +572,14 @@ class DagsterEvent(
                 key=object_store_operation_result.key,
                 dest_key=object_store_operation_result.dest_key,
             )
+        elif (
+            ObjectStoreOperationType(object_store_operation_result.op)
+            == ObjectStoreOperationType.RM_OBJECT
+        ):
+            message = (
+                'Removed intermediate object for output {value_name} from '
+                '{object_store_name}object store.'
+            ).format(value_name=value_name, object_store_name=object_store_name)
         else:
             message = ''
 
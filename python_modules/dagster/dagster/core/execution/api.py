@@ -1,7 +1,12 @@
+import hashlib
+import json
+import logging
 import time
+from contextlib import contextmanager
 
 from dagster import check
-from dagster.core.definitions import PipelineDefinition, SystemStorageData
+from dagster.core.definitions import CompositeSolidDefinition, PipelineDefinition, SystemStorageData
+from dagster.core.definitions.environment_schema import clear_environment_schema_cache
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
@@ -11,6 +16,7 @@ from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.system_config.objects import EnvironmentConfig
 from dagster.utils import ensure_gen, merge_dicts
+from dagster.utils.lru_cache import LRUCache
 
 from .config import EXECUTION_TIME_KEY, IRunConfig, RunConfig
 from .context_creation_pipeline import scoped_pipeline_context
@@ -50,14 +56,87 @@ def check_run_config_param(run_config, pipeline_def):
     )
 
 
+EXECUTION_PLAN_CACHE_SIZE = 128
+
+_EXECUTION_PLAN_CACHE = LRUCache(EXECUTION_PLAN_CACHE_SIZE)
+
+
+def clear_pipeline_caches():
+    '''Drop the cached environment schemas and execution plans, e.g. when the repository they were
+    built from is reloaded.'''
+    clear_environment_schema_cache()
+    _EXECUTION_PLAN_CACHE.clear()
+
+
+def _hash_environment_dict(environment_dict):
+    try:
+        serialized = json.dumps(environment_dict, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
+
+def _execution_plan_cache_key(pipeline, environment_dict, run_config):
+    # Config mappings are passed the run config, so the plans of pipelines which use them may
+    # differ from run to run
+    if any(
+        isinstance(solid_def, CompositeSolidDefinition) and solid_def.has_config_mapping
+        for solid_def in pipeline.all_solid_defs
+    ):
+        return None
+
+    environment_hash = _hash_environment_dict(environment_dict)
+    if environment_hash is None:
+        return None
+
+    return (
+        pipeline,
+        run_config.mode or pipeline.get_default_mode_name(),
+        environment_hash,
+        tuple(run_config.step_keys_to_execute) if run_config.step_keys_to_execute else None,
+        run_config.previous_run_id,
+    )
+
+
 def create_execution_plan(pipeline, environment_dict=None, run_config=None):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict', key_type=str)
     run_config = check.opt_inst_param(run_config, 'run_config', IRunConfig, RunConfig())
 
+    cache_key = _execution_plan_cache_key(pipeline, environment_dict, run_config)
+    if cache_key is not None:
+        execution_plan = _EXECUTION_PLAN_CACHE.get(cache_key)
+        if execution_plan is not None:
+            return execution_plan
+
     environment_config = EnvironmentConfig.build(pipeline, environment_dict, run_config)
+    execution_plan = ExecutionPlan.build(pipeline, environment_config, run_config)
+
+    if cache_key is not None:
+        _EXECUTION_PLAN_CACHE.put(cache_key, execution_plan)
+
+    return execution_plan
 
-    return ExecutionPlan.build(pipeline, environment_config, run_config)
+
+@contextmanager
+def flush_events_on_exit(instance):
+    '''Wait for the events handled in the background to be stored on leaving the block, however it
+    is left. If the block raised, an error storing the events is logged rather than raised, so that
+    it does not replace the original error.
+    '''
+    check.inst_param(instance, 'instance', DagsterInstance)
+
+    try:
+        yield
+    except:  # pylint: disable=bare-except
+        try:
+            instance.flush_events()
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('Error storing events after execution was interrupted')
+        raise
+
+    instance.flush_events()
 
 
 def _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run):
@@ -102,7 +181,7 @@ def execute_run_iterator(pipeline, pipeline_run, instance):
         pipeline, environment_dict=pipeline_run.environment_dict, run_config=pipeline_run
     )
 
-    with scoped_pipeline_context(
+    with flush_events_on_exit(instance), scoped_pipeline_context(
         pipeline, pipeline_run.environment_dict, pipeline_run, instance
     ) as pipeline_context:
         for event in _pipeline_execution_iterator(pipeline_context, execution_plan, pipeline_run):
@@ -182,7 +261,7 @@ def execute_pipeline(
 
     pipeline_run = _create_run(instance, pipeline, run_config, environment_dict)
 
-    with scoped_pipeline_context(
+    with flush_events_on_exit(instance), scoped_pipeline_context(
         pipeline, environment_dict, pipeline_run, instance, raise_on_error=raise_on_error
     ) as pipeline_context:
         event_list = list(
@@ -294,14 +373,15 @@ def execute_plan(execution_plan, instance, pipeline_run, environment_dict=None):
     check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
 
-    return list(
-        execute_plan_iterator(
-            execution_plan=execution_plan,
-            environment_dict=environment_dict,
-            pipeline_run=pipeline_run,
-            instance=instance,
+    with flush_events_on_exit(instance):
+        return list(
+            execute_plan_iterator(
+                execution_plan=execution_plan,
+                environment_dict=environment_dict,
+                pipeline_run=pipeline_run,
+                instance=instance,
+            )
         )
-    )
 
 
 def step_output_event_filter(pipe_iterator):
@@ -132,6 +132,10 @@ class RunConfig(
 
 
 class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    # Whether the engine should remove intermediates as soon as every step that consumes them
+    # within the execution plan has completed
+    release_intermediates = False
+
     @abstractmethod
     def check_requirements(self, instance, system_storage_def):
         '''Check whether this executor config is valid given the instance and system storage.
@@ -149,6 +153,11 @@ class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
 
 
 class InProcessExecutorConfig(ExecutorConfig):
+    def __init__(self, release_intermediates=False):
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
+
     def check_requirements(self, _instance, _system_storage_def):
         pass
 
@@ -158,8 +167,33 @@ class InProcessExecutorConfig(ExecutorConfig):
         return InProcessEngine
 
 
+class WorkerPoolConfig(namedtuple('_WorkerPoolConfig', 'max_steps_per_worker max_memory_mb')):
+    '''Configuration for executing steps in a pool of long-lived worker processes.
+
+    Args:
+        max_steps_per_worker (Optional[int]): Recycle a worker after it has executed this many
+            steps. Workers are not recycled based on step count if not set.
+        max_memory_mb (Optional[int]): Recycle a worker once its peak resident memory exceeds
+            this many megabytes. Workers are not recycled based on memory usage if not set.
+    '''
+
+    def __new__(cls, max_steps_per_worker=None, max_memory_mb=None):
+        return super(WorkerPoolConfig, cls).__new__(
+            cls,
+            max_steps_per_worker=check.opt_int_param(max_steps_per_worker, 'max_steps_per_worker'),
+            max_memory_mb=check.opt_int_param(max_memory_mb, 'max_memory_mb'),
+        )
+
+
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, max_concurrent=None):
+    def __init__(
+        self,
+        handle,
+        max_concurrent=None,
+        worker_pool=None,
+        release_intermediates=False,
+        forward_events=True,
+    ):
         from dagster import ExecutionTargetHandle
 
         # TODO: These gnomic process boundary/execution target handle exceptions should link to
@@ -176,6 +210,18 @@ class MultiprocessExecutorConfig(ExecutorConfig):
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
 
+        # When set, steps are executed by a pool of long-lived worker processes rather than in a
+        # fresh process per step
+        self.worker_pool = check.opt_inst_param(worker_pool, 'worker_pool', WorkerPoolConfig)
+
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
+
+        # When unset, child processes only send the parent the step failures in full and a
+        # summary of every other event, which is still written to the instance by the child
+        self.forward_events = check.bool_param(forward_events, 'forward_events')
+
     def check_requirements(self, instance, system_storage_def):
         check_persistent_storage_requirement(system_storage_def)
         check_non_ephemeral_instance(instance)
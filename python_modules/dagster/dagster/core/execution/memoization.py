@@ -37,7 +37,9 @@ def validate_retry_memoization(pipeline_context, execution_plan):
 def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     '''
     Uses the intermediates manager to copy intermediates from the previous run that apply to the
-    current execution plan, and yields the corresponding events
+    current execution plan, and yields the corresponding events. Intermediates which the
+    intermediates manager already has, e.g. because it references the previous run's
+    intermediates, are not copied.
     '''
     check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
     check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
@@ -45,33 +47,79 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     if not previous_run_id:
         return
 
-    previous_run_logs = pipeline_context.instance.all_logs(execution_plan.previous_run_id)
+    previous_run_logs = previous_run_output_logs(
+        pipeline_context.instance, execution_plan.previous_run_id
+    )
 
     output_handles_for_current_run = output_handles_from_execution_plan(execution_plan)
     output_handles_from_previous_run = output_handles_from_event_logs(previous_run_logs)
     output_handles_to_copy = output_handles_for_current_run.intersection(
         output_handles_from_previous_run
     )
-    output_handles_to_copy_by_step = defaultdict(list)
-    for handle in output_handles_to_copy:
-        output_handles_to_copy_by_step[handle.step_key].append(handle)
 
     intermediates_manager = pipeline_context.intermediates_manager
+    handles_list = list(output_handles_to_copy)
+    handles_to_copy = [
+        handle
+        for handle, exists in zip(
+            handles_list, intermediates_manager.has_intermediates(pipeline_context, handles_list)
+        )
+        if not exists
+    ]
+    if not handles_to_copy:
+        return
+
+    # Copy all of the intermediates at once, then yield the events of each step in plan order
+    operations_by_step = defaultdict(list)
+    for handle, operation in zip(
+        handles_to_copy,
+        intermediates_manager.copy_intermediates_from_prev_run(
+            pipeline_context, previous_run_id, handles_to_copy
+        ),
+    ):
+        operations_by_step[handle.step_key].append((handle, operation))
+
     for step in execution_plan.topological_steps():
-        step_context = pipeline_context.for_step(step)
-        for handle in output_handles_to_copy_by_step.get(step.key, []):
-            if intermediates_manager.has_intermediate(pipeline_context, handle):
-                continue
+        if step.key not in operations_by_step:
+            continue
 
-            operation = intermediates_manager.copy_intermediate_from_prev_run(
-                pipeline_context, previous_run_id, handle
-            )
+        step_context = pipeline_context.for_step(step)
+        for handle, operation in operations_by_step[step.key]:
             yield DagsterEvent.object_store_operation(
                 step_context,
                 ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
             )
 
 
+def release_intermediates(pipeline_context, execution_plan, step_output_handles):
+    '''
+    Uses the intermediates manager to release intermediates that no remaining step in the
+    current execution plan consumes, and yields the corresponding events. Intermediates which the
+    current run reads from a previous run are left in place.
+    '''
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+    intermediates_manager = pipeline_context.intermediates_manager
+    for handle, exists in zip(
+        step_output_handles,
+        intermediates_manager.has_run_intermediates(pipeline_context, step_output_handles),
+    ):
+        if not exists:
+            continue
+
+        operation = intermediates_manager.rm_intermediate(pipeline_context, handle)
+        if operation is None:
+            continue
+
+        step_context = pipeline_context.for_step(execution_plan.get_step_by_key(handle.step_key))
+        yield DagsterEvent.object_store_operation(
+            step_context,
+            ObjectStoreOperation.serializable(operation, value_name=handle.output_name),
+        )
+
+
 def is_step_failure_event(record):
     check.inst_param(record, 'record', EventRecord)
     if not record.is_dagster_event:
@@ -95,6 +143,31 @@ def is_intermediate_store_write_event(record):
     )
 
 
+def is_intermediate_store_rm_event(record):
+    check.inst_param(record, 'record', EventRecord)
+    if not record.is_dagster_event:
+        return False
+
+    return (
+        record.dagster_event.event_type_value == DagsterEventType.OBJECT_STORE_OPERATION.value
+        and record.dagster_event.event_specific_data.op == ObjectStoreOperationType.RM_OBJECT.value
+    )
+
+
+def previous_run_output_logs(instance, previous_run_id):
+    '''Fetch only the events of a previous run that output_handles_from_event_logs inspects.'''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(previous_run_id, 'previous_run_id')
+
+    return [
+        entry.event_record
+        for entry in instance.query_logs(
+            previous_run_id,
+            event_types=[DagsterEventType.STEP_FAILURE, DagsterEventType.OBJECT_STORE_OPERATION],
+        )
+    ]
+
+
 def output_handles_from_event_logs(event_logs):
     output_handles_from_previous_run = set()
     failed_step_keys = set(
@@ -102,6 +175,16 @@ def output_handles_from_event_logs(event_logs):
     )
 
     for record in event_logs:
+        if is_intermediate_store_rm_event(record):
+            # intermediates released during execution are no longer available
+            output_handles_from_previous_run.discard(
+                StepOutputHandle(
+                    record.dagster_event.step_key,
+                    record.dagster_event.event_specific_data.value_name,
+                )
+            )
+            continue
+
         if not is_intermediate_store_write_event(record):
             continue
 
@@ -135,7 +218,7 @@ def get_retry_steps_from_execution_plan(instance, execution_plan):
         return execution_plan.step_keys_to_execute
 
     previous_run = instance.get_run_by_id(execution_plan.previous_run_id)
-    previous_run_logs = instance.all_logs(execution_plan.previous_run_id)
+    previous_run_logs = previous_run_output_logs(instance, execution_plan.previous_run_id)
     failed_step_keys = set(
         record.dagster_event.step_key
         for record in previous_run_logs
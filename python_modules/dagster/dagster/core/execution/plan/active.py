@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+from dagster import check
+
+from .plan import ExecutionPlan
+
+
+class ActiveExecution(object):
+    '''State machine used to track progress through the execution of an ExecutionPlan.
+
+    Rather than walking the plan level by level, engines ask for the steps that are ready to
+    execute -- those whose upstream steps within the plan have all completed -- and report back
+    as each step finishes. A single slow step therefore only blocks the steps downstream of it.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan whose execution steps are being tracked.
+    '''
+
+    def __init__(self, execution_plan):
+        self._plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        deps = execution_plan.execution_deps()
+
+        # step_key -> number of upstream steps that have not yet completed
+        self._remaining_deps = {step_key: len(dep_keys) for step_key, dep_keys in deps.items()}
+
+        # step_key -> set of downstream step keys within the plan
+        self._dependents = defaultdict(set)
+        for step_key, dep_keys in deps.items():
+            for dep_key in dep_keys:
+                self._dependents[dep_key].add(step_key)
+
+        self._executable = set(
+            step_key for step_key, count in self._remaining_deps.items() if count == 0
+        )
+        self._in_flight = set()
+        self._completed = set()
+
+        # StepOutputHandle -> number of steps in the plan which have yet to consume it. Outputs
+        # which are not consumed within the plan are never tracked, so are never released.
+        self._remaining_consumers = defaultdict(int)
+        for step_key in deps:
+            for step_output_handle in self._source_handles(step_key):
+                self._remaining_consumers[step_output_handle] += 1
+
+        self._releasable = []
+
+    def _source_handles(self, step_key):
+        step = self._plan.get_step_by_key(step_key)
+        return set(
+            step_output_handle
+            for step_input in step.step_inputs
+            for step_output_handle in step_input.source_handles
+        )
+
+    @property
+    def execution_plan(self):
+        return self._plan
+
+    @property
+    def is_complete(self):
+        return len(self._completed) == len(self._remaining_deps)
+
+    @property
+    def in_flight_step_keys(self):
+        return set(self._in_flight)
+
+    def get_steps_to_execute(self, limit=None):
+        '''Return the steps that are ready to execute and mark them as in flight.
+
+        Args:
+            limit (Optional[int]): The maximum number of steps to return.
+
+        Returns:
+            List[ExecutionStep]: Ready steps, sorted by step key.
+        '''
+        check.opt_int_param(limit, 'limit')
+
+        step_keys = sorted(self._executable)
+        if limit is not None:
+            step_keys = step_keys[:limit]
+
+        for step_key in step_keys:
+            self._executable.remove(step_key)
+            self._in_flight.add(step_key)
+
+        return [self._plan.get_step_by_key(step_key) for step_key in step_keys]
+
+    def mark_complete(self, step_key):
+        '''Record that a step has finished, successfully or not, unblocking its dependents.
+
+        Whether the dependents have their inputs available is left to the engine to check when
+        they are launched.
+        '''
+        check.str_param(step_key, 'step_key')
+        check.invariant(
+            step_key in self._in_flight,
+            'Attempted to complete step {step_key} which is not in flight'.format(
+                step_key=step_key
+            ),
+        )
+
+        self._in_flight.remove(step_key)
+        self._completed.add(step_key)
+
+        for dependent_key in self._dependents[step_key]:
+            self._remaining_deps[dependent_key] -= 1
+            if self._remaining_deps[dependent_key] == 0:
+                self._executable.add(dependent_key)
+
+        for step_output_handle in sorted(self._source_handles(step_key)):
+            self._remaining_consumers[step_output_handle] -= 1
+            if self._remaining_consumers[step_output_handle] == 0:
+                self._releasable.append(step_output_handle)
+
+    def pop_releasable_output_handles(self):
+        '''Return the step outputs whose consumers within the plan have all completed, and which
+        are therefore no longer needed by this execution. Each handle is only returned once.
+
+        Returns:
+            List[StepOutputHandle]
+        '''
+        releasable = self._releasable
+        self._releasable = []
+        return releasable
@@ -21,14 +21,8 @@ class PipelineExecutionResult(object):
         self.event_list = check.list_param(event_list, 'step_event_list', of_type=DagsterEvent)
         self.reconstruct_context = check.callable_param(reconstruct_context, 'reconstruct_context')
 
-        self._events_by_step_key = self._construct_events_by_step_key(event_list)
-
-    def _construct_events_by_step_key(self, event_list):
-        events_by_step_key = defaultdict(list)
-        for event in event_list:
-            events_by_step_key[event.step_key].append(event)
-
-        return dict(events_by_step_key)
+        self._events_by_step_key = _construct_events_by_step_key(event_list)
+        self._index = _StepEventIndex(event_list, reconstruct_context)
 
     @property
     def success(self):
@@ -94,23 +88,7 @@ class PipelineExecutionResult(object):
                 'Can not find solid handle {handle} in pipeline.'.format(handle=handle)
             )
 
-        events_by_kind = defaultdict(list)
-        for event in self.event_list:
-            if event.is_step_event:
-                if event.solid_handle.is_or_descends_from(handle):
-                    events_by_kind[event.step_kind].append(event)
-
-        if solid.is_composite:
-            events = []
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle):
-                        events.append(event)
-            return CompositeSolidExecutionResult(
-                solid, handle, events, events_by_kind, self.reconstruct_context
-            )
-
-        return SolidExecutionResult(solid, events_by_kind, self.reconstruct_context)
+        return self._index.result_for_solid(solid, handle)
 
 
 class CompositeSolidExecutionResult(object):
@@ -119,7 +97,9 @@ class CompositeSolidExecutionResult(object):
     Users should not instantiate this class.
     '''
 
-    def __init__(self, solid, handle, event_list, step_events_by_kind, reconstruct_context):
+    def __init__(
+        self, solid, handle, event_list, step_events_by_kind, reconstruct_context, index=None
+    ):
         check.inst_param(solid, 'solid', Solid)
         check.invariant(
             solid.is_composite,
@@ -133,14 +113,12 @@ class CompositeSolidExecutionResult(object):
         )
         self.reconstruct_context = check.callable_param(reconstruct_context, 'reconstruct_context')
 
-        self._events_by_step_key = self._construct_events_by_step_key(event_list)
-
-    def _construct_events_by_step_key(self, event_list):
-        events_by_step_key = defaultdict(list)
-        for event in event_list:
-            events_by_step_key[event.step_key].append(event)
-
-        return dict(events_by_step_key)
+        self._events_by_step_key = _construct_events_by_step_key(event_list)
+        self._index = (
+            check.inst_param(index, 'index', _StepEventIndex)
+            if index
+            else _StepEventIndex(event_list, reconstruct_context)
+        )
 
     @property
     def success(self):
@@ -207,23 +185,7 @@ class CompositeSolidExecutionResult(object):
                 'Can not find solid handle {handle} in pipeline.'.format(handle=handle)
             )
 
-        events_by_kind = defaultdict(list)
-        for event in self.event_list:
-            if event.is_step_event:
-                if event.solid_handle.is_or_descends_from(handle):
-                    events_by_kind[event.step_kind].append(event)
-
-        if solid.is_composite:
-            events = []
-            for event in self.event_list:
-                if event.is_step_event:
-                    if event.solid_handle.is_or_descends_from(handle):
-                        events.append(event)
-            return CompositeSolidExecutionResult(
-                solid, handle, events, events_by_kind, self.reconstruct_context
-            )
-
-        return SolidExecutionResult(solid, events_by_kind, self.reconstruct_context)
+        return self._index.result_for_solid(solid, handle)
 
     def output_values_for_solid(self, name):
         return self.result_for_solid(name).output_values
@@ -289,6 +251,16 @@ class SolidExecutionResult(object):
         )
         self.reconstruct_context = check.callable_param(reconstruct_context, 'reconstruct_context')
 
+        self._compute_events_by_type = defaultdict(list)
+        self._output_events = {}
+        for step_event in self.compute_step_events:
+            self._compute_events_by_type[step_event.event_type].append(step_event)
+            if step_event.is_successful_output:
+                self._output_events.setdefault(step_event.step_output_data.output_name, step_event)
+
+        # output name -> output value, loaded from the intermediates manager on first access
+        self._output_values = {}
+
     @property
     def compute_input_event_dict(self):
         '''Dict[str, DagsterEvent]: All events of type ``STEP_INPUT``, keyed by input name.'''
@@ -346,9 +318,7 @@ class SolidExecutionResult(object):
         return self._compute_steps_of_type(DagsterEventType.STEP_EXPECTATION_RESULT)
 
     def _compute_steps_of_type(self, dagster_event_type):
-        return list(
-            filter(lambda se: se.event_type == dagster_event_type, self.compute_step_events)
-        )
+        return list(self._compute_events_by_type.get(dagster_event_type, []))
 
     @property
     def expectation_results_during_compute(self):
@@ -360,9 +330,9 @@ class SolidExecutionResult(object):
 
     def get_step_success_event(self):
         '''DagsterEvent: The ``STEP_SUCCESS`` event, throws if not present.'''
-        for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_SUCCESS:
-                return step_event
+        step_success_events = self._compute_events_by_type.get(DagsterEventType.STEP_SUCCESS)
+        if step_success_events:
+            return step_success_events[0]
 
         check.failed('Step success not found for solid {}'.format(self.solid.name))
 
@@ -381,23 +351,16 @@ class SolidExecutionResult(object):
     @property
     def success(self):
         '''bool: Whether solid execution was successful.'''
-        any_success = False
-        for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_FAILURE:
-                return False
-            if step_event.event_type == DagsterEventType.STEP_SUCCESS:
-                any_success = True
-
-        return any_success
+        return (
+            DagsterEventType.STEP_FAILURE not in self._compute_events_by_type
+            and DagsterEventType.STEP_SUCCESS in self._compute_events_by_type
+        )
 
     @property
     def skipped(self):
         '''bool: Whether solid execution was skipped.'''
-        return all(
-            [
-                step_event.event_type == DagsterEventType.STEP_SKIPPED
-                for step_event in self.compute_step_events
-            ]
+        return len(self._compute_events_by_type.get(DagsterEventType.STEP_SKIPPED, [])) == len(
+            self.compute_step_events
         )
 
     @property
@@ -408,27 +371,22 @@ class SolidExecutionResult(object):
 
         Returns ``None`` if execution did not succeed.
 
-        Note that accessing this property will reconstruct the pipeline context (including, e.g.,
-        resources) to retrieve materialized output values.
+        Note that the first access of this property will reconstruct the pipeline context
+        (including, e.g., resources) to retrieve materialized output values.
         '''
         if self.success and self.compute_step_events:
-            with self.reconstruct_context() as context:
-                values = {
-                    compute_step_event.step_output_data.output_name: self._get_value(
-                        context, compute_step_event.step_output_data
-                    )
-                    for compute_step_event in self.compute_step_events
-                    if compute_step_event.is_successful_output
-                }
-            return values
+            self._load_output_values(self._output_events.keys())
+            return {
+                output_name: self._output_values[output_name] for output_name in self._output_events
+            }
         else:
             return None
 
     def output_value(self, output_name=DEFAULT_OUTPUT):
         '''Get a computed output value.
 
-        Note that calling this method will reconstruct the pipeline context (including, e.g.,
-        resources) to retrieve materialized output values.
+        Note that the first call of this method for an output will reconstruct the pipeline context
+        (including, e.g., resources) to retrieve materialized output values.
 
         Args:
             output_name(str): The output name for which to retrieve the value. (default: 'result')
@@ -449,24 +407,32 @@ class SolidExecutionResult(object):
             )
 
         if self.success:
-            for compute_step_event in self.compute_step_events:
-                if (
-                    compute_step_event.is_successful_output
-                    and compute_step_event.step_output_data.output_name == output_name
-                ):
-                    with self.reconstruct_context() as context:
-                        value = self._get_value(context, compute_step_event.step_output_data)
-                    return value
+            if output_name not in self._output_events:
+                raise DagsterInvariantViolationError(
+                    (
+                        'Did not find result {output_name} in solid {self.solid.name} '
+                        'execution result'
+                    ).format(output_name=output_name, self=self)
+                )
 
-            raise DagsterInvariantViolationError(
-                (
-                    'Did not find result {output_name} in solid {self.solid.name} '
-                    'execution result'
-                ).format(output_name=output_name, self=self)
-            )
+            self._load_output_values([output_name])
+            return self._output_values[output_name]
         else:
             return None
 
+    def _load_output_values(self, output_names):
+        output_names = [
+            output_name for output_name in output_names if output_name not in self._output_values
+        ]
+        if not output_names:
+            return
+
+        with self.reconstruct_context() as context:
+            for output_name in output_names:
+                self._output_values[output_name] = self._get_value(
+                    context, self._output_events[output_name].step_output_data
+                )
+
     def _get_value(self, context, step_output_data):
         value = context.intermediates_manager.get_intermediate(
             context=context,
@@ -482,6 +448,59 @@ class SolidExecutionResult(object):
     def failure_data(self):
         '''Union[None, StepFailureData]: Any data corresponding to this step's failure, if it
         failed.'''
-        for step_event in self.compute_step_events:
-            if step_event.event_type == DagsterEventType.STEP_FAILURE:
-                return step_event.step_failure_data
+        step_failure_events = self._compute_events_by_type.get(DagsterEventType.STEP_FAILURE)
+        if step_failure_events:
+            return step_failure_events[0].step_failure_data
+
+
+def _construct_events_by_step_key(event_list):
+    events_by_step_key = defaultdict(list)
+    for event in event_list:
+        events_by_step_key[event.step_key].append(event)
+
+    return dict(events_by_step_key)
+
+
+class _StepEventIndex(object):
+    '''The step events of an execution indexed by the handle of each solid they belong to, so
+    that the results for solids can be built without scanning the full event list.
+
+    Holds the results already built, so that each solid result (and the output values it has
+    loaded) is shared between all the accessors which return it.
+    '''
+
+    def __init__(self, event_list, reconstruct_context):
+        self.reconstruct_context = reconstruct_context
+
+        # handle string -> step events of the solid and of any solids it contains
+        self._events_by_handle = defaultdict(list)
+        for event in event_list:
+            if not event.is_step_event:
+                continue
+
+            solid_handle = event.solid_handle
+            while solid_handle:
+                self._events_by_handle[solid_handle.to_string()].append(event)
+                solid_handle = solid_handle.parent
+
+        # handle string -> Union[CompositeSolidExecutionResult, SolidExecutionResult]
+        self._results = {}
+
+    def result_for_solid(self, solid, handle):
+        if handle in self._results:
+            return self._results[handle]
+
+        events = self._events_by_handle.get(handle, [])
+        events_by_kind = defaultdict(list)
+        for event in events:
+            events_by_kind[event.step_kind].append(event)
+
+        if solid.is_composite:
+            result = CompositeSolidExecutionResult(
+                solid, handle, list(events), events_by_kind, self.reconstruct_context, index=self
+            )
+        else:
+            result = SolidExecutionResult(solid, events_by_kind, self.reconstruct_context)
+
+        self._results[handle] = result
+        return result
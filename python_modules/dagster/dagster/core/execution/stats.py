@@ -36,3 +36,29 @@ def build_stats_from_events(run_id, records):
     return PipelineRunStatsSnapshot(
         run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
     )
+
+
+def merge_stats(stats, update):
+    '''Combine the stats of a run with stats built from events stored after those it summarizes,
+    so that stats can be maintained incrementally as events are stored.
+
+    Args:
+        stats (PipelineRunStatsSnapshot): The stats built from the earlier events.
+        update (PipelineRunStatsSnapshot): The stats built from the later events.
+
+    Returns:
+        PipelineRunStatsSnapshot
+    '''
+    check.inst_param(stats, 'stats', PipelineRunStatsSnapshot)
+    check.inst_param(update, 'update', PipelineRunStatsSnapshot)
+    check.invariant(stats.run_id == update.run_id, 'Cannot merge the stats of different runs')
+
+    return PipelineRunStatsSnapshot(
+        stats.run_id,
+        stats.steps_succeeded + update.steps_succeeded,
+        stats.steps_failed + update.steps_failed,
+        stats.materializations + update.materializations,
+        stats.expectations + update.expectations,
+        update.start_time if update.start_time is not None else stats.start_time,
+        update.end_time if update.end_time is not None else stats.end_time,
+    )
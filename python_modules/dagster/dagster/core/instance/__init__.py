@@ -84,6 +84,8 @@ class DagsterInstance:
         compute_log_manager (ComputeLogManager): Centralized dispatch for logging from user code.
         ref (Optional[InstanceRef]): Used by internal machinery to pass instances across process
             boundaries.
+        event_writer_config (Optional[dict]): If set, events are handled on a background thread,
+            in batches, by a BackgroundEventWriter configured with these keyword arguments.
     '''
 
     _PROCESS_TEMPDIR = None
@@ -97,6 +99,7 @@ class DagsterInstance:
         compute_log_manager,
         run_launcher=None,
         ref=None,
+        event_writer_config=None,
     ):
         from dagster.core.storage.compute_log_manager import ComputeLogManager
         from dagster.core.storage.event_log import EventLogStorage
@@ -104,6 +107,8 @@ class DagsterInstance:
         from dagster.core.storage.runs import RunStorage
         from dagster.core.launcher import RunLauncher
 
+        from .event_writer import BackgroundEventWriter
+
         self._instance_type = check.inst_param(instance_type, 'instance_type', InstanceType)
         self._local_artifact_storage = check.inst_param(
             local_artifact_storage, 'local_artifact_storage', LocalArtifactStorage
@@ -118,6 +123,15 @@ class DagsterInstance:
 
         self._subscribers = defaultdict(list)
 
+        event_writer_config = check.opt_dict_param(
+            event_writer_config, 'event_writer_config', key_type=str
+        )
+        self._event_writer = (
+            BackgroundEventWriter(self._handle_event_batch, **event_writer_config)
+            if event_writer_config
+            else None
+        )
+
     @staticmethod
     def ephemeral(tempdir=None):
         from dagster.core.storage.event_log import InMemoryEventLogStorage
@@ -176,6 +190,7 @@ class DagsterInstance:
             compute_log_manager=instance_ref.compute_log_manager,
             run_launcher=instance_ref.run_launcher,
             ref=instance_ref,
+            event_writer_config=instance_ref.event_writer_config,
         )
 
     @property
@@ -241,6 +256,9 @@ class DagsterInstance:
     def get_run_stats(self, run_id):
         return self._event_storage.get_stats_for_run(run_id)
 
+    def get_runs_stats(self, run_ids):
+        return self._event_storage.get_stats_for_runs(run_ids)
+
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
@@ -288,6 +306,11 @@ class DagsterInstance:
     def get_runs_with_status(self, run_status, cursor=None, limit=None):
         return self._run_storage.get_runs_with_status(run_status, cursor, limit)
 
+    def get_run_summaries(
+        self, pipeline_name=None, status=None, tags=None, cursor=None, limit=None
+    ):
+        return self._run_storage.get_run_summaries(pipeline_name, status, tags, cursor, limit)
+
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
@@ -304,6 +327,33 @@ class DagsterInstance:
     def all_logs(self, run_id):
         return self._event_storage.get_logs_for_run(run_id)
 
+    def query_logs(
+        self,
+        run_id,
+        event_types=None,
+        step_keys=None,
+        min_level=None,
+        cursor=-1,
+        limit=None,
+        before_cursor=None,
+        newest_first=False,
+    ):
+        return self._event_storage.query_logs_for_run(
+            run_id,
+            event_types=event_types,
+            step_keys=step_keys,
+            min_level=min_level,
+            cursor=cursor,
+            limit=limit,
+            before_cursor=before_cursor,
+            newest_first=newest_first,
+        )
+
+    def get_logs_count(self, run_id, event_types=None, step_keys=None, min_level=None):
+        return self._event_storage.get_logs_count_for_run(
+            run_id, event_types=event_types, step_keys=step_keys, min_level=min_level
+        )
+
     def can_watch_events(self):
         from dagster.core.storage.event_log import WatchableEventLogStorage
 
@@ -327,6 +377,14 @@ class DagsterInstance:
         return logger
 
     def handle_new_event(self, event):
+        if self._event_writer is not None:
+            self._event_writer.put(event)
+
+            # Runs are complete once their events, and so their status, are stored
+            if event.is_dagster_event and event.dagster_event.is_pipeline_end_event:
+                self._event_writer.flush()
+            return
+
         run_id = event.run_id
 
         self._event_storage.store_event(event)
@@ -337,6 +395,24 @@ class DagsterInstance:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def _handle_event_batch(self, events):
+        # Called on the event writer's thread
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.dagster_event)
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
+    def flush_events(self):
+        '''Wait until every event handled so far has been stored, including events handled in the
+        background and events buffered by the event log storage.'''
+        if self._event_writer is not None:
+            self._event_writer.flush()
+        self._event_storage.flush()
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
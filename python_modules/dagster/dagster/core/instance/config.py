@@ -3,7 +3,8 @@ import os
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.errors import DagsterInvalidConfigError
-from dagster.core.types import Field, PermissiveDict, String
+from dagster.core.types import Field, Int, PermissiveDict, String
+from dagster.core.types.config import Enum, EnumValue
 from dagster.core.types.evaluator import evaluate_config
 from dagster.utils import merge_dicts
 from dagster.utils.yaml_utils import load_yaml_from_globs
@@ -33,6 +34,41 @@ def config_field_for_configurable_class(name, **field_opts):
     )
 
 
+def define_event_writer_config_cls():
+    from .event_writer import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_QUEUE_SIZE, EventWriterFullPolicy
+
+    return SystemNamedDict(
+        'DagsterInstanceEventWriterConfig',
+        {
+            'max_queue_size': Field(
+                Int,
+                is_optional=True,
+                default_value=DEFAULT_MAX_QUEUE_SIZE,
+                description='The maximum number of events which may wait to be written.',
+            ),
+            'max_batch_size': Field(
+                Int,
+                is_optional=True,
+                default_value=DEFAULT_MAX_BATCH_SIZE,
+                description='The maximum number of events written at once.',
+            ),
+            'when_full': Field(
+                Enum(
+                    'DagsterInstanceEventWriterFullPolicy',
+                    [EnumValue(policy.value) for policy in EventWriterFullPolicy],
+                ),
+                is_optional=True,
+                default_value=EventWriterFullPolicy.BLOCK.value,
+                description='What to do with events logged while the queue is full: "block" '
+                'until there is room, or "drop_logs" to drop log messages which are not dagster '
+                'events.',
+            ),
+        },
+        description='Handle events on a background thread, in batches, rather than in the '
+        'logging call which produced them.',
+    )
+
+
 def define_dagster_config_cls():
     return SystemNamedDict(
         'DagsterInstanceConfig',
@@ -52,5 +88,6 @@ def define_dagster_config_cls():
             'run_launcher': config_field_for_configurable_class(
                 'DagsterInstanceRunLauncherConfig', is_optional=True
             ),
+            'event_writer': Field(define_event_writer_config_cls(), is_optional=True),
         },
     )
@@ -0,0 +1,171 @@
+'''Handles the events of a DagsterInstance on a background thread, in batches.
+
+Handling an event stores it, updates the status of its run and calls the run's subscribers. When
+events are handled synchronously this happens inside the logging call which produced the event, so
+slow storage stalls the pipeline's own computation. A BackgroundEventWriter instead queues each
+event and a single writer thread handles them in batches, in the order in which they were queued.
+'''
+
+import atexit
+import logging
+import sys
+import threading
+import weakref
+from enum import Enum
+
+import six
+from six.moves import queue
+
+from dagster import check
+from dagster.core.events.log import EventRecord
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# The number of seconds the writer thread waits for an event before exiting. It is restarted when
+# the next event is queued.
+DEFAULT_IDLE_TIMEOUT = 5.0
+
+
+class EventWriterFullPolicy(Enum):
+    '''What a BackgroundEventWriter does with an event when its queue is full.'''
+
+    # Wait for the writer thread to make room in the queue.
+    BLOCK = 'block'
+    # Drop log messages which are not dagster events, and wait as for BLOCK for dagster events,
+    # which record the progress of the run.
+    DROP_LOGS = 'drop_logs'
+
+
+# Every writer which may have events queued, so that they can be flushed at interpreter exit
+_writers = weakref.WeakSet()
+
+
+def _flush_writers():
+    for writer in list(_writers):
+        try:
+            writer.flush()
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('Error flushing events at exit')
+
+
+atexit.register(_flush_writers)
+
+
+class BackgroundEventWriter(object):
+    '''Queues events and hands them to write_events in batches, in order, on a writer thread.
+
+    Since a single thread writes every batch, the events of each run are written in the order in
+    which they were put. Errors raised by write_events are logged, and the first of them is raised
+    by the next call to flush.
+
+    Args:
+        write_events (Callable[[List[EventRecord]], None]): Handles a batch of events.
+        max_queue_size (Optional[int]): The maximum number of events which may wait to be written.
+            (default: 10000)
+        max_batch_size (Optional[int]): The maximum number of events written at once.
+            (default: 100)
+        when_full (Optional[Union[EventWriterFullPolicy, str]]): What to do with events put while
+            the queue is full. (default: EventWriterFullPolicy.BLOCK)
+        idle_timeout (Optional[float]): The number of seconds the writer thread waits for events
+            before exiting. (default: 5.0)
+    '''
+
+    def __init__(
+        self,
+        write_events,
+        max_queue_size=DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+        when_full=EventWriterFullPolicy.BLOCK,
+        idle_timeout=DEFAULT_IDLE_TIMEOUT,
+    ):
+        self._write_events = check.callable_param(write_events, 'write_events')
+        check.int_param(max_queue_size, 'max_queue_size')
+        check.param_invariant(max_queue_size > 0, 'max_queue_size')
+        self._max_batch_size = check.int_param(max_batch_size, 'max_batch_size')
+        check.param_invariant(max_batch_size > 0, 'max_batch_size')
+        self._when_full = EventWriterFullPolicy(when_full)
+        self._idle_timeout = check.float_param(idle_timeout, 'idle_timeout')
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        # Guards starting and exiting the writer thread. Events are only put while it is held, so
+        # that the thread cannot exit between an event being put and being written.
+        self._lock = threading.Lock()
+        self._thread = None
+        self._exc_info = None
+        self._num_dropped_events = 0
+
+        _writers.add(self)
+
+    @property
+    def num_dropped_events(self):
+        '''int: The number of log messages dropped because the queue was full.'''
+        return self._num_dropped_events
+
+    def put(self, event):
+        check.inst_param(event, 'event', EventRecord)
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='dagster-event-writer')
+                self._thread.daemon = True
+                self._thread.start()
+
+            if self._when_full == EventWriterFullPolicy.DROP_LOGS and not event.is_dagster_event:
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    if not self._num_dropped_events:
+                        logging.warning(
+                            'The event queue is full, dropping log messages until it has room'
+                        )
+                    self._num_dropped_events += 1
+            else:
+                self._queue.put(event)
+
+    def flush(self):
+        '''Wait until every event put so far has been written.
+
+        Raises the first error raised while writing them, if any.
+        '''
+        self._queue.join()
+
+        exc_info, self._exc_info = self._exc_info, None
+        if exc_info is not None:
+            six.reraise(*exc_info)
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self._idle_timeout)]
+        except queue.Empty:
+            return None
+
+        while len(batch) < self._max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            try:
+                self._write_events(batch)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception(
+                    'Error writing a batch of {num_events} events'.format(num_events=len(batch))
+                )
+                if self._exc_info is None:
+                    self._exc_info = sys.exc_info()
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
@@ -36,7 +36,7 @@ class InstanceRef(
     namedtuple(
         '_InstanceRef',
         'local_artifact_storage_data run_storage_data event_storage_data compute_logs_data '
-        'run_launcher_data',
+        'run_launcher_data event_writer_config',
     )
 ):
     def __new__(
@@ -46,6 +46,7 @@ class InstanceRef(
         event_storage_data,
         compute_logs_data,
         run_launcher_data,
+        event_writer_config=None,
     ):
         return super(self, InstanceRef).__new__(
             self,
@@ -64,6 +65,9 @@ class InstanceRef(
             run_launcher_data=check.opt_inst_param(
                 run_launcher_data, 'run_launcher_data', ConfigurableClassData
             ),
+            event_writer_config=check.opt_inst_param(
+                event_writer_config, 'event_writer_config', dict
+            ),
         )
 
     @staticmethod
@@ -123,6 +127,7 @@ class InstanceRef(
             event_storage_data=event_storage_data,
             compute_logs_data=compute_logs_data,
             run_launcher_data=run_launcher_data,
+            event_writer_config=config_value.get('event_writer'),
         )
 
     @property
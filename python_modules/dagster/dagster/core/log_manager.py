@@ -138,7 +138,7 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
             loggers=check.list_param(loggers, 'loggers', of_type=logging.Logger),
         )
 
-    def _prepare_message(self, orig_message, message_props):
+    def _check_message(self, orig_message, message_props):
         check.str_param(orig_message, 'orig_message')
         check.dict_param(message_props, 'message_props')
 
@@ -156,6 +156,9 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
         check.invariant('log_message_id' not in message_props, 'log_message_id reserved value')
         check.invariant('log_timestamp' not in message_props, 'log_timestamp reserved value')
 
+    def _prepare_message(self, orig_message, message_props):
+        self._check_message(orig_message, message_props)
+
         log_message_id = str(uuid.uuid4())
 
         log_timestamp = datetime.datetime.utcnow().isoformat()
@@ -200,9 +203,17 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
 
         level = coerce_valid_log_level(level)
 
+        # The message is only built if some logger would handle it, and then only once. During a
+        # run this only skips levels below DEBUG, since the instance's event listener logger
+        # stores messages of every level in the event log, and it stores them formatted.
+        loggers = [logger_ for logger_ in self.loggers if logger_.isEnabledFor(level)]
+        if not loggers:
+            self._check_message(orig_message, message_props)
+            return
+
         message, extra = self._prepare_message(orig_message, message_props)
 
-        for logger_ in self.loggers:
+        for logger_ in loggers:
             logger_.log(level, message, extra=extra)
 
     def debug(self, msg, **kwargs):
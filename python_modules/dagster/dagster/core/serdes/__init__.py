@@ -23,9 +23,22 @@ import yaml
 
 from dagster import check, seven
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _WHITELISTED_TUPLE_MAP = {}
 _WHITELISTED_ENUM_MAP = {}
 
+# Values of these exact types are returned as-is by pack and unpack, so are checked for first
+_SCALAR_TYPES = frozenset([type(None), bool, float, six.text_type, six.binary_type]) | frozenset(
+    six.integer_types
+)
+
+# klass -> the names of the arguments accepted by its constructor, which is expensive to inspect
+_CONSTRUCTOR_ARGS_CACHE = {}
+
 
 def _whitelist_for_serdes(enum_map, tuple_map):
     def __whitelist_for_serdes(klass):
@@ -33,6 +46,7 @@ def _whitelist_for_serdes(enum_map, tuple_map):
             enum_map[klass.__name__] = klass
         elif issubclass(klass, tuple):
             tuple_map[klass.__name__] = klass
+            _get_constructor_args(klass)
         else:
             check.failed('Can not whitelist class {klass} for serdes'.format(klass=klass))
         return klass
@@ -46,11 +60,20 @@ def whitelist_for_serdes(klass):
     )
 
 
+def _get_constructor_args(klass):
+    if klass not in _CONSTRUCTOR_ARGS_CACHE:
+        args = seven.get_args(klass)
+        _CONSTRUCTOR_ARGS_CACHE[klass] = frozenset(args) if isinstance(args, list) else args
+    return _CONSTRUCTOR_ARGS_CACHE[klass]
+
+
 def pack_value(val):
     return _pack_value(val, enum_map=_WHITELISTED_ENUM_MAP, tuple_map=_WHITELISTED_TUPLE_MAP)
 
 
 def _pack_value(val, enum_map, tuple_map):
+    if type(val) in _SCALAR_TYPES:
+        return val
     if isinstance(val, list):
         return [_pack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, tuple):
@@ -60,7 +83,7 @@ def _pack_value(val, enum_map, tuple_map):
             'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name),
         )
         base_dict = {
-            key: _pack_value(value, enum_map, tuple_map) for key, value in val._asdict().items()
+            key: _pack_value(value, enum_map, tuple_map) for key, value in zip(val._fields, val)
         }
         base_dict['__class__'] = klass_name
         return base_dict
@@ -92,25 +115,25 @@ def unpack_value(val):
 
 
 def _unpack_value(val, enum_map, tuple_map):
+    if type(val) in _SCALAR_TYPES:
+        return val
     if isinstance(val, list):
         return [_unpack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, dict) and val.get('__class__'):
         klass_name = val.pop('__class__')
         klass = tuple_map[klass_name]
-        unpacked_val = {
-            key: _unpack_value(value, enum_map, tuple_map) for key, value in val.items()
-        }
 
         # Naively implements backwards compatibility by filtering arguments that aren't present in
         # the constructor. If a property is present in the serialized object, but doesn't exist in
         # the version of the class loaded into memory, that property will be completely ignored.
-        args_for_class = seven.get_args(klass)
-        filtered_val = (
-            {k: v for k, v in unpacked_val.items() if k in args_for_class}
-            if args_for_class
-            else unpacked_val
+        args_for_class = _get_constructor_args(klass)
+        return klass(
+            **{
+                key: _unpack_value(value, enum_map, tuple_map)
+                for key, value in val.items()
+                if not args_for_class or key in args_for_class
+            }
         )
-        return klass(**filtered_val)
     if isinstance(val, dict) and val.get('__enum__'):
         name, member = val['__enum__'].split('.')
         return getattr(enum_map[name], member)
@@ -120,6 +143,22 @@ def _unpack_value(val, enum_map, tuple_map):
     return val
 
 
+def _loads(json_str):
+    '''Parse json_str with orjson when it is installed. orjson only accepts strict JSON, so
+    documents written with NaN or infinite floats, or raw control characters in strings, are left to
+    the standard library.
+
+    Serialization always uses the standard library, since orjson writes NaN and infinite floats as
+    null, which would not round-trip.
+    '''
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return seven.json.loads(json_str)
+
+
 def deserialize_json_to_dagster_namedtuple(json_str):
     return _deserialize_json_to_dagster_namedtuple(
         check.str_param(json_str, 'json_str'),
@@ -129,7 +168,7 @@ def deserialize_json_to_dagster_namedtuple(json_str):
 
 
 def _deserialize_json_to_dagster_namedtuple(json_str, enum_map, tuple_map):
-    return _unpack_value(seven.json.loads(json_str), enum_map=enum_map, tuple_map=tuple_map)
+    return _unpack_value(_loads(json_str), enum_map=enum_map, tuple_map=tuple_map)
 
 
 @whitelist_for_serdes
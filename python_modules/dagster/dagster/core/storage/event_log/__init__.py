@@ -1,4 +1,5 @@
 from .event_log import (
+    EventLogEntry,
     EventLogInvalidForRun,
     EventLogStorage,
     InMemoryEventLogStorage,
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 
 import gevent.lock
 import pyrsistent
@@ -7,8 +7,9 @@ import six
 
 from dagster import check
 from dagster.core.errors import DagsterError
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
-from dagster.core.execution.stats import build_stats_from_events
+from dagster.core.execution.stats import build_stats_from_events, merge_stats
 
 
 class EventLogInvalidForRun(DagsterError):
@@ -21,6 +22,63 @@ class EventLogSequence(pyrsistent.CheckedPVector):
     __type__ = EventRecord
 
 
+# The event types needed to build a PipelineRunStatsSnapshot
+STATS_EVENT_TYPES = [
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+]
+
+
+class EventLogEntry(namedtuple('_EventLogEntry', 'cursor event_record')):
+    '''An event record returned by EventLogStorage.query_logs_for_run, along with the cursor at which
+    it is stored. Passing the cursor back to query_logs_for_run returns only the entries stored
+    after this one.
+
+    Args:
+        cursor (int): The storage-specific position of the event record.
+        event_record (EventRecord): The event record.
+    '''
+
+    def __new__(cls, cursor, event_record):
+        return super(EventLogEntry, cls).__new__(
+            cls,
+            check.int_param(cursor, 'cursor'),
+            check.inst_param(event_record, 'event_record', EventRecord),
+        )
+
+
+def get_event_record_step_key(event_record):
+    '''The step key under which an event record is indexed, if any.'''
+    check.inst_param(event_record, 'event_record', EventRecord)
+
+    if event_record.is_dagster_event and event_record.dagster_event.step_key:
+        return event_record.dagster_event.step_key
+    return event_record.step_key
+
+
+def event_record_matches_query(event_record, event_types=None, step_keys=None, min_level=None):
+    check.inst_param(event_record, 'event_record', EventRecord)
+
+    if event_types is not None and (
+        not event_record.is_dagster_event
+        or event_record.dagster_event.event_type not in event_types
+    ):
+        return False
+
+    if step_keys is not None and get_event_record_step_key(event_record) not in step_keys:
+        return False
+
+    if min_level is not None and event_record.level < min_level:
+        return False
+
+    return True
+
+
 class EventLogStorage(six.with_metaclass(ABCMeta)):
     '''Abstract base class for storing structured event logs from pipeline runs.'''
 
@@ -34,10 +92,118 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
         '''
 
+    def query_logs_for_run(
+        self,
+        run_id,
+        event_types=None,
+        step_keys=None,
+        min_level=None,
+        cursor=-1,
+        limit=None,
+        before_cursor=None,
+        newest_first=False,
+    ):
+        '''Get the logs corresponding to a run which match the given filters, in the order in
+        which they were stored.
+
+        Storages which index their events should override this to filter and paginate in the
+        underlying store. This default implementation filters the result of get_logs_for_run.
+
+        Cursors are the zero-indexed offsets of entries within the run's log, counting every
+        event of the run whatever the filters, as for get_logs_for_run and watch. The cursor of
+        an entry returned by this method may therefore be passed to either of them.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            event_types (Optional[List[DagsterEventType]]): Only return dagster events of these
+                types.
+            step_keys (Optional[List[str]]): Only return events for these steps.
+            min_level (Optional[int]): Only return events logged at this level or above.
+            cursor (Optional[int]): Only return entries stored after the entry with this cursor.
+                (default: -1, i.e. from the start of the run)
+            limit (Optional[int]): The maximum number of entries to return.
+            before_cursor (Optional[int]): Only return entries stored before the entry with this
+                cursor.
+            newest_first (Optional[bool]): Return the entries in the reverse of the order in which
+                they were stored, so that limit keeps the most recent of them. (default: False)
+
+        Returns:
+            List[EventLogEntry]
+        '''
+        check.str_param(run_id, 'run_id')
+        check.opt_list_param(event_types, 'event_types', of_type=DagsterEventType)
+        check.opt_list_param(step_keys, 'step_keys', of_type=str)
+        check.opt_int_param(min_level, 'min_level')
+        check.int_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
+        check.opt_int_param(before_cursor, 'before_cursor')
+        check.bool_param(newest_first, 'newest_first')
+
+        entries = []
+        for index, event_record in enumerate(self.get_logs_for_run(run_id, cursor), cursor + 1):
+            if before_cursor is not None and index >= before_cursor:
+                break
+
+            if not newest_first and limit is not None and len(entries) >= limit:
+                break
+
+            if event_record_matches_query(event_record, event_types, step_keys, min_level):
+                entries.append(EventLogEntry(index, event_record))
+
+        if newest_first:
+            entries = entries[::-1][:limit]
+
+        return entries
+
+    def get_logs_count_for_run(self, run_id, event_types=None, step_keys=None, min_level=None):
+        '''Count the logs corresponding to a run which match the given filters.
+
+        Storages which index their events should override this to count them in the underlying
+        store. This default implementation counts the result of query_logs_for_run.
+
+        Args:
+            run_id (str): The id of the run for which to count logs.
+            event_types (Optional[List[DagsterEventType]]): Only count dagster events of these
+                types.
+            step_keys (Optional[List[str]]): Only count events for these steps.
+            min_level (Optional[int]): Only count events logged at this level or above.
+
+        Returns:
+            int
+        '''
+        return len(
+            self.query_logs_for_run(
+                run_id, event_types=event_types, step_keys=step_keys, min_level=min_level
+            )
+        )
+
     def get_stats_for_run(self, run_id):
         '''Get a summary of events that have ocurred in a run.'''
 
-        return build_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_stats_from_events(
+            run_id,
+            [
+                entry.event_record
+                for entry in self.query_logs_for_run(run_id, event_types=STATS_EVENT_TYPES)
+            ],
+        )
+
+    def get_stats_for_runs(self, run_ids):
+        '''Get summaries of the events that have ocurred in many runs at once.
+
+        Storages which maintain stats as events are stored should override this to read the stats
+        of every run in a single query. This default implementation calls get_stats_for_run once
+        per run.
+
+        Args:
+            run_ids (List[str]): The ids of the runs for which to fetch stats.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The stats of each run, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
 
     @abstractmethod
     def store_event(self, event):
@@ -48,6 +214,29 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
             event (EventRecord): The event to store.
         '''
 
+    def store_events(self, events):
+        '''Store many events at once, in order.
+
+        Storages which can write many events more cheaply than one at a time, e.g. in a single
+        transaction, should override this. This default implementation calls store_event once per
+        event.
+
+        Args:
+            events (List[EventRecord]): The events to store, possibly from many runs.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        for event in events:
+            self.store_event(event)
+
+    def flush(self):
+        '''Write any events which the storage has buffered, so that they are stored before any
+        event stored after this returns.
+
+        Storages which buffer events should override this. This default implementation does
+        nothing.
+        '''
+
     @abstractmethod
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
@@ -71,6 +260,8 @@ class InMemoryEventLogStorage(EventLogStorage):
     def __init__(self):
         self._logs = defaultdict(EventLogSequence)
         self._lock = defaultdict(gevent.lock.Semaphore)
+        # run_id -> PipelineRunStatsSnapshot, updated as each event is stored
+        self._stats = {}
 
     def get_logs_for_run(self, run_id, cursor=-1):
         check.str_param(run_id, 'run_id')
@@ -90,11 +281,26 @@ class InMemoryEventLogStorage(EventLogStorage):
         with self._lock[run_id]:
             self._logs[run_id] = self._logs[run_id].append(event)
 
+            if event.is_dagster_event and event.dagster_event.event_type in STATS_EVENT_TYPES:
+                update = build_stats_from_events(run_id, [event])
+                self._stats[run_id] = (
+                    merge_stats(self._stats[run_id], update) if run_id in self._stats else update
+                )
+
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        with self._lock[run_id]:
+            stats = self._stats.get(run_id)
+        return stats if stats is not None else build_stats_from_events(run_id, [])
+
     def delete_events(self, run_id):
         with self._lock[run_id]:
             del self._logs[run_id]
+            self._stats.pop(run_id, None)
         del self._lock[run_id]
 
     def wipe(self):
         self._logs = defaultdict(EventLogSequence)
         self._lock = defaultdict(gevent.lock.Semaphore)
+        self._stats = {}
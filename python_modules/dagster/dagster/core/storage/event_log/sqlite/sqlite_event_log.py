@@ -1,61 +1,400 @@
 import glob
+import logging
 import os
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 
 import six
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
 from dagster import check, seven
 from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
+from dagster.core.execution.stats import build_stats_from_events, merge_stats
 from dagster.core.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
 )
-from dagster.core.types import Field, String
+from dagster.core.types import Field, Float, Int, String
 from dagster.utils import mkdir_p
 
 from ...pipeline_run import PipelineRunStatsSnapshot, PipelineRunStatus
-from ..event_log import EventLogInvalidForRun, WatchableEventLogStorage
+from ..event_log import (
+    STATS_EVENT_TYPES,
+    EventLogEntry,
+    EventLogInvalidForRun,
+    WatchableEventLogStorage,
+    get_event_record_step_key,
+)
 
 CREATE_EVENT_LOG_SQL = '''
 CREATE TABLE IF NOT EXISTS event_logs (
     row_id INTEGER PRIMARY KEY AUTOINCREMENT,
     event TEXT NOT NULL,
     dagster_event_type TEXT,
-    timestamp TEXT
+    timestamp TEXT,
+    step_key TEXT,
+    level INTEGER
 )
 '''
 
+# Columns added to event_logs after its initial release, which older databases are migrated to
+MIGRATED_COLUMNS = [('step_key', 'TEXT'), ('level', 'INTEGER')]
+
+CREATE_INDEXES_SQL = [
+    'CREATE INDEX IF NOT EXISTS idx_event_logs_dagster_event_type '
+    'ON event_logs (dagster_event_type)',
+    'CREATE INDEX IF NOT EXISTS idx_event_logs_step_key ON event_logs (step_key)',
+    'CREATE INDEX IF NOT EXISTS idx_event_logs_level ON event_logs (level)',
+]
+
+BACKFILL_EVENT_COLUMNS_SQL = '''
+UPDATE event_logs SET dagster_event_type = ?, step_key = ?, level = ? WHERE row_id = ?
+'''
+
 FETCH_EVENTS_SQL = '''
 SELECT event FROM event_logs WHERE row_id > ? ORDER BY row_id ASC
 '''
 
-FETCH_STATS_SQL = '''
-SELECT dagster_event_type, COUNT(1), MAX(timestamp) FROM event_logs GROUP BY dagster_event_type
+FETCH_EVENTS_WITH_ROW_IDS_SQL = '''
+SELECT row_id, event FROM event_logs WHERE row_id > ? ORDER BY row_id ASC
+'''
+
+# A single row summarizing the run, updated in the same transaction as each batch of events
+CREATE_RUN_STATS_SQL = '''
+CREATE TABLE IF NOT EXISTS run_stats (
+    run_id TEXT PRIMARY KEY,
+    steps_succeeded INTEGER NOT NULL,
+    steps_failed INTEGER NOT NULL,
+    materializations INTEGER NOT NULL,
+    expectations INTEGER NOT NULL,
+    start_time REAL,
+    end_time REAL
+)
+'''
+
+# Builds the stats row from the events of a database created before run_stats was introduced. On
+# a new database the event log is empty, so this inserts a row of zeros.
+BACKFILL_RUN_STATS_SQL = '''
+INSERT OR IGNORE INTO run_stats
+SELECT
+    ?,
+    COUNT(CASE WHEN dagster_event_type = ? THEN 1 END),
+    COUNT(CASE WHEN dagster_event_type = ? THEN 1 END),
+    COUNT(CASE WHEN dagster_event_type = ? THEN 1 END),
+    COUNT(CASE WHEN dagster_event_type = ? THEN 1 END),
+    MAX(CASE WHEN dagster_event_type = ? THEN CAST(timestamp AS REAL) END),
+    COALESCE(
+        MAX(CASE WHEN dagster_event_type = ? THEN CAST(timestamp AS REAL) END),
+        MAX(CASE WHEN dagster_event_type = ? THEN CAST(timestamp AS REAL) END)
+    )
+FROM event_logs WHERE NOT EXISTS (SELECT 1 FROM run_stats)
+'''
+
+UPDATE_RUN_STATS_SQL = '''
+UPDATE run_stats SET
+    steps_succeeded = steps_succeeded + ?,
+    steps_failed = steps_failed + ?,
+    materializations = materializations + ?,
+    expectations = expectations + ?,
+    start_time = COALESCE(?, start_time),
+    end_time = COALESCE(?, end_time)
+WHERE run_id = ?
+'''
+
+FETCH_RUN_STATS_SQL = '''
+SELECT steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+FROM run_stats WHERE run_id = ?
 '''
 
 INSERT_EVENT_SQL = '''
-INSERT INTO event_logs (event, dagster_event_type, timestamp) VALUES (?, ?, ?)
+INSERT INTO event_logs (event, dagster_event_type, timestamp, step_key, level)
+VALUES (?, ?, ?, ?, ?)
 '''
 
+DEFAULT_BATCH_SIZE = 100
+
+DEFAULT_FLUSH_INTERVAL = 0.1
+
+# The number of times in a row the flusher thread tries to write a run's buffered events before
+# dropping them, e.g. when the run's database has been deleted
+MAX_FLUSH_ATTEMPTS = 5
+
+# The number of seconds for which changes to a watched run's database are coalesced before its new
+# events are read
+WATCH_DEBOUNCE_INTERVAL = 0.05
+
+# Events which are written through immediately rather than waiting on the size or time thresholds.
+# Engine events bracket the work done in each process, so flushing on them keeps the events of a
+# child process ahead of anything its parent writes once the child has finished.
+FLUSH_EVENT_TYPES = {
+    DagsterEventType.PIPELINE_START.value,
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+    DagsterEventType.PIPELINE_INIT_FAILURE.value,
+    DagsterEventType.ENGINE_EVENT.value,
+}
+
+# Events after which no more events are expected for the run, so its connection can be closed.
+RUN_END_EVENT_TYPES = {
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+    DagsterEventType.PIPELINE_INIT_FAILURE.value,
+}
+
+
+STATS_EVENT_TYPE_VALUES = {event_type.value for event_type in STATS_EVENT_TYPES}
+
+
+def _logs_query_filters(event_types, step_keys, min_level):
+    '''The conditions, and their parameters, which select the events matching a query.'''
+    check.opt_list_param(event_types, 'event_types', of_type=DagsterEventType)
+    check.opt_list_param(step_keys, 'step_keys', of_type=str)
+    check.opt_int_param(min_level, 'min_level')
+
+    sql = ''
+    params = []
+
+    if event_types is not None:
+        sql += ' AND dagster_event_type IN ({placeholders})'.format(
+            placeholders=', '.join('?' for _ in event_types)
+        )
+        params.extend(event_type.value for event_type in event_types)
+
+    if step_keys is not None:
+        sql += ' AND step_key IN ({placeholders})'.format(
+            placeholders=', '.join('?' for _ in step_keys)
+        )
+        params.extend(step_keys)
+
+    if min_level is not None:
+        sql += ' AND level >= ?'
+        params.append(min_level)
+
+    return sql, params
+
+
+def _event_type_value(event):
+    return event.dagster_event.event_type_value if event.is_dagster_event else None
+
+
+def _migrate_event_log_schema(conn, run_id):
+    '''Create the event_logs and run_stats tables for a run if they do not exist, bringing a
+    database created by an earlier version up to date by adding and backfilling the columns events
+    are indexed by, and the run's stats.'''
+    conn.execute(CREATE_EVENT_LOG_SQL)
+
+    columns = set(row[1] for row in conn.execute('PRAGMA table_info(event_logs)').fetchall())
+    missing_columns = [
+        (column, column_type) for column, column_type in MIGRATED_COLUMNS if column not in columns
+    ]
+
+    if missing_columns:
+        with conn:
+            for column, column_type in missing_columns:
+                conn.execute(
+                    'ALTER TABLE event_logs ADD COLUMN {column} {column_type}'.format(
+                        column=column, column_type=column_type
+                    )
+                )
+
+            updates = []
+            for row_id, json_str in conn.execute('SELECT row_id, event FROM event_logs'):
+                try:
+                    event = deserialize_json_to_dagster_namedtuple(json_str)
+                except (seven.JSONDecodeError, check.CheckError):
+                    continue
+                if not isinstance(event, EventRecord):
+                    continue
+
+                updates.append(
+                    (
+                        _event_type_value(event),
+                        get_event_record_step_key(event),
+                        event.level,
+                        row_id,
+                    )
+                )
+
+            conn.executemany(BACKFILL_EVENT_COLUMNS_SQL, updates)
+
+    for create_index_sql in CREATE_INDEXES_SQL:
+        conn.execute(create_index_sql)
+
+    with conn:
+        conn.execute(CREATE_RUN_STATS_SQL)
+        conn.execute(
+            BACKFILL_RUN_STATS_SQL,
+            (
+                run_id,
+                DagsterEventType.STEP_SUCCESS.value,
+                DagsterEventType.STEP_FAILURE.value,
+                DagsterEventType.STEP_MATERIALIZATION.value,
+                DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                DagsterEventType.PIPELINE_START.value,
+                DagsterEventType.PIPELINE_SUCCESS.value,
+                DagsterEventType.PIPELINE_FAILURE.value,
+            ),
+        )
+
+
+class _RunEventLogWriter(object):
+    '''Buffers the events for a single run and writes them to the run's database in batches, each
+    in a single transaction over one long-lived connection.
+
+    A batch is written once it reaches batch_size events. Otherwise the storage's flusher thread
+    writes it flush_interval seconds after its first event was buffered; on_pending is called when
+    the first event of a batch is buffered, to let the flusher know. The run's stats row is
+    updated in the same transaction as the batch. A batch which fails to be written stays
+    pending, and failed_flushes counts the failed attempts to write it.
+    '''
+
+    def __init__(self, run_id, path, batch_size, flush_interval, on_pending):
+        self._run_id = check.str_param(run_id, 'run_id')
+        self._batch_size = check.int_param(batch_size, 'batch_size')
+        self._flush_interval = check.float_param(flush_interval, 'flush_interval')
+        self._on_pending = check.callable_param(on_pending, 'on_pending')
+        self._lock = threading.RLock()
+        self._pending = []
+        # PipelineRunStatsSnapshot built from the pending events, if any of them affect the stats
+        self._pending_stats = None
+        # The time by which the pending events should be written
+        self._flush_due_time = None
+        self._failed_flushes = 0
+
+        # The connection is shared with the flusher thread, guarded by self._lock
+        self._conn = sqlite3.connect(check.str_param(path, 'path'), check_same_thread=False)
+        _migrate_event_log_schema(self._conn, self._run_id)
+        self._conn.execute('PRAGMA journal_mode=WAL;')
+
+    @property
+    def run_id(self):
+        return self._run_id
+
+    @property
+    def flush_due_time(self):
+        with self._lock:
+            return self._flush_due_time
+
+    @property
+    def failed_flushes(self):
+        with self._lock:
+            return self._failed_flushes
+
+    @property
+    def num_pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def append(self, row, stats=None, flush=False):
+        check.opt_inst_param(stats, 'stats', PipelineRunStatsSnapshot)
+
+        is_first_pending = False
+        with self._lock:
+            self._pending.append(row)
+            if stats is not None:
+                self._pending_stats = (
+                    merge_stats(self._pending_stats, stats)
+                    if self._pending_stats is not None
+                    else stats
+                )
+
+            if flush or len(self._pending) >= self._batch_size:
+                self.flush()
+            elif self._flush_due_time is None:
+                self._flush_due_time = time.time() + self._flush_interval
+                is_first_pending = True
+
+        if is_first_pending:
+            self._on_pending()
+
+    def flush(self):
+        with self._lock:
+            if not self._pending or self._conn is None:
+                self._flush_due_time = None
+                return
+
+            try:
+                with self._conn:
+                    self._conn.executemany(INSERT_EVENT_SQL, self._pending)
+                    if self._pending_stats is not None:
+                        self._conn.execute(
+                            UPDATE_RUN_STATS_SQL,
+                            (
+                                self._pending_stats.steps_succeeded,
+                                self._pending_stats.steps_failed,
+                                self._pending_stats.materializations,
+                                self._pending_stats.expectations,
+                                self._pending_stats.start_time,
+                                self._pending_stats.end_time,
+                                self._run_id,
+                            ),
+                        )
+            except Exception:  # pylint: disable=broad-except
+                # The transaction was rolled back, so the batch stays pending and is retried
+                self._failed_flushes += 1
+                self._flush_due_time = time.time() + self._flush_interval
+                self._on_pending()
+                raise
+
+            self._pending = []
+            self._pending_stats = None
+            self._flush_due_time = None
+            self._failed_flushes = 0
+
+    def close(self, discard=False):
+        with self._lock:
+            if discard:
+                self._pending = []
+                self._pending_stats = None
+            self.flush()
+
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(
+        self,
+        base_dir,
+        batch_size=DEFAULT_BATCH_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        inst_data=None,
+    ):
         '''Note that idempotent initialization of the SQLite database is done on a per-run_id
-        basis in the body of store_event, since each run is stored in a separate database.'''
+        basis in the body of store_event, since each run is stored in a separate database.
+
+        Events are buffered per run and written in batches of up to batch_size events. Buffered
+        events are written by a single flusher thread at most flush_interval seconds after they
+        are stored, and immediately on pipeline and engine events or when flush is called. Reads
+        through this storage always see every event stored through it.'''
         self._base_dir = check.str_param(base_dir, 'base_dir')
         mkdir_p(self._base_dir)
 
-        self._known_run_ids = set([])
-        self._watchers = {}
-        self._obs = Observer()
-        self._obs.start()
+        self._batch_size = check.int_param(batch_size, 'batch_size')
+        check.param_invariant(self._batch_size > 0, 'batch_size')
+        self._flush_interval = check.float_param(flush_interval, 'flush_interval')
+
+        self._writers = {}
+        self._writers_lock = threading.Lock()
+        # Guards starting and exiting the flusher thread, which runs while any events are buffered
+        self._flusher_cond = threading.Condition()
+        self._flusher = None
+        self._flusher_notified = False
+
+        # run_ids whose databases are known to be on the current schema
+        self._migrated_run_ids = set()
+        # Created when the first run is watched
+        self._watcher = None
+        self._watcher_lock = threading.Lock()
+        self._obs = None
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -64,7 +403,25 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('SqliteEventLogStorageConfig', {'base_dir': Field(String)})
+        return SystemNamedDict(
+            'SqliteEventLogStorageConfig',
+            {
+                'base_dir': Field(String),
+                'batch_size': Field(
+                    Int,
+                    is_optional=True,
+                    default_value=DEFAULT_BATCH_SIZE,
+                    description='The maximum number of events written in a single transaction.',
+                ),
+                'flush_interval': Field(
+                    Float,
+                    is_optional=True,
+                    default_value=DEFAULT_FLUSH_INTERVAL,
+                    description='The maximum number of seconds an event is buffered before it is '
+                    'written.',
+                ),
+            },
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
@@ -82,23 +439,144 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
         check.str_param(run_id, 'run_id')
         return os.path.join(self._base_dir, '{run_id}.db'.format(run_id=run_id))
 
+    def _get_writer(self, run_id):
+        with self._writers_lock:
+            if run_id not in self._writers:
+                self._writers[run_id] = _RunEventLogWriter(
+                    run_id,
+                    self.filepath_for_run_id(run_id),
+                    self._batch_size,
+                    self._flush_interval,
+                    self._notify_flusher,
+                )
+                self._migrated_run_ids.add(run_id)
+            return self._writers[run_id]
+
+    def _ensure_migrated(self, run_id):
+        if run_id in self._migrated_run_ids:
+            return
+
+        with self._connect(run_id) as conn:
+            _migrate_event_log_schema(conn, run_id)
+        self._migrated_run_ids.add(run_id)
+
+    def _close_writer(self, run_id, discard=False):
+        with self._writers_lock:
+            writer = self._writers.pop(run_id, None)
+        if writer is not None:
+            writer.close(discard=discard)
+
+    def _drop_writer(self, writer):
+        '''Discard a writer's buffered events and close it, and stop using it for its run unless
+        the run already has another writer.'''
+        with self._writers_lock:
+            if self._writers.get(writer.run_id) is writer:
+                del self._writers[writer.run_id]
+        writer.close(discard=True)
+
+    def _flush(self, run_id):
+        with self._writers_lock:
+            writer = self._writers.get(run_id)
+        if writer is not None:
+            writer.flush()
+
+    def flush(self):
+        with self._writers_lock:
+            writers = list(self._writers.values())
+        for writer in writers:
+            writer.flush()
+
+    def _notify_flusher(self):
+        # No other lock is taken while self._flusher_cond is held, so this may be called while
+        # holding a writer's lock
+        with self._flusher_cond:
+            self._flusher_notified = True
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name='dagster-sqlite-event-log-flusher'
+                )
+                self._flusher.daemon = True
+                self._flusher.start()
+            else:
+                self._flusher_cond.notify()
+
+    def _run_flusher(self):
+        '''Write each run's buffered events once they are due, until no events are buffered.
+
+        A batch which fails to be written is retried flush_interval seconds later. After
+        MAX_FLUSH_ATTEMPTS failures in a row, its events are dropped and the error is logged.
+        '''
+        while True:
+            with self._flusher_cond:
+                self._flusher_notified = False
+
+            with self._writers_lock:
+                writers = list(self._writers.values())
+            due_times = [(writer, writer.flush_due_time) for writer in writers]
+            due_times = [
+                (writer, due_time) for writer, due_time in due_times if due_time is not None
+            ]
+            now = time.time()
+            due_writers = [writer for writer, due_time in due_times if due_time <= now]
+
+            with self._flusher_cond:
+                # Events may have been buffered since the due times were read
+                if self._flusher_notified:
+                    continue
+                if not due_times:
+                    self._flusher = None
+                    return
+                if not due_writers:
+                    self._flusher_cond.wait(min(due_time for _, due_time in due_times) - now)
+                    continue
+
+            for writer in due_writers:
+                try:
+                    writer.flush()
+                except Exception as exc:  # pylint: disable=broad-except
+                    if writer.failed_flushes < MAX_FLUSH_ATTEMPTS:
+                        logging.warning(
+                            'Error writing buffered events for run {run_id}, retrying in '
+                            '{flush_interval}s: {exc}'.format(
+                                run_id=writer.run_id, flush_interval=self._flush_interval, exc=exc
+                            )
+                        )
+                        continue
+
+                    logging.exception(
+                        'Dropping {num_events} buffered events for run {run_id} after '
+                        '{num_attempts} failed attempts to write them'.format(
+                            num_events=writer.num_pending,
+                            run_id=writer.run_id,
+                            num_attempts=writer.failed_flushes,
+                        )
+                    )
+                    self._drop_writer(writer)
+
     def store_event(self, event):
         check.inst_param(event, 'event', EventRecord)
         run_id = event.run_id
-        if not run_id in self._known_run_ids:
-            with self._connect(run_id) as conn:
-                conn.cursor().execute(CREATE_EVENT_LOG_SQL)
-                conn.cursor().execute('PRAGMA journal_mode=WAL;')
-                self._known_run_ids.add(run_id)
-        with self._connect(run_id) as conn:
-            dagster_event_type = None
-            if event.is_dagster_event:
-                dagster_event_type = event.dagster_event.event_type_value
 
-            conn.cursor().execute(
-                INSERT_EVENT_SQL,
-                (serialize_dagster_namedtuple(event), dagster_event_type, event.timestamp),
-            )
+        dagster_event_type = _event_type_value(event)
+
+        self._get_writer(run_id).append(
+            (
+                serialize_dagster_namedtuple(event),
+                dagster_event_type,
+                event.timestamp,
+                get_event_record_step_key(event),
+                event.level,
+            ),
+            stats=(
+                build_stats_from_events(run_id, [event])
+                if dagster_event_type in STATS_EVENT_TYPE_VALUES
+                else None
+            ),
+            flush=dagster_event_type in FLUSH_EVENT_TYPES,
+        )
+
+        if dagster_event_type in RUN_END_EVENT_TYPES:
+            self._close_writer(run_id)
 
     def get_logs_for_run(self, run_id, cursor=-1):
         check.str_param(run_id, 'run_id')
@@ -112,6 +590,8 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
         if not os.path.exists(self.filepath_for_run_id(run_id)):
             return events
 
+        self._flush(run_id)
+
         cursor += 1  # adjust from 0 based offset to 1
         try:
             with self._connect(run_id) as conn:
@@ -131,46 +611,124 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
         return events
 
-    def get_stats_for_run(self, run_id):
+    def query_logs_for_run(
+        self,
+        run_id,
+        event_types=None,
+        step_keys=None,
+        min_level=None,
+        cursor=-1,
+        limit=None,
+        before_cursor=None,
+        newest_first=False,
+    ):
+        check.str_param(run_id, 'run_id')
+        check.int_param(cursor, 'cursor')
+        check.invariant(
+            cursor >= -1,
+            'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
+        )
+        check.opt_int_param(limit, 'limit')
+        check.opt_int_param(before_cursor, 'before_cursor')
+        check.bool_param(newest_first, 'newest_first')
+
         if not os.path.exists(self.filepath_for_run_id(run_id)):
-            return None
+            return []
+
+        # As in get_logs_for_run, cursors are zero-based offsets of row ids
+        filters_sql, params = _logs_query_filters(event_types, step_keys, min_level)
+        sql = 'SELECT row_id, event FROM event_logs WHERE row_id > ?' + filters_sql
+        params = [cursor + 1] + params
+
+        if before_cursor is not None:
+            sql += ' AND row_id < ?'
+            params.append(before_cursor + 1)
+
+        sql += ' ORDER BY row_id DESC' if newest_first else ' ORDER BY row_id ASC'
+
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
 
         try:
-            with self._connect(run_id) as conn:
-                results = conn.cursor().execute(FETCH_STATS_SQL).fetchall()
+            results = self._query_run(run_id, sql, params)
         except sqlite3.Error as err:
             six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
 
         try:
-            counts = {}
-            times = {}
-            for result in results:
-                if result[0]:
-                    counts[result[0]] = result[1]
-                    times[result[0]] = result[2]
-
-            return PipelineRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                start_time=float(times.get(DagsterEventType.PIPELINE_START.value, 0.0)),
-                end_time=float(
-                    times.get(
-                        DagsterEventType.PIPELINE_SUCCESS.value,
-                        times.get(DagsterEventType.PIPELINE_FAILURE.value, 0.0),
-                    )
-                ),
-            )
+            return [
+                EventLogEntry(
+                    row_id - 1,
+                    check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                    ),
+                )
+                for row_id, json_str in results
+            ]
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
 
+    def get_logs_count_for_run(self, run_id, event_types=None, step_keys=None, min_level=None):
+        check.str_param(run_id, 'run_id')
+
+        if not os.path.exists(self.filepath_for_run_id(run_id)):
+            return 0
+
+        filters_sql, params = _logs_query_filters(event_types, step_keys, min_level)
+        try:
+            ((count,),) = self._query_run(
+                run_id, 'SELECT COUNT(*) FROM event_logs WHERE 1 = 1' + filters_sql, params
+            )
+        except sqlite3.Error as err:
+            six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
+
+        return count
+
+    def _query_run(self, run_id, sql, params):
+        self._flush(run_id)
+        self._ensure_migrated(run_id)
+        with self._connect(run_id) as conn:
+            return conn.cursor().execute(sql, params).fetchall()
+
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        if not os.path.exists(self.filepath_for_run_id(run_id)):
+            return None
+
+        self._flush(run_id)
+
+        try:
+            self._ensure_migrated(run_id)
+            with self._connect(run_id) as conn:
+                row = conn.cursor().execute(FETCH_RUN_STATS_SQL, (run_id,)).fetchone()
+        except sqlite3.Error as err:
+            six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
+
+        if row is None:
+            return None
+
+        return PipelineRunStatsSnapshot(run_id, *row)
+
+    def get_stats_for_runs(self, run_ids):
+        '''Each run is stored in a separate database, so this reads the stats row of each run in
+        turn. Runs with no events stored are mapped to None.'''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
     def wipe(self):
+        for run_id in list(self._writers.keys()):
+            self._close_writer(run_id, discard=True)
+        self._migrated_run_ids = set()
+
         for filename in glob.glob(os.path.join(self._base_dir, '*.db')):
             os.unlink(filename)
 
     def delete_events(self, run_id):
+        self._close_writer(run_id, discard=True)
+        self._migrated_run_ids.discard(run_id)
+
         path = self.filepath_for_run_id(run_id)
         if os.path.exists(path):
             os.unlink(path)
@@ -179,39 +737,202 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
     def is_persistent(self):
         return True
 
+    def _get_watcher(self):
+        with self._watcher_lock:
+            if self._watcher is None:
+                self._watcher = _EventLogDirectoryWatcher(self)
+                self._obs = Observer()
+                self._obs.schedule(self._watcher, self._base_dir, recursive=False)
+                self._obs.start()
+            return self._watcher
+
     def watch(self, run_id, start_cursor, callback):
-        watchdog = EventLogStorageWatchdog(self, run_id, callback, start_cursor)
-        self._watchers[run_id] = self._obs.schedule(watchdog, self._base_dir, True)
+        '''Call callback with each event stored for the run after the zero-indexed start_cursor.
+
+        The callback is called on a background thread, and stops being called for the run once it
+        returns PipelineRunStatus.SUCCESS or PipelineRunStatus.FAILURE.
+        '''
+        check.str_param(run_id, 'run_id')
+        check.int_param(start_cursor, 'start_cursor')
+        check.callable_param(callback, 'callback')
+
+        self._get_watcher().watch_run(run_id, start_cursor, callback)
 
     def end_watch(self, run_id, handler):
-        self._obs.remove_handler_for_watch(handler, self._watchers[run_id])
-        del self._watchers[run_id]
+        check.str_param(run_id, 'run_id')
+        check.callable_param(handler, 'handler')
+
+        self._get_watcher().unwatch_run(run_id, handler)
 
 
-class EventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
+class _RunWatchHandler(object):
+    def __init__(self, callback, cursor):
+        self.callback = callback
+        # The offset of the last event passed to the callback
+        self.cursor = cursor
+
+
+class _RunWatch(object):
+    '''The handlers watching a single run, and the connection and cursor with which the run's new
+    events are read.'''
+
+    def __init__(self, path):
+        self.path = path
+        self.handlers = []
+        # The offset of the last event read
+        self.cursor = None
+        self._conn = None
+
+    def read_new_events(self):
+        if self._conn is None:
+            if not os.path.exists(self.path):
+                return []
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+
+        try:
+            results = self._conn.execute(
+                FETCH_EVENTS_WITH_ROW_IDS_SQL, (self.cursor + 1,)
+            ).fetchall()
+        except sqlite3.Error:
+            # The database is being created, or is not an event log. The run is read again when
+            # its database next changes.
+            return []
+
+        events = []
+        for row_id, json_str in results:
+            try:
+                event = deserialize_json_to_dagster_namedtuple(json_str)
+            except (seven.JSONDecodeError, check.CheckError):
+                continue
+            if isinstance(event, EventRecord):
+                events.append((row_id - 1, event))
+        return events
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _run_id_for_path(path):
+    filename = os.path.basename(path)
+    # In WAL mode, committed writes land in the write-ahead log before the database itself
+    for suffix in ('.db', '.db-wal'):
+        if filename.endswith(suffix):
+            return filename[: -len(suffix)]
+    return None
+
+
+class _EventLogDirectoryWatcher(FileSystemEventHandler):
+    '''A single watch on the storage's base directory, shared by every watched run.
+
+    Changes to a run's database are dispatched by path to the run's handlers. A burst of changes
+    is coalesced: the run's new events are read once, debounce_interval seconds after the first
+    change, on a dispatch thread, and passed to each of its handlers in turn.
+    '''
+
+    def __init__(self, event_log_storage, debounce_interval=WATCH_DEBOUNCE_INTERVAL):
         self._event_log_storage = check.inst_param(
-            event_log_storage, 'event_log_storage', WatchableEventLogStorage
+            event_log_storage, 'event_log_storage', SqliteEventLogStorage
         )
-        self._run_id = check.str_param(run_id, 'run_id')
-        self._cb = check.callable_param(callback, 'callback')
-        self._log_path = event_log_storage.filepath_for_run_id(run_id)
-        self._cursor = start_cursor
-        super(EventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
-
-    def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
-            status = self._cb(event)
+        self._debounce_interval = check.float_param(debounce_interval, 'debounce_interval')
+
+        # Guards the run watches. Handlers are called while it is held, so that each handler sees
+        # each event once and in order, and may end their own watch.
+        self._lock = threading.RLock()
+        self._run_watches = {}
+        self._changed_run_ids = set()
+        self._changed = threading.Event()
+
+        self._thread = threading.Thread(target=self._dispatch, name='event-log-watcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def watch_run(self, run_id, start_cursor, callback):
+        with self._lock:
+            run_watch = self._run_watches.get(run_id)
+            if run_watch is None:
+                run_watch = _RunWatch(self._event_log_storage.filepath_for_run_id(run_id))
+                self._run_watches[run_id] = run_watch
+
+            run_watch.handlers.append(_RunWatchHandler(callback, start_cursor))
+            # Re-read from the earliest cursor of any handler; events are only passed to the
+            # handlers which have not seen them
+            run_watch.cursor = (
+                start_cursor if run_watch.cursor is None else min(run_watch.cursor, start_cursor)
+            )
 
-            if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
-                self._event_log_storage.end_watch(self._run_id, self)
+            # Events stored before the watch began would otherwise only be seen on the next change
+            self._process_run(run_id)
+
+    def unwatch_run(self, run_id, callback):
+        with self._lock:
+            run_watch = self._run_watches.get(run_id)
+            if run_watch is None:
+                return
+
+            run_watch.handlers = [
+                handler for handler in run_watch.handlers if handler.callback != callback
+            ]
+            if not run_watch.handlers:
+                run_watch.close()
+                del self._run_watches[run_id]
+
+    def _process_run(self, run_id):
+        run_watch = self._run_watches.get(run_id)
+        if run_watch is None:
+            return
+
+        # Make events buffered by this storage visible to the read
+        self._event_log_storage._flush(run_id)  # pylint: disable=protected-access
+
+        for cursor, event in run_watch.read_new_events():
+            run_watch.cursor = cursor
+            for handler in list(run_watch.handlers):
+                if cursor <= handler.cursor:
+                    continue
+
+                handler.cursor = cursor
+                status = handler.callback(event)
+                if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
+                    self.unwatch_run(run_id, handler.callback)
+
+            if run_id not in self._run_watches:
+                return
+
+    def _on_change(self, path):
+        run_id = _run_id_for_path(path)
+        if run_id is None:
+            return
+
+        with self._lock:
+            if run_id not in self._run_watches:
+                return
+            self._changed_run_ids.add(run_id)
+        self._changed.set()
 
     def on_created(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        if not event.is_directory:
+            self._on_change(event.src_path)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        if not event.is_directory:
+            self._on_change(event.src_path)
+
+    def _dispatch(self):
+        while True:
+            self._changed.wait()
+            # Let the rest of a burst of changes arrive before reading
+            time.sleep(self._debounce_interval)
+
+            with self._lock:
+                self._changed.clear()
+                changed_run_ids, self._changed_run_ids = self._changed_run_ids, set()
+
+                for run_id in changed_run_ids:
+                    try:
+                        self._process_run(run_id)
+                    except Exception:  # pylint: disable=broad-except
+                        logging.exception(
+                            'Error processing events for run {run_id}'.format(run_id=run_id)
+                        )
@@ -1,3 +1,4 @@
+import copy
 from abc import ABCMeta
 
 import six
@@ -59,12 +60,22 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.has_object(key)
 
+    def has_objects(self, context, paths_list):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(paths_list, 'paths_list', of_type=list)
+        for paths in paths_list:
+            check.list_param(paths, 'paths', of_type=str)
+            check.param_invariant(len(paths) > 0, 'paths')
+
+        keys = [self.object_store.key_for_paths([self.root] + paths) for paths in paths_list]
+        return self.object_store.has_objects(keys)
+
     def rm_object(self, context, paths):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
-        self.object_store.rm_object(key)
+        return self.object_store.rm_object(key)
 
     def copy_object_from_prev_run(self, _context, previous_run_id, paths):
         check.str_param(previous_run_id, 'previous_run_id')
@@ -76,6 +87,32 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
 
         return self.object_store.cp_object(src, dst)
 
+    def copy_objects_from_prev_run(self, _context, previous_run_id, paths_list):
+        check.str_param(previous_run_id, 'previous_run_id')
+        check.list_param(paths_list, 'paths_list', of_type=list)
+        for paths in paths_list:
+            check.list_param(paths, 'paths', of_type=str)
+            check.param_invariant(len(paths) > 0, 'paths')
+
+        prev_run_root = self.root_for_run_id(previous_run_id)
+        return self.object_store.cp_objects(
+            [
+                (
+                    self.object_store.key_for_paths([prev_run_root] + paths),
+                    self.object_store.key_for_paths([self.root] + paths),
+                )
+                for paths in paths_list
+            ]
+        )
+
+    def for_run_id(self, run_id):
+        '''An intermediate store over the same object store, rooted at the root of another run.'''
+        check.str_param(run_id, 'run_id')
+
+        intermediate_store = copy.copy(self)
+        intermediate_store.run_id = run_id
+        return intermediate_store
+
     def set_value(self, obj, context, runtime_type, paths):
         if self.type_storage_plugin_registry.is_registered(runtime_type):
             return self.type_storage_plugin_registry.get(runtime_type.name).set_object(
@@ -23,10 +23,48 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def has_intermediate(self, context, step_output_handle):
         pass
 
+    def has_intermediates(self, context, step_output_handles):
+        '''Check whether each of several intermediates exists. Returns a list of booleans, in the
+        order of step_output_handles.
+
+        Override this method if the existence of many intermediates can be checked at once more
+        cheaply than by calling has_intermediate for each.
+        '''
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+        return [self.has_intermediate(context, handle) for handle in step_output_handles]
+
+    def has_run_intermediates(self, context, step_output_handles):
+        '''Check whether each of several intermediates is stored by the current run itself, and so
+        may be removed by rm_intermediate. Returns a list of booleans, in the order of
+        step_output_handles.
+
+        Override this method if intermediates may also be read from somewhere the current run does
+        not own, e.g. the store of a previous run.
+        '''
+        return self.has_intermediates(context, step_output_handles)
+
     @abstractmethod
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         pass
 
+    def copy_intermediates_from_prev_run(self, context, previous_run_id, step_output_handles):
+        '''Copy each of several intermediates from a previous run. Returns a list of the
+        ObjectStoreOperations of the copies, in the order of step_output_handles.
+
+        Override this method if many intermediates can be copied at once more quickly than by
+        calling copy_intermediate_from_prev_run for each.
+        '''
+        check.str_param(previous_run_id, 'previous_run_id')
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+        return [
+            self.copy_intermediate_from_prev_run(context, previous_run_id, handle)
+            for handle in step_output_handles
+        ]
+
+    @abstractmethod
+    def rm_intermediate(self, context, step_output_handle):
+        pass
+
     @abstractproperty
     def is_persistent(self):
         pass
@@ -38,12 +76,18 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
         from dagster.core.execution.plan.objects import ExecutionStep
 
         check.inst_param(step, 'step', ExecutionStep)
-        uncovered_inputs = []
-        for step_input in step.step_inputs:
-            for source_handle in step_input.source_handles:
-                if not self.has_intermediate(context, source_handle):
-                    uncovered_inputs.append(source_handle)
-        return uncovered_inputs
+        source_handles = [
+            source_handle
+            for step_input in step.step_inputs
+            for source_handle in step_input.source_handles
+        ]
+        return [
+            source_handle
+            for source_handle, is_covered in zip(
+                source_handles, self.has_intermediates(context, source_handles)
+            )
+            if not is_covered
+        ]
 
 
 class InMemoryIntermediatesManager(IntermediatesManager):
@@ -78,27 +122,83 @@ class InMemoryIntermediatesManager(IntermediatesManager):
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        self.values.pop(step_output_handle, None)
+
     @property
     def is_persistent(self):
         return False
 
 
 class IntermediateStoreIntermediatesManager(IntermediatesManager):
-    def __init__(self, intermediate_store):
+    '''Stores intermediates in an intermediate store, under the root of the current run.
+
+    Args:
+        intermediate_store (IntermediateStore): The intermediate store.
+        reference_previous_run (Optional[bool]): If True, a re-execution reads the intermediates
+            it does not produce itself from the store of the previous run (or of the run that it
+            re-executed, and so on) rather than copying them into the current run first. The
+            intermediates of the current run take precedence, and only they are ever removed.
+            (default: False)
+    '''
+
+    def __init__(self, intermediate_store, reference_previous_run=False):
         self._intermediate_store = check.inst_param(
             intermediate_store, 'intermediate_store', IntermediateStore
         )
+        self._reference_previous_run = check.bool_param(
+            reference_previous_run, 'reference_previous_run'
+        )
+        self._previous_run_stores = None
 
     def _get_paths(self, step_output_handle):
         return ['intermediates', step_output_handle.step_key, step_output_handle.output_name]
 
+    def _get_previous_run_stores(self, context):
+        '''The intermediate stores of the runs that the current run re-executes, nearest first.'''
+        if not self._reference_previous_run:
+            return []
+
+        if self._previous_run_stores is None:
+            previous_run_stores = []
+            run_ids = set([context.run_id])
+            previous_run_id = context.pipeline_run.previous_run_id
+            while previous_run_id is not None and previous_run_id not in run_ids:
+                run_ids.add(previous_run_id)
+                previous_run_store = self._intermediate_store.for_run_id(previous_run_id)
+                # e.g. storage configured with a base_dir shares one root between all runs
+                if previous_run_store.root != self._intermediate_store.root:
+                    previous_run_stores.append(previous_run_store)
+
+                previous_run = context.instance.get_run_by_id(previous_run_id)
+                previous_run_id = previous_run.previous_run_id if previous_run else None
+
+            self._previous_run_stores = previous_run_stores
+
+        return self._previous_run_stores
+
+    def _get_store(self, context, step_output_handle):
+        '''The intermediate store which has the intermediate, if any run's store does.'''
+        paths = self._get_paths(step_output_handle)
+        for intermediate_store in [self._intermediate_store] + self._get_previous_run_stores(
+            context
+        ):
+            if intermediate_store.has_object(context, paths):
+                return intermediate_store
+
+        return None
+
     def get_intermediate(self, context, runtime_type, step_output_handle):
         check.inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(runtime_type, 'runtime_type', RuntimeType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
-        check.invariant(self.has_intermediate(context, step_output_handle))
 
-        return self._intermediate_store.get_value(
+        intermediate_store = self._get_store(context, step_output_handle)
+        check.invariant(intermediate_store is not None)
+
+        return intermediate_store.get_value(
             context=context, runtime_type=runtime_type, paths=self._get_paths(step_output_handle)
         )
 
@@ -107,12 +207,7 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(runtime_type, 'runtime_type', RuntimeType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
 
-        if self.has_intermediate(context, step_output_handle):
-            context.log.warning(
-                'Replacing existing intermediate for %s.%s'
-                % (step_output_handle.step_key, step_output_handle.output_name)
-            )
-
+        # Any existing intermediate is overwritten in place by the object store
         return self._intermediate_store.set_value(
             obj=value,
             context=context,
@@ -124,13 +219,59 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         check.inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
 
-        return self._intermediate_store.has_object(context, self._get_paths(step_output_handle))
+        return self._get_store(context, step_output_handle) is not None
+
+    def has_intermediates(self, context, step_output_handles):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+        results = [False] * len(step_output_handles)
+        for intermediate_store in [self._intermediate_store] + self._get_previous_run_stores(
+            context
+        ):
+            # Only look for the intermediates not found in the stores of later runs
+            indices = [index for index, result in enumerate(results) if not result]
+            if not indices:
+                break
+
+            for index, exists in zip(
+                indices,
+                intermediate_store.has_objects(
+                    context, [self._get_paths(step_output_handles[index]) for index in indices]
+                ),
+            ):
+                results[index] = exists
+
+        return results
+
+    def has_run_intermediates(self, context, step_output_handles):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+        # Intermediates referenced from the stores of previous runs are not the current run's
+        return self._intermediate_store.has_objects(
+            context, [self._get_paths(handle) for handle in step_output_handles]
+        )
 
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         return self._intermediate_store.copy_object_from_prev_run(
             context, previous_run_id, self._get_paths(step_output_handle)
         )
 
+    def copy_intermediates_from_prev_run(self, context, previous_run_id, step_output_handles):
+        check.str_param(previous_run_id, 'previous_run_id')
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+        return self._intermediate_store.copy_objects_from_prev_run(
+            context, previous_run_id, [self._get_paths(handle) for handle in step_output_handles]
+        )
+
+    def rm_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.rm_object(context, self._get_paths(step_output_handle))
+
     @property
     def is_persistent(self):
         return True
@@ -43,6 +43,16 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         
         Should return a boolean.'''
 
+    def has_objects(self, keys):
+        '''Check whether each of several keys exists in the object store.
+
+        Override this method if the object store can check many keys at once more cheaply than
+        by calling has_object for each.
+
+        Should return a list of booleans, in the order of keys.'''
+        check.list_param(keys, 'keys', of_type=str)
+        return [self.has_object(key) for key in keys]
+
     @abstractmethod
     def rm_object(self, key):
         '''Implement this method to remove an object from the object store.
@@ -57,6 +67,17 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.CP_OBJECT
         on success.'''
 
+    def cp_objects(self, src_dst_pairs):
+        '''Copy each of several objects from one key to another in the object store.
+
+        Override this method if the object store can copy many objects at once more quickly than
+        by calling cp_object for each, e.g. by copying them concurrently.
+
+        Should return a list of ObjectStoreOperations with op==ObjectStoreOperationType.CP_OBJECT,
+        in the order of src_dst_pairs.'''
+        check.list_param(src_dst_pairs, 'src_dst_pairs', of_type=tuple)
+        return [self.cp_object(src, dst) for src, dst in src_dst_pairs]
+
     @abstractmethod
     def uri_for_key(self, key, protocol=None):
         '''Implement this method to get a URI for a key in the object store.
@@ -145,10 +166,18 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
         # Ensure output path exists
         mkdir_p(os.path.dirname(dst))
 
+        # Hard link rather than copy where possible. This is safe because objects are never
+        # modified in place: set_object unlinks any existing file before writing.
         if os.path.isfile(src):
-            shutil.copy(src, dst)
+            _link_or_copy(src, dst)
         elif os.path.isdir(src):
-            shutil.copytree(src, dst)
+            for dirpath, _, filenames in os.walk(src):
+                dst_dirpath = os.path.join(dst, os.path.relpath(dirpath, src))
+                mkdir_p(dst_dirpath)
+                for filename in filenames:
+                    _link_or_copy(
+                        os.path.join(dirpath, filename), os.path.join(dst_dirpath, filename)
+                    )
         else:
             check.failed('should not get here')
 
@@ -169,3 +198,11 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def key_for_paths(self, path_fragments):
         '''Joins path fragments into a key using the object-store specific path separator.'''
         return os.path.join(*path_fragments)
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        # Hard links are unsupported on some platforms and filesystems, and across devices
+        shutil.copy(src, dst)
@@ -1,4 +1,5 @@
 from collections import namedtuple
+from datetime import datetime
 from enum import Enum
 
 from dagster import check
@@ -47,6 +48,45 @@ class PipelineRunStatsSnapshot(
         )
 
 
+class PipelineRunSummary(
+    namedtuple(
+        '_PipelineRunSummary', 'run_id pipeline_name status tags create_timestamp update_timestamp',
+    )
+):
+    '''A compact record of a run, read from the indexed columns of run storage without
+    deserializing the run itself.
+
+    Args:
+        run_id (str): The id of the run.
+        pipeline_name (str): The name of the pipeline the run executes.
+        status (PipelineRunStatus): The status of the run.
+        tags (Dict[str, str]): The tags of the run.
+        create_timestamp (Optional[datetime]): When the run was added to storage, if recorded.
+        update_timestamp (Optional[datetime]): When the status of the run last changed, if
+            recorded.
+    '''
+
+    def __new__(
+        cls, run_id, pipeline_name, status, tags=None, create_timestamp=None, update_timestamp=None
+    ):
+        return super(PipelineRunSummary, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, 'run_id'),
+            pipeline_name=check.str_param(pipeline_name, 'pipeline_name'),
+            status=check.inst_param(status, 'status', PipelineRunStatus),
+            tags=check.opt_dict_param(tags, 'tags', key_type=str, value_type=str),
+            create_timestamp=check.opt_inst_param(create_timestamp, 'create_timestamp', datetime),
+            update_timestamp=check.opt_inst_param(update_timestamp, 'update_timestamp', datetime),
+        )
+
+    @staticmethod
+    def from_run(pipeline_run):
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        return PipelineRunSummary(
+            pipeline_run.run_id, pipeline_run.pipeline_name, pipeline_run.status, pipeline_run.tags
+        )
+
+
 @whitelist_for_serdes
 class PipelineRun(
     namedtuple(
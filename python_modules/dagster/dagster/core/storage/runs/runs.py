@@ -9,7 +9,7 @@ from dagster import check
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 
-from ..pipeline_run import PipelineRun, PipelineRunStatus
+from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunSummary
 
 
 class RunStorage(six.with_metaclass(ABCMeta)):
@@ -86,6 +86,52 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             List[PipelineRun]:
         '''
 
+    def get_run_summaries(
+        self, pipeline_name=None, status=None, tags=None, cursor=None, limit=None
+    ):
+        '''Return compact summaries of the runs matching all of the given filters, most recent
+        first.
+
+        Summaries carry only the indexed fields of runs (their ids, pipeline names, statuses and
+        tags), for callers which need no more, so storages which index those fields should
+        override this to avoid loading whole runs. Callers which need e.g. the mode or config of
+        runs, such as the run lists of dagster-graphql, must load whole runs instead. This default
+        implementation filters the result of all_runs.
+
+        Args:
+            pipeline_name (Optional[str]): Only return runs of this pipeline.
+            status (Optional[PipelineRunStatus]): Only return runs with this status.
+            tags (Optional[List[Tuple[str, str]]]): Only return runs with all of these (key, value)
+                tags.
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRunSummary]
+        '''
+        check.opt_str_param(pipeline_name, 'pipeline_name')
+        check.opt_inst_param(status, 'status', PipelineRunStatus)
+        tags = check.opt_list_param(tags, 'tags', of_type=tuple)
+        check.opt_str_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
+
+        runs = [
+            run
+            for run in self.all_runs()
+            if (pipeline_name is None or run.pipeline_name == pipeline_name)
+            and (status is None or run.status == status)
+            and all(run.tags.get(key) == value for key, value in tags)
+        ]
+
+        if cursor:
+            run_ids = [run.run_id for run in runs]
+            runs = runs[run_ids.index(cursor) + 1 :] if cursor in run_ids else []
+
+        if limit:
+            runs = runs[:limit]
+
+        return [PipelineRunSummary.from_run(run) for run in runs]
+
     @abstractmethod
     def get_run_by_id(self, run_id):
         '''Get a run by its id.
@@ -236,33 +282,51 @@ RunTagsTable = db.Table(
     db.Column('value', db.String),
 )
 
+db.Index('idx_runs_pipeline_name', RunsTable.c.pipeline_name)
+db.Index('idx_runs_status', RunsTable.c.status)
+db.Index('idx_run_tags_key_value', RunTagsTable.c.key, RunTagsTable.c.value)
+db.Index('idx_run_tags_run_id', RunTagsTable.c.run_id)
+
 create_engine = db.create_engine  # exported
 
 
+def create_run_storage_schema(engine):
+    '''Create the run storage tables if they do not exist, along with any of their indexes which
+    are missing from a database created by an earlier version.'''
+    RunStorageSQLMetadata.create_all(engine)
+
+    inspector = db.inspect(engine)
+    for table in RunStorageSQLMetadata.sorted_tables:
+        index_names = set(index['name'] for index in inspector.get_indexes(table.name))
+        for index in table.indexes:
+            if index.name not in index_names:
+                index.create(engine)
+
+
 class SQLRunStorage(RunStorage):  # pylint: disable=no-init
     @abstractmethod
     def connect(self):
-        ''' context manager yielding a connection '''
+        ''' context manager yielding a connection, which is returned to its pool on exit '''
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
 
-        conn = self.connect()
         runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
             run_id=pipeline_run.run_id,
             pipeline_name=pipeline_run.pipeline_name,
             status=pipeline_run.status.value,
             run_body=serialize_dagster_namedtuple(pipeline_run),
         )
-        conn.execute(runs_insert)
-        if pipeline_run.tags and len(pipeline_run.tags) > 0:
-            conn.execute(
-                RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
-                [
-                    dict(run_id=pipeline_run.run_id, key=k, value=v)
-                    for k, v in pipeline_run.tags.items()
-                ],
-            )
+        with self.connect() as conn:
+            conn.execute(runs_insert)
+            if pipeline_run.tags and len(pipeline_run.tags) > 0:
+                conn.execute(
+                    RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [
+                        dict(run_id=pipeline_run.run_id, key=k, value=v)
+                        for k, v in pipeline_run.tags.items()
+                    ],
+                )
 
         return pipeline_run
 
@@ -279,25 +343,23 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
         if event.event_type not in lookup:
             return
 
-        run = self.get_run_by_id(run_id)
-        if not run:
-            # TODO log?
-            return
-
-        new_pipeline_status = lookup[event.event_type]
-
-        self.connect().execute(
-            RunsTable.update()  # pylint: disable=no-value-for-parameter
-            .where(RunsTable.c.run_id == run_id)
-            .values(
-                status=new_pipeline_status.value,
-                run_body=serialize_dagster_namedtuple(run.run_with_status(new_pipeline_status)),
-                update_timestamp=datetime.now(),
+        # The status column is authoritative, so the run body is left as it was added
+        with self.connect() as conn:
+            conn.execute(
+                RunsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(RunsTable.c.run_id == run_id)
+                .values(status=lookup[event.event_type].value, update_timestamp=datetime.now())
             )
-        )
 
     def _rows_to_runs(self, rows):
-        return list(map(lambda r: deserialize_json_to_dagster_namedtuple(r[0]), rows))
+        '''Deserialize rows of (run_body, status), taking the status of each run from its column.'''
+        runs = []
+        for run_body, status in rows:
+            run = deserialize_json_to_dagster_namedtuple(run_body)
+            if run.status.value != status:
+                run = run._replace(status=PipelineRunStatus(status))
+            runs.append(run)
+        return runs
 
     def _build_query(self, query, cursor, limit):
         ''' Helper function to deal with cursor/limit pagination args '''
@@ -318,8 +380,11 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
         Returns:
             List[PipelineRun]: Tuples of run_id, pipeline_run.
         '''
-        query = self._build_query(db.select([RunsTable.c.run_body]), cursor, limit)
-        rows = self.connect().execute(query).fetchall()
+        query = self._build_query(
+            db.select([RunsTable.c.run_body, RunsTable.c.status]), cursor, limit
+        )
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
         return self._rows_to_runs(rows)
 
     def get_runs_with_pipeline_name(self, pipeline_name, cursor=None, limit=None):
@@ -333,11 +398,12 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
         '''
         check.str_param(pipeline_name, 'pipeline_name')
 
-        base_query = db.select([RunsTable.c.run_body]).where(
+        base_query = db.select([RunsTable.c.run_body, RunsTable.c.status]).where(
             RunsTable.c.pipeline_name == pipeline_name
         )
         query = self._build_query(base_query, cursor, limit)
-        rows = self.connect().execute(query).fetchall()
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
         return self._rows_to_runs(rows)
 
     def get_run_count_with_matching_tags(self, tags):
@@ -361,43 +427,115 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
 
         query = db.select([db.func.count()]).select_from(sub_query)
 
-        rows = self.connect().execute(query).fetchall()
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
 
         count = rows[0][0]
         return count
 
+    def _run_ids_with_matching_tags_query(self, tags):
+        '''A query for the ids of the runs with all of the given tags, served by the index on
+        run_tags (key, value).'''
+        return (
+            db.select([RunTagsTable.c.run_id])
+            .where(
+                db.or_(
+                    *(
+                        db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
+                        for key, value in tags
+                    )
+                )
+            )
+            .group_by(RunTagsTable.c.run_id)
+            .having(db.func.count(RunTagsTable.c.run_id) == len(tags))
+        )
+
     def get_runs_with_matching_tags(self, tags, cursor=None, limit=None):
         check.list_param(tags, 'tags', tuple)
 
-        base_query = db.select([RunsTable.c.run_body]).select_from(
-            RunsTable.outerjoin(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
-        )
-
-        base_query = base_query.where(
-            db.or_(
-                *(
-                    db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
-                    for key, value in tags
-                )
+        base_query = db.select([RunsTable.c.run_body, RunsTable.c.status])
+        if tags:
+            base_query = base_query.where(
+                RunsTable.c.run_id.in_(self._run_ids_with_matching_tags_query(tags))
             )
-        ).group_by(RunsTable.c.run_body, RunsTable.c.id)
-
-        if len(tags) > 0:
-            base_query = base_query.having(db.func.count(RunsTable.c.run_id) == len(tags))
 
         query = self._build_query(base_query, cursor, limit)
-        rows = self.connect().execute(query).fetchall()
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
 
         return self._rows_to_runs(rows)
 
     def get_runs_with_status(self, run_status, cursor=None, limit=None):
         check.inst_param(run_status, 'run_status', PipelineRunStatus)
 
-        base_query = db.select([RunsTable.c.run_body]).where(RunsTable.c.status == run_status.value)
+        base_query = db.select([RunsTable.c.run_body, RunsTable.c.status]).where(
+            RunsTable.c.status == run_status.value
+        )
         query = self._build_query(base_query, cursor, limit)
-        rows = self.connect().execute(query).fetchall()
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
         return self._rows_to_runs(rows)
 
+    def get_run_summaries(
+        self, pipeline_name=None, status=None, tags=None, cursor=None, limit=None
+    ):
+        '''Return compact summaries of the runs matching all of the given filters, most recent
+        first. Summaries are read from the indexed columns of the runs and run_tags tables, so no
+        run bodies are deserialized.'''
+        check.opt_str_param(pipeline_name, 'pipeline_name')
+        check.opt_inst_param(status, 'status', PipelineRunStatus)
+        tags = check.opt_list_param(tags, 'tags', of_type=tuple)
+        check.opt_str_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
+
+        query = db.select(
+            [
+                RunsTable.c.run_id,
+                RunsTable.c.pipeline_name,
+                RunsTable.c.status,
+                RunsTable.c.create_timestamp,
+                RunsTable.c.update_timestamp,
+            ]
+        )
+
+        if pipeline_name is not None:
+            query = query.where(RunsTable.c.pipeline_name == pipeline_name)
+
+        if status is not None:
+            query = query.where(RunsTable.c.status == status.value)
+
+        if tags:
+            query = query.where(
+                RunsTable.c.run_id.in_(self._run_ids_with_matching_tags_query(tags))
+            )
+
+        query = self._build_query(query, cursor, limit)
+
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
+
+            run_tags = defaultdict(dict)
+            if rows:
+                tag_rows = conn.execute(
+                    db.select(
+                        [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+                    ).where(RunTagsTable.c.run_id.in_([row[0] for row in rows]))
+                ).fetchall()
+                for run_id, key, value in tag_rows:
+                    run_tags[run_id][key] = value
+
+        return [
+            PipelineRunSummary(
+                run_id=run_id,
+                pipeline_name=pipeline_name,
+                status=PipelineRunStatus(status),
+                tags=run_tags[run_id],
+                create_timestamp=create_timestamp,
+                update_timestamp=update_timestamp,
+            )
+            for run_id, pipeline_name, status, create_timestamp, update_timestamp in rows
+        ]
+
     def get_run_by_id(self, run_id):
         '''Get a run by its id.
 
@@ -409,14 +547,18 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
         '''
         check.str_param(run_id, 'run_id')
 
-        query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
-        rows = self.connect().execute(query).fetchall()
-        return deserialize_json_to_dagster_namedtuple(rows[0][0]) if len(rows) else None
+        query = db.select([RunsTable.c.run_body, RunsTable.c.status]).where(
+            RunsTable.c.run_id == run_id
+        )
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
+        return self._rows_to_runs(rows)[0] if len(rows) else None
 
     def get_run_tags(self):
         result = dict()
         query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct(RunTagsTable.c.value)
-        rows = self.connect().execute(query).fetchall()
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
         for r in rows:
             if r[0] not in result:
                 result[r[0]] = [r[1]]
@@ -426,15 +568,19 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
 
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
-        return bool(self.get_run_by_id(run_id))
+
+        query = db.select([RunsTable.c.id]).where(RunsTable.c.run_id == run_id)
+        with self.connect() as conn:
+            return conn.execute(query).first() is not None
 
     def delete_run(self, run_id):
         check.str_param(run_id, 'run_id')
         query = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
-        self.connect().execute(query)
+        with self.connect() as conn:
+            conn.execute(query)
 
     def wipe(self):
         '''Clears the run storage.'''
-        conn = self.connect()
-        conn.execute(RunsTable.delete())  # pylint: disable=no-value-for-parameter
-        conn.execute(RunTagsTable.delete())  # pylint: disable=no-value-for-parameter
+        with self.connect() as conn:
+            conn.execute(RunsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(RunTagsTable.delete())  # pylint: disable=no-value-for-parameter
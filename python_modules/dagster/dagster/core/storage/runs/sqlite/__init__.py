@@ -3,4 +3,5 @@ from .sqlite_run_storage import (
     SQLRunStorage,
     SqliteRunStorage,
     create_engine,
+    create_run_storage_schema,
 )
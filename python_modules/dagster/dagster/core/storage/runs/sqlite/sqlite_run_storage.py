@@ -6,7 +6,7 @@ from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.core.types import Field, String
 from dagster.utils import mkdir_p
 
-from ..runs import RunStorageSQLMetadata, SQLRunStorage, create_engine
+from ..runs import RunStorageSQLMetadata, SQLRunStorage, create_engine, create_run_storage_schema
 
 
 class SqliteRunStorage(SQLRunStorage, ConfigurableClass):
@@ -33,7 +33,7 @@ class SqliteRunStorage(SQLRunStorage, ConfigurableClass):
         mkdir_p(base_dir)
         conn_string = 'sqlite:///{}'.format(os.path.join(base_dir, 'runs.db'))
         engine = create_engine(conn_string)
-        RunStorageSQLMetadata.create_all(engine)
+        create_run_storage_schema(engine)
         return SqliteRunStorage(conn_string, inst_data)
 
     def connect(self):
@@ -1,4 +1,4 @@
-from dagster import Field, String
+from dagster import Bool, Field, String
 from dagster.core.definitions.system_storage import SystemStorageData, system_storage
 
 from .file_manager import LocalFileManager
@@ -23,8 +23,22 @@ def mem_system_storage(init_context):
     return create_mem_system_storage_data(init_context)
 
 
+REFERENCE_PREVIOUS_RUN_FIELD = Field(
+    Bool,
+    is_optional=True,
+    default_value=False,
+    description='When re-executing, read intermediates from the previous run instead of copying '
+    'them into this run.',
+)
+
+
 @system_storage(
-    name='filesystem', is_persistent=True, config={'base_dir': Field(String, is_optional=True)}
+    name='filesystem',
+    is_persistent=True,
+    config={
+        'base_dir': Field(String, is_optional=True),
+        'reference_previous_run': REFERENCE_PREVIOUS_RUN_FIELD,
+    },
 )
 def fs_system_storage(init_context):
     override_dir = init_context.system_storage_config.get('base_dir')
@@ -47,7 +61,12 @@ def fs_system_storage(init_context):
 
     return SystemStorageData(
         file_manager=file_manager,
-        intermediates_manager=IntermediateStoreIntermediatesManager(intermediate_store),
+        intermediates_manager=IntermediateStoreIntermediatesManager(
+            intermediate_store,
+            reference_previous_run=init_context.system_storage_config.get(
+                'reference_previous_run', False
+            ),
+        ),
     )
 
 
@@ -100,7 +100,9 @@ class EnvironmentConfig(
         mode = run_config.mode or pipeline.get_default_mode_name()
         environment_type = create_environment_type(pipeline, mode)
 
-        result = evaluate_config(environment_type, environment_dict, pipeline, run_config)
+        result = evaluate_config(
+            environment_type, environment_dict, pipeline, run_config, compiled=True
+        )
 
         if not result.success:
             raise DagsterInvalidConfigError(pipeline, result.errors, environment_dict)
@@ -1 +1,2 @@
 from .evaluation import evaluate_config
+from .incremental import IncrementalEvaluation, evaluate_config_incremental
@@ -0,0 +1,265 @@
+'''A faster path for evaluating config against a ConfigType tree which is evaluated repeatedly.
+
+The tree is compiled once into a closure per config type which validates a value and applies
+defaults without building a TraversalContext or EvaluationStack for each nested value. The
+closures do not describe why a value is invalid: on failure the value is evaluated again by the
+interpreter in evaluation.py, which builds the errors. Config which involves config mapping
+functions is always handed to the interpreter.
+'''
+
+import six
+
+from dagster import check
+from dagster.core.definitions.environment_configs import is_solid_container_config
+from dagster.core.definitions.pipeline import PipelineDefinition
+from dagster.core.definitions.solid import CompositeSolidDefinition
+from dagster.core.execution.config import IRunConfig
+from dagster.core.types.config import ConfigType
+from dagster.utils.lru_cache import LRUCache
+
+from .evaluate_value_result import EvaluateValueResult
+
+COMPILED_EVALUATOR_CACHE_SIZE = 64
+
+# (config_type, pipeline) -> CompiledConfigEvaluator
+_COMPILED_EVALUATOR_CACHE = LRUCache(COMPILED_EVALUATOR_CACHE_SIZE)
+
+
+class _CompiledEvaluationFailed(Exception):
+    '''Raised by compiled evaluation functions when a value must be evaluated by the interpreter,
+    either because it is invalid or because evaluating it involves a config mapping function.'''
+
+
+def _fail(_config_value):
+    raise _CompiledEvaluationFailed()
+
+
+def get_compiled_evaluator(config_type, pipeline=None):
+    '''Return the CompiledConfigEvaluator for a config type, compiling it on first use.'''
+    check.inst_param(config_type, 'config_type', ConfigType)
+    check.opt_inst_param(pipeline, 'pipeline', PipelineDefinition)
+
+    cache_key = (config_type, pipeline)
+    evaluator = _COMPILED_EVALUATOR_CACHE.get(cache_key)
+    if evaluator is None:
+        evaluator = CompiledConfigEvaluator(config_type, pipeline)
+        _COMPILED_EVALUATOR_CACHE.put(cache_key, evaluator)
+
+    return evaluator
+
+
+class CompiledConfigEvaluator(object):
+    '''Evaluates config values against a config type compiled ahead of time.
+
+    Produces the same EvaluateValueResult as evaluate_config.
+
+    Args:
+        config_type (ConfigType): The root of the config type tree to compile.
+        pipeline (Optional[PipelineDefinition]): The pipeline the config type belongs to, used to
+            find composite solids with config mapping functions.
+    '''
+
+    def __init__(self, config_type, pipeline=None):
+        self.config_type = check.inst_param(config_type, 'config_type', ConfigType)
+        self.pipeline = check.opt_inst_param(pipeline, 'pipeline', PipelineDefinition)
+
+        # config_type -> compiled evaluation function, so that types shared across the tree (such
+        # as the config of a solid definition used many times) are only compiled once
+        self._compiled = {}
+        self._evaluate_fn = self._compile(config_type)
+
+    def evaluate(self, config_value, run_config=None):
+        check.opt_inst_param(run_config, 'run_config', IRunConfig)
+
+        try:
+            return EvaluateValueResult.for_value(self._evaluate_fn(config_value))
+        except _CompiledEvaluationFailed:
+            from .evaluation import evaluate_config
+
+            return evaluate_config(self.config_type, config_value, self.pipeline, run_config)
+
+    def _compile(self, config_type):
+        if config_type not in self._compiled:
+            self._compiled[config_type] = self._compile_type(config_type)
+        return self._compiled[config_type]
+
+    def _compile_type(self, config_type):
+        # Dispatch in the same order as _evaluate_config
+        if config_type.is_scalar:
+            return _compile_scalar(config_type)
+        elif config_type.is_any:
+            return lambda config_value: config_value
+        elif config_type.is_selector:
+            return self._compile_selector(config_type)
+        elif config_type.is_composite:
+            return self._compile_composite(config_type)
+        elif config_type.is_list:
+            return _compile_list(self._compile(config_type.inner_type))
+        elif config_type.is_set:
+            return _compile_set(self._compile(config_type.inner_type))
+        elif config_type.is_tuple:
+            return _compile_tuple([self._compile(ttype) for ttype in config_type.tuple_types])
+        elif config_type.is_nullable:
+            return _compile_nullable(self._compile(config_type.inner_type))
+        elif config_type.is_enum:
+            return _compile_enum(config_type)
+        else:
+            check.failed('Unsupported type {name}'.format(name=config_type.name))
+
+    def _has_config_mapping(self, config_type):
+        if not is_solid_container_config(config_type) or not config_type.handle:
+            return False
+
+        # The interpreter requires the pipeline to check for config mapping functions
+        if self.pipeline is None:
+            return True
+
+        solid_def = self.pipeline.get_solid(config_type.handle).definition
+        return (
+            isinstance(solid_def, CompositeSolidDefinition)
+            and solid_def.has_descendant_config_mapping
+        )
+
+    def _compile_selector(self, config_type):
+        fields = {
+            field_name: self._compile(field_def.config_type)
+            for field_name, field_def in config_type.fields.items()
+        }
+
+        if len(config_type.fields) == 1:
+            ((default_field_name, default_field_def),) = config_type.fields.items()
+        else:
+            default_field_name, default_field_def = None, None
+
+        def _evaluate_selector(config_value):
+            if config_value:
+                if not isinstance(config_value, dict) or len(config_value) > 1:
+                    raise _CompiledEvaluationFailed()
+
+                ((field_name, field_value),) = config_value.items()
+                if field_name not in fields:
+                    raise _CompiledEvaluationFailed()
+
+                return {field_name: fields[field_name](field_value)}
+
+            if default_field_def is None or not default_field_def.is_optional:
+                raise _CompiledEvaluationFailed()
+
+            return {
+                default_field_name: fields[default_field_name](
+                    default_field_def.default_value if default_field_def.default_provided else None
+                )
+            }
+
+        return _evaluate_selector
+
+    def _compile_composite(self, config_type):
+        if self._has_config_mapping(config_type):
+            return _fail
+
+        # Each entry is (field_name, evaluate_fn, is_optional, has_default, default_value,
+        # has_config_mapping)
+        fields = [
+            (
+                field_name,
+                self._compile(field_def.config_type),
+                field_def.is_optional,
+                field_def.default_provided,
+                field_def.default_value if field_def.default_provided else None,
+                self._has_config_mapping(field_def.config_type),
+            )
+            for field_name, field_def in config_type.fields.items()
+        ]
+        field_names = frozenset(config_type.fields.keys())
+        is_permissive = config_type.is_permissive_composite
+
+        def _evaluate_composite(config_value):
+            if config_value is None:
+                config_value = {}
+            elif not isinstance(config_value, dict):
+                raise _CompiledEvaluationFailed()
+
+            output_config_value = {}
+
+            for key in config_value:
+                if key not in field_names:
+                    if not is_permissive or not isinstance(key, six.string_types):
+                        raise _CompiledEvaluationFailed()
+                    output_config_value[key] = config_value[key]
+
+            for (
+                field_name,
+                evaluate_fn,
+                is_optional,
+                has_default,
+                default_value,
+                has_config_mapping,
+            ) in fields:
+                if field_name in config_value:
+                    output_config_value[field_name] = evaluate_fn(config_value[field_name])
+                elif not is_optional or has_config_mapping:
+                    raise _CompiledEvaluationFailed()
+                elif has_default:
+                    output_config_value[field_name] = default_value
+
+            return output_config_value
+
+        return _evaluate_composite
+
+
+def _compile_scalar(config_type):
+    is_valid = config_type.is_config_scalar_valid
+
+    def _evaluate_scalar(config_value):
+        if not is_valid(config_value):
+            raise _CompiledEvaluationFailed()
+        return config_value
+
+    return _evaluate_scalar
+
+
+def _compile_enum(config_type):
+    def _evaluate_enum(config_value):
+        if not isinstance(
+            config_value, six.string_types
+        ) or not config_type.is_valid_config_enum_value(config_value):
+            raise _CompiledEvaluationFailed()
+        return config_type.to_python_value(config_value)
+
+    return _evaluate_enum
+
+
+def _compile_list(evaluate_item):
+    def _evaluate_list(config_value):
+        if not isinstance(config_value, list):
+            raise _CompiledEvaluationFailed()
+        return [evaluate_item(item) for item in config_value]
+
+    return _evaluate_list
+
+
+def _compile_set(evaluate_item):
+    def _evaluate_set(config_value):
+        if not isinstance(config_value, list):
+            raise _CompiledEvaluationFailed()
+        return set(evaluate_item(item) for item in config_value)
+
+    return _evaluate_set
+
+
+def _compile_tuple(evaluate_items):
+    def _evaluate_tuple(config_value):
+        if not isinstance(config_value, list) or len(config_value) != len(evaluate_items):
+            raise _CompiledEvaluationFailed()
+        return [evaluate_item(item) for evaluate_item, item in zip(evaluate_items, config_value)]
+
+    return _evaluate_tuple
+
+
+def _compile_nullable(evaluate_inner):
+    def _evaluate_nullable(config_value):
+        if config_value is None:
+            return None
+        return evaluate_inner(config_value)
+
+    return _evaluate_nullable
@@ -36,7 +36,21 @@ from .stack import EvaluationStack, get_friendly_path_msg
 from .traversal_context import TraversalContext
 
 
-def evaluate_config(config_type, config_value, pipeline=None, run_config=None, seen_handles=None):
+def evaluate_config(
+    config_type, config_value, pipeline=None, run_config=None, seen_handles=None, compiled=False
+):
+    '''Evaluate a config value against a config type, applying defaults.
+
+    When compiled is set, the config type is compiled once into validation functions which are
+    reused by later calls, and the value is only traversed by the interpreter below if it turns
+    out to be invalid. This is faster for config types which are evaluated repeatedly, such as
+    the environment types of large pipelines.
+    '''
+    if compiled and not seen_handles:
+        from .compiled import get_compiled_evaluator
+
+        return get_compiled_evaluator(config_type, pipeline).evaluate(config_value, run_config)
+
     return _evaluate_config(
         TraversalContext(
             config_type=check.inst_param(config_type, 'config_type', ConfigType),
@@ -150,9 +164,20 @@ def evaluate_selector_config(context):
 ## Composites
 
 
-def evaluate_composite_config(context):
+def evaluate_composite_config(context, field_results=None):
+    '''Evaluate a composite config value.
+
+    Args:
+        context (TraversalContext)
+        field_results (Optional[Dict[str, EvaluateValueResult]]): Results to use for fields present
+            in the config value instead of evaluating them, as when they are known to be unchanged
+            since an earlier evaluation.
+    '''
     check.inst_param(context, 'context', TraversalContext)
     check.param_invariant(context.config_type.is_composite, 'composite_type')
+    check.opt_dict_param(
+        field_results, 'field_results', key_type=str, value_type=EvaluateValueResult
+    )
 
     fields = context.config_type.fields
 
@@ -194,9 +219,12 @@ def evaluate_composite_config(context):
 
     for key, field_def in fields.items():
         if key in incoming_fields:
-            evaluate_value_result = _evaluate_config(
-                context.for_field(field_def, key, context.config_value[key])
-            )
+            if field_results and key in field_results:
+                evaluate_value_result = field_results[key]
+            else:
+                evaluate_value_result = _evaluate_config(
+                    context.for_field(field_def, key, context.config_value[key])
+                )
             if evaluate_value_result.errors:
                 errors += evaluate_value_result.errors
             else:
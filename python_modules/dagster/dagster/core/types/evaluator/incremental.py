@@ -0,0 +1,177 @@
+'''Re-evaluation of environment config in which only the branches that changed are re-evaluated.
+
+The solids and resources of large pipelines make up most of their environment config, and an
+edit usually touches only one of them. Evaluating config incrementally keeps the result for each
+solids.<name> and resources.<name> branch, and the next evaluation reuses the results of the
+branches whose values are unchanged rather than traversing them again.
+'''
+
+import copy
+from collections import namedtuple
+
+from dagster import check
+from dagster.core.definitions.pipeline import PipelineDefinition
+from dagster.core.execution.config import IRunConfig, RunConfig
+from dagster.core.types.config import ConfigType
+
+from .evaluate_value_result import EvaluateValueResult
+from .evaluation import _evaluate_config, evaluate_composite_config
+from .stack import EvaluationStack
+from .traversal_context import TraversalContext
+
+INCREMENTAL_BRANCH_FIELDS = ('solids', 'resources')
+'''The fields of the environment config whose entries are evaluated and kept as branches.'''
+
+
+class ConfigBranchResult(namedtuple('_ConfigBranchResult', 'config_value result')):
+    def __new__(cls, config_value, result):
+        return super(ConfigBranchResult, cls).__new__(
+            cls, config_value, check.inst_param(result, 'result', EvaluateValueResult)
+        )
+
+
+class IncrementalEvaluation(namedtuple('_IncrementalEvaluation', 'result branch_results')):
+    '''The result of evaluating config incrementally.
+
+    Attributes:
+        result (EvaluateValueResult): The result of evaluating the whole config value, identical to
+            that of evaluate_config.
+        branch_results (Dict[Tuple[str, str], ConfigBranchResult]): The config value and result of
+            each branch, keyed by path, e.g. ('solids', 'a_solid'). Pass this object as
+            previous_evaluation to the next call to evaluate_config_incremental.
+    '''
+
+    def __new__(cls, result, branch_results):
+        return super(IncrementalEvaluation, cls).__new__(
+            cls,
+            check.inst_param(result, 'result', EvaluateValueResult),
+            check.dict_param(
+                branch_results, 'branch_results', key_type=tuple, value_type=ConfigBranchResult
+            ),
+        )
+
+
+def _is_on_changed_path(branch_path, changed_path):
+    if changed_path is None:
+        return False
+
+    # Either the change is within the branch, or the branch is within the change
+    length = min(len(branch_path), len(changed_path))
+    return tuple(changed_path[:length]) == branch_path[:length]
+
+
+def _is_unchanged(previous_value, value):
+    # Values must also have the same types, since e.g. 1 == 1.0 == True but they are not all valid
+    # for the same config types
+    if type(previous_value) is not type(value):  # pylint: disable=unidiomatic-typecheck
+        return False
+
+    if isinstance(value, dict):
+        return len(previous_value) == len(value) and all(
+            key in previous_value and _is_unchanged(previous_value[key], item)
+            for key, item in value.items()
+        )
+
+    if isinstance(value, list):
+        return len(previous_value) == len(value) and all(
+            _is_unchanged(previous_item, item) for previous_item, item in zip(previous_value, value)
+        )
+
+    try:
+        return bool(previous_value == value)
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+
+def evaluate_config_incremental(
+    config_type,
+    config_value,
+    previous_evaluation=None,
+    changed_path=None,
+    pipeline=None,
+    run_config=None,
+):
+    '''Evaluate an environment config value, reusing the results of an earlier evaluation for the
+    solids.<name> and resources.<name> branches which have not changed since.
+
+    A branch is re-evaluated if it lies on changed_path or if its value differs from the value it
+    had in previous_evaluation, so a stale changed_path cannot produce a stale result.
+
+    Args:
+        config_type (ConfigType): The environment config type.
+        config_value (Any): The environment config value.
+        previous_evaluation (Optional[IncrementalEvaluation]): The result of the last call.
+        changed_path (Optional[List[str]]): The path of the subtree that changed since
+            previous_evaluation, e.g. ['solids', 'a_solid', 'config'].
+        pipeline (Optional[PipelineDefinition]): The pipeline the config type belongs to.
+        run_config (Optional[IRunConfig]): As for evaluate_config.
+
+    Returns:
+        IncrementalEvaluation
+    '''
+    check.inst_param(config_type, 'config_type', ConfigType)
+    check.opt_inst_param(previous_evaluation, 'previous_evaluation', IncrementalEvaluation)
+    check.opt_list_param(changed_path, 'changed_path', of_type=str)
+
+    context = TraversalContext(
+        config_type=config_type,
+        config_value=config_value,
+        stack=EvaluationStack(config_type=config_type, entries=[]),
+        pipeline=check.opt_inst_param(pipeline, 'pipeline', PipelineDefinition),
+        run_config=check.opt_inst_param(run_config, 'run_config', IRunConfig, default=RunConfig()),
+    )
+
+    if not config_type.is_composite or not isinstance(config_value, dict):
+        return IncrementalEvaluation(_evaluate_config(context), {})
+
+    previous_branch_results = previous_evaluation.branch_results if previous_evaluation else {}
+    branch_results = {}
+    field_results = {}
+
+    for field_name in INCREMENTAL_BRANCH_FIELDS:
+        field_def = config_type.fields.get(field_name)
+        field_value = config_value.get(field_name)
+        if field_def is None or not field_def.config_type.is_composite:
+            continue
+        if not isinstance(field_value, dict):
+            continue
+
+        field_context = context.for_field(field_def, field_name, field_value)
+        child_results = {}
+
+        for child_name, child_field_def in field_def.config_type.fields.items():
+            if child_name not in field_value:
+                continue
+
+            branch_path = (field_name, child_name)
+            child_value = field_value[child_name]
+            previous_branch_result = previous_branch_results.get(branch_path)
+
+            if (
+                previous_branch_result is not None
+                and not _is_on_changed_path(branch_path, changed_path)
+                and _is_unchanged(previous_branch_result.config_value, child_value)
+            ):
+                branch_results[branch_path] = previous_branch_result
+                child_results[child_name] = previous_branch_result.result
+                continue
+
+            result = _evaluate_config(
+                field_context.for_field(child_field_def, child_name, child_value)
+            )
+            child_results[child_name] = result
+
+            # Keep a copy, so that the comparison above is not defeated by the caller mutating the
+            # config value in place. Values which cannot be copied are never reused.
+            try:
+                branch_results[branch_path] = ConfigBranchResult(copy.deepcopy(child_value), result)
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+        field_results[field_name] = evaluate_composite_config(
+            field_context, field_results=child_results
+        )
+
+    return IncrementalEvaluation(
+        evaluate_composite_config(context, field_results=field_results), branch_results
+    )
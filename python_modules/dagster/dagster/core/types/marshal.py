@@ -1,4 +1,6 @@
+import io
 import pickle
+import zlib
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -52,11 +54,98 @@ class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-
 
 
 class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
-    def __init__(self, name='pickle'):
+    '''Serializes objects with pickle.
+
+    Args:
+        name (Optional[str]): The name of the strategy. (default: 'pickle')
+        protocol (Optional[int]): The pickle protocol. Protocols above the default may not be
+            readable by every Python version which reads the objects. (default: 2)
+    '''
+
+    def __init__(self, name='pickle', protocol=PICKLE_PROTOCOL):
+        self._protocol = check.int_param(protocol, 'protocol')
         super(PickleSerializationStrategy, self).__init__(name)
 
     def serialize(self, value, write_file_obj):
-        pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+        pickle.dump(value, write_file_obj, self._protocol)
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+class CompressedPickleSerializationStrategy(PickleSerializationStrategy):  # pylint: disable=no-init
+    '''Serializes objects with pickle, compressed with zlib as they are written, and decompressed
+    as they are read.
+
+    Args:
+        name (Optional[str]): The name of the strategy. (default: 'compressed_pickle')
+        protocol (Optional[int]): As for PickleSerializationStrategy. (default: 2)
+        compression_level (Optional[int]): From 1 (fastest) to 9 (smallest). (default: 1)
+    '''
+
+    def __init__(self, name='compressed_pickle', protocol=PICKLE_PROTOCOL, compression_level=1):
+        self._compression_level = check.int_param(compression_level, 'compression_level')
+        check.param_invariant(
+            1 <= compression_level <= 9, 'compression_level', 'must be between 1 and 9'
+        )
+        super(CompressedPickleSerializationStrategy, self).__init__(name, protocol=protocol)
+
+    def serialize(self, value, write_file_obj):
+        writer = _ZlibWriter(write_file_obj, self._compression_level)
+        super(CompressedPickleSerializationStrategy, self).serialize(value, writer)
+        writer.finish()
+
+    def deserialize(self, read_file_obj):
+        with io.BufferedReader(_ZlibReader(read_file_obj)) as reader:
+            return super(CompressedPickleSerializationStrategy, self).deserialize(reader)
+
+
+class _ZlibWriter(object):
+    '''Compresses what is written to it into an underlying file object.'''
+
+    def __init__(self, file_obj, compression_level):
+        self._file_obj = file_obj
+        self._compressor = zlib.compressobj(compression_level)
+
+    def write(self, b):
+        self._file_obj.write(self._compressor.compress(b))
+
+    def finish(self):
+        self._file_obj.write(self._compressor.flush())
+
+
+class _ZlibReader(io.RawIOBase):
+    '''Decompresses what is read from an underlying file object, a chunk at a time.'''
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file_obj):
+        super(_ZlibReader, self).__init__()
+        self._file_obj = file_obj
+        self._decompressor = zlib.decompressobj()
+        self._buffer = b''
+        self._offset = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._offset == len(self._buffer) and not self._eof:
+            # Decompress at most a chunk at a time, so that a highly compressed chunk is never
+            # decompressed into memory at once
+            data = self._decompressor.unconsumed_tail
+            if not data:
+                data = self._file_obj.read(self.CHUNK_SIZE)
+
+            if data:
+                self._buffer = self._decompressor.decompress(data, self.CHUNK_SIZE)
+            else:
+                self._buffer = self._decompressor.flush()
+                self._eof = True
+            self._offset = 0
+
+        num_bytes = min(len(b), len(self._buffer) - self._offset)
+        b[:num_bytes] = self._buffer[self._offset : self._offset + num_bytes]
+        self._offset += num_bytes
+        return num_bytes
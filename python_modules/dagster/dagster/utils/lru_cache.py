@@ -0,0 +1,52 @@
+import threading
+from collections import OrderedDict
+
+from dagster import check
+
+
+class LRUCache(object):
+    '''A thread-safe mapping which holds at most max_size entries, evicting the least recently
+    used entry when full.
+
+    Args:
+        max_size (int): The maximum number of entries to hold.
+    '''
+
+    def __init__(self, max_size):
+        self._max_size = check.int_param(max_size, 'max_size')
+        check.param_invariant(max_size > 0, 'max_size', 'must be positive')
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            # Re-insert the entry to mark it as the most recently used
+            value = self._entries.pop(key)
+            self._entries[key] = value
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -9,10 +9,19 @@ snapshots = Snapshot()
 snapshots['test_basic_solids_config 1'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'release_intermediates': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'forward_events': True,
+                'max_concurrent': 0,
+                'release_intermediates': True,
+                'worker_pool': {
+                    'max_memory_mb': 0,
+                    'max_steps_per_worker': 0
+                }
             }
         }
     },
@@ -36,7 +45,8 @@ snapshots['test_basic_solids_config 1'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'reference_previous_run': True
             }
         },
         'in_memory': {
@@ -57,10 +67,19 @@ snapshots['test_two_modes 1'] = {
 snapshots['test_two_modes 2'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'release_intermediates': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'forward_events': True,
+                'max_concurrent': 0,
+                'release_intermediates': True,
+                'worker_pool': {
+                    'max_memory_mb': 0,
+                    'max_steps_per_worker': 0
+                }
             }
         }
     },
@@ -84,7 +103,8 @@ snapshots['test_two_modes 2'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'reference_previous_run': True
             }
         },
         'in_memory': {
@@ -105,10 +125,19 @@ snapshots['test_two_modes 3'] = {
 snapshots['test_two_modes 4'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'release_intermediates': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'forward_events': True,
+                'max_concurrent': 0,
+                'release_intermediates': True,
+                'worker_pool': {
+                    'max_memory_mb': 0,
+                    'max_steps_per_worker': 0
+                }
             }
         }
     },
@@ -132,7 +161,8 @@ snapshots['test_two_modes 4'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'reference_previous_run': True
             }
         },
         'in_memory': {
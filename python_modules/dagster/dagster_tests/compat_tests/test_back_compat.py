@@ -1,13 +1,22 @@
-from dagster import file_relative_path
+import os
+import shutil
+
+from dagster import file_relative_path, seven
 from dagster.core.instance import DagsterInstance, InstanceRef
 
 
 # test that we can load runs and events from an old instance
 def test_0_6_4():
-    instance = DagsterInstance.from_ref(
-        InstanceRef.from_dir(file_relative_path(__file__, 'snapshot_0_6_4'))
-    )
+    with seven.TemporaryDirectory() as tempdir:
+        # loading the instance migrates its storage, so work on a copy of the snapshot
+        instance_dir = os.path.join(tempdir, 'snapshot_0_6_4')
+        shutil.copytree(file_relative_path(__file__, 'snapshot_0_6_4'), instance_dir)
+        instance = DagsterInstance.from_ref(InstanceRef.from_dir(instance_dir))
+
+        runs = instance.all_runs()
+        for run in runs:
+            instance.all_logs(run.run_id)
 
-    runs = instance.all_runs()
-    for run in runs:
-        instance.all_logs(run.run_id)
+        assert [summary.run_id for summary in instance.get_run_summaries()] == [
+            run.run_id for run in runs
+        ]
@@ -8,8 +8,12 @@ from dagster.core.engine.child_process_executor import (
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventMultiplexer,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessTaskDoneEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
     execute_child_process_command,
 )
 
@@ -26,6 +30,37 @@ class AnError(Exception):
     pass
 
 
+class SleepyCommand(ChildProcessCommand):
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield 'slept'
+
+
+class ChattyCommand(ChildProcessCommand):
+    def __init__(self, num_events):
+        self.num_events = num_events
+
+    def execute(self):
+        for i in range(self.num_events):
+            yield i
+
+
+class PidWorkerCommand(ChildProcessWorkerCommand):  # pylint: disable=no-init
+    def setup(self):
+        pass
+
+    def execute_task(self, task):
+        if task == 'crash':
+            # access inner API to simulate hard crash
+            os._exit(1)  # pylint: disable=protected-access
+        if task == 'error':
+            raise AnError('Oh noes!')
+        yield (task, os.getpid())
+
+
 class ThrowAnErrorCommand(ChildProcessCommand):  # pylint: disable=no-init
     def execute(self):
         raise AnError('Oh noes!')
@@ -87,3 +122,130 @@ def test_child_process_crashy_process():
 @pytest.mark.skip('too long')
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
+
+
+def _execute_multiplexed(commands):
+    '''Drive several child process commands concurrently the same way the multiprocess engine
+    does, returning (time received, event) pairs for each command.'''
+    multiplexer = ChildProcessEventMultiplexer()
+    active_iters = {
+        i: execute_child_process_command(command, multiplexer) for i, command in enumerate(commands)
+    }
+    received = {i: [] for i in active_iters}
+
+    while active_iters:
+        made_progress = False
+        for i, command_iter in list(active_iters.items()):
+            try:
+                event = next(command_iter)
+                if event is not None:
+                    made_progress = True
+                    received[i].append((time.time(), event))
+            except StopIteration:
+                made_progress = True
+                del active_iters[i]
+
+        if active_iters and not made_progress:
+            multiplexer.wait(timeout=1.0)
+
+    return [received[i] for i in range(len(commands))]
+
+
+def test_multiplexed_child_process_commands():
+    results = _execute_multiplexed([DoubleAStringChildProcessCommand('aa'), ChattyCommand(3)])
+
+    assert [event for _, event in results[0] if not isinstance(event, ChildProcessEvent)] == [
+        'aaaa'
+    ]
+    assert [event for _, event in results[1] if not isinstance(event, ChildProcessEvent)] == [
+        0,
+        1,
+        2,
+    ]
+    for events in results:
+        assert isinstance(events[0][1], ChildProcessStartEvent)
+        assert isinstance(events[-1][1], ChildProcessDoneEvent)
+
+
+def test_multiplexed_crashy_process():
+    with pytest.raises(ChildProcessCrashException):
+        _execute_multiplexed([CrashyCommand()])
+
+
+def test_multiplexed_idle_children_do_not_delay_busy_child():
+    num_events = 100
+    results = _execute_multiplexed([SleepyCommand(3.0)] * 4 + [ChattyCommand(num_events)])
+
+    chatty_events = results[-1]
+    assert len(chatty_events) == num_events + 2
+
+    # Polling each idle child for a 20ms tick in turn would take at least
+    # 100 events * 4 idle children * 20ms = 8s to drain the busy child
+    start_time, done_time = chatty_events[0][0], chatty_events[-1][0]
+    assert done_time - start_time < 2.0
+
+
+@pytest.mark.skip('too long')
+def test_benchmark_multiplexed_noop_commands():
+    num_commands = 32
+    results = _execute_multiplexed([ChattyCommand(0)] * num_commands)
+
+    assert len(results) == num_commands
+    for events in results:
+        assert isinstance(events[0][1], ChildProcessStartEvent)
+        assert isinstance(events[-1][1], ChildProcessDoneEvent)
+
+
+def _task_results(worker, task):
+    return [x for x in worker.execute_task(task) if x and not isinstance(x, ChildProcessEvent)]
+
+
+def test_child_process_worker():
+    worker = ChildProcessWorker(PidWorkerCommand())
+    try:
+        [(_, first_pid)] = _task_results(worker, 'one')
+        [(_, second_pid)] = _task_results(worker, 'two')
+        assert first_pid == second_pid
+        assert first_pid != os.getpid()
+        assert not worker.is_retired
+    finally:
+        worker.shutdown()
+    assert worker.is_retired
+
+
+def test_child_process_worker_retires_after_max_tasks():
+    worker = ChildProcessWorker(PidWorkerCommand(), max_tasks=2)
+    try:
+        events = list(filter(lambda x: x, worker.execute_task('one')))
+        assert isinstance(events[0], ChildProcessStartEvent)
+        assert events[-1] == ChildProcessTaskDoneEvent(pid=events[0].pid, retiring=False)
+        assert not worker.is_retired
+
+        events = list(filter(lambda x: x, worker.execute_task('two')))
+        assert events[-1] == ChildProcessTaskDoneEvent(pid=events[0][1], retiring=True)
+        assert worker.is_retired
+    finally:
+        worker.shutdown()
+
+
+def test_child_process_worker_uncaught_exception():
+    worker = ChildProcessWorker(PidWorkerCommand())
+    try:
+        results = [
+            x for x in worker.execute_task('error') if isinstance(x, ChildProcessSystemErrorEvent)
+        ]
+        assert len(results) == 1
+        assert 'AnError' in str(results[0].error_info.message)
+        assert worker.is_retired
+    finally:
+        worker.shutdown()
+
+
+def test_child_process_worker_crash():
+    worker = ChildProcessWorker(PidWorkerCommand())
+    try:
+        with pytest.raises(ChildProcessCrashException):
+            list(worker.execute_task('crash'))
+        assert worker.is_retired
+    finally:
+        worker.shutdown()
@@ -1,11 +1,21 @@
+import os
+import time
+
 from dagster import (
     DependencyDefinition,
     ExecutionTargetHandle,
     InputDefinition,
     PipelineDefinition,
+    SolidInvocation,
     execute_pipeline,
     lambda_solid,
 )
+from dagster.core.engine.engine_multiprocess import (
+    ChildProcessDagsterEventSummary,
+    child_process_dagster_event,
+)
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.instance import DagsterInstance
 
 
@@ -117,3 +127,194 @@ def test_invalid_instance():
     assert not result.success
     assert len(result.event_list) == 1
     assert result.event_list[0].is_failure
+
+
+def define_uneven_pipeline():
+    @lambda_solid
+    def slow():
+        time.sleep(2)
+        return 1
+
+    @lambda_solid
+    def fast():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def after_fast(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='uneven_execution',
+        solid_defs=[slow, fast, after_fast],
+        dependencies={'after_fast': {'num': DependencyDefinition('fast')}},
+    )
+
+
+def test_uneven_multi_execution_does_not_wait_for_level():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_uneven_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 2}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+
+    event_keys = [(event.event_type_value, event.step_key) for event in result.event_list]
+
+    # after_fast is launched as soon as fast is done, without waiting on slow
+    assert event_keys.index(('STEP_START', 'after_fast.compute')) < event_keys.index(
+        ('STEP_SUCCESS', 'slow.compute')
+    )
+
+
+def define_pid_chain_pipeline():
+    @lambda_solid
+    def first_pid():
+        return [os.getpid()]
+
+    @lambda_solid(input_defs=[InputDefinition('pids')])
+    def append_pid(pids):
+        return pids + [os.getpid()]
+
+    return PipelineDefinition(
+        name='pid_chain',
+        solid_defs=[first_pid, append_pid],
+        dependencies={
+            SolidInvocation('append_pid', 'append_one'): {
+                'pids': DependencyDefinition('first_pid')
+            },
+            SolidInvocation('append_pid', 'append_two'): {
+                'pids': DependencyDefinition('append_one')
+            },
+            SolidInvocation('append_pid', 'append_three'): {
+                'pids': DependencyDefinition('append_two')
+            },
+        },
+    )
+
+
+def test_worker_pool_execution():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(
+            define_pid_chain_pipeline
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'worker_pool': {}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+
+    # a single warm worker executed every step
+    pids = result.result_for_solid('append_three').output_value()
+    assert len(pids) == 4
+    assert len(set(pids)) == 1
+    assert os.getpid() not in pids
+
+
+def test_worker_pool_recycles_workers():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(
+            define_pid_chain_pipeline
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'worker_pool': {'max_steps_per_worker': 2}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+
+    pids = result.result_for_solid('append_three').output_value()
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+
+
+def test_diamond_worker_pool_execution():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 2, 'worker_pool': {}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+
+def test_error_pipeline_worker_pool():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_error_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'worker_pool': {}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert not result.success
+
+
+def test_child_process_dagster_event():
+    event = DagsterEvent(
+        DagsterEventType.STEP_START.value, 'a_pipeline', step_key='a_step.compute', message='hi'
+    )
+
+    # Forwarded events are sent as they are, without pickling them twice
+    assert child_process_dagster_event(event) is event
+
+    summary = child_process_dagster_event(event, forward_events=False)
+    assert isinstance(summary, ChildProcessDagsterEventSummary)
+    assert summary.event_type == DagsterEventType.STEP_START
+    assert summary.step_key == 'a_step.compute'
+
+    failure = DagsterEvent(
+        DagsterEventType.STEP_FAILURE.value,
+        'a_pipeline',
+        step_key='a_step.compute',
+        event_specific_data=StepFailureData(error=None, user_failure_data=None),
+    )
+    assert child_process_dagster_event(failure, forward_events=False) is failure
+
+
+def test_diamond_multi_execution_without_forwarding_events():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'forward_events': False}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+    assert not [event for event in result.event_list if event.step_key is not None]
+
+    step_success_keys = set(
+        record.dagster_event.step_key
+        for record in instance.all_logs(result.run_id)
+        if record.is_dagster_event and record.dagster_event.is_step_success
+    )
+    assert step_success_keys == set(
+        ['return_two.compute', 'add_three.compute', 'mult_three.compute', 'adder.compute']
+    )
+
+
+def test_error_pipeline_multiprocess_without_forwarding_events():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_error_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'forward_events': False, 'worker_pool': {}}}},
+        },
+        instance=DagsterInstance.local_temp(),
+        raise_on_error=False,
+    )
+    assert not result.success
+    assert [event.step_key for event in result.event_list if event.is_step_failure] == [
+        'throw_error.compute'
+    ]
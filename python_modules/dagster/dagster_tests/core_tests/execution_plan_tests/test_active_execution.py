@@ -0,0 +1,93 @@
+import pytest
+
+from dagster import check
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.objects import StepOutputHandle
+
+from ..engine_tests.test_multiprocessing import define_diamond_pipeline
+
+
+def test_active_execution_diamond():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['return_two.compute']
+    assert active_execution.get_steps_to_execute() == []
+
+    active_execution.mark_complete('return_two.compute')
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['add_three.compute', 'mult_three.compute']
+
+    # adder only becomes ready once both of its upstream steps are done
+    active_execution.mark_complete('mult_three.compute')
+    assert active_execution.get_steps_to_execute() == []
+    assert active_execution.in_flight_step_keys == {'add_three.compute'}
+
+    active_execution.mark_complete('add_three.compute')
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['adder.compute']
+    assert not active_execution.is_complete
+
+    active_execution.mark_complete('adder.compute')
+    assert active_execution.is_complete
+
+
+def test_active_execution_limit():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+    active_execution.mark_complete(active_execution.get_steps_to_execute()[0].key)
+
+    steps = active_execution.get_steps_to_execute(limit=1)
+    assert [step.key for step in steps] == ['add_three.compute']
+
+    steps = active_execution.get_steps_to_execute(limit=1)
+    assert [step.key for step in steps] == ['mult_three.compute']
+
+
+def test_active_execution_subset():
+    execution_plan = create_execution_plan(define_diamond_pipeline()).build_subset_plan(
+        ['add_three.compute', 'adder.compute']
+    )
+    active_execution = ActiveExecution(execution_plan)
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['add_three.compute']
+    active_execution.mark_complete('add_three.compute')
+
+    steps = active_execution.get_steps_to_execute()
+    assert [step.key for step in steps] == ['adder.compute']
+    active_execution.mark_complete('adder.compute')
+    assert active_execution.is_complete
+
+
+def test_active_execution_complete_not_in_flight():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+
+    with pytest.raises(check.CheckError):
+        active_execution.mark_complete('adder.compute')
+
+
+def test_active_execution_releasable_output_handles():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+
+    active_execution.mark_complete(active_execution.get_steps_to_execute()[0].key)
+    assert active_execution.pop_releasable_output_handles() == []
+
+    active_execution.get_steps_to_execute()
+    active_execution.mark_complete('add_three.compute')
+    # still needed by mult_three
+    assert active_execution.pop_releasable_output_handles() == []
+
+    active_execution.mark_complete('mult_three.compute')
+    assert active_execution.pop_releasable_output_handles() == [
+        StepOutputHandle('return_two.compute', 'result')
+    ]
+    assert active_execution.pop_releasable_output_handles() == []
+
+    active_execution.mark_complete(active_execution.get_steps_to_execute()[0].key)
+    # the output of adder is not consumed within the plan, so is never released
+    assert active_execution.pop_releasable_output_handles() == [
+        StepOutputHandle('add_three.compute', 'result'),
+        StepOutputHandle('mult_three.compute', 'result'),
+    ]
@@ -1,7 +1,9 @@
 import pytest
 
+from dagster import RunConfig
+from dagster.core.definitions import create_environment_schema
 from dagster.core.errors import DagsterInvalidConfigError
-from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.api import clear_pipeline_caches, create_execution_plan
 
 from ..engine_tests.test_multiprocessing import define_diamond_pipeline
 
@@ -23,3 +25,34 @@ def test_create_execution_plan_with_bad_inputs():
         create_execution_plan(
             define_diamond_pipeline(), {'solids': {'add_three': {'inputs': {'num': 3}}}}
         )
+
+
+def test_create_execution_plan_is_cached():
+    pipeline = define_diamond_pipeline()
+
+    plan = create_execution_plan(pipeline, {'solids': {}}, RunConfig())
+    assert create_execution_plan(pipeline, {'solids': {}}, RunConfig()) is plan
+
+    # The cache is keyed by pipeline identity, config and the parts of the run config which
+    # change the plan
+    assert create_execution_plan(define_diamond_pipeline(), {'solids': {}}) is not plan
+    assert create_execution_plan(pipeline, {}) is not plan
+    subset_plan = create_execution_plan(
+        pipeline, {'solids': {}}, RunConfig(step_keys_to_execute=['adder.compute'])
+    )
+    assert subset_plan is not plan
+    assert subset_plan.step_keys_to_execute == ['adder.compute']
+
+    clear_pipeline_caches()
+    assert create_execution_plan(pipeline, {'solids': {}}, RunConfig()) is not plan
+
+
+def test_create_environment_schema_is_cached():
+    pipeline = define_diamond_pipeline()
+
+    environment_schema = create_environment_schema(pipeline)
+    assert create_environment_schema(pipeline) is environment_schema
+    assert create_environment_schema(define_diamond_pipeline()) is not environment_schema
+
+    clear_pipeline_caches()
+    assert create_environment_schema(pipeline) is not environment_schema
@@ -105,3 +105,24 @@ def test_execution_plan_for_composite_solid_with_config_mapping():
         'STEP_SUCCESS',
         'ENGINE_EVENT',
     ]
+
+
+def test_execution_plan_with_config_mapping_is_not_cached():
+    environment_dict = {
+        'solids': {
+            'composite_with_nested_config_solid_and_config_mapping': {
+                'config': {'foo': 'baz', 'bar': 3}
+            }
+        }
+    }
+
+    # Config mappings are passed the run config, so plans built with them are never reused
+    execution_plan = create_execution_plan(
+        composite_pipeline_with_config_mapping, environment_dict=environment_dict
+    )
+    assert (
+        create_execution_plan(
+            composite_pipeline_with_config_mapping, environment_dict=environment_dict
+        )
+        is not execution_plan
+    )
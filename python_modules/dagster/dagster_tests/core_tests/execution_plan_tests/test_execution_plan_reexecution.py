@@ -17,7 +17,8 @@ from dagster.core.errors import (
     DagsterInvariantViolationError,
     DagsterRunNotFoundError,
 )
-from dagster.core.events import get_step_output_event
+from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.events import DagsterEventType, get_step_output_event
 from dagster.core.execution.api import create_execution_plan, execute_plan
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
@@ -221,6 +222,55 @@ def test_pipeline_step_key_subset_execution():
     assert get_step_output_event(step_events, 'add_two.compute')
 
 
+def test_pipeline_reexecution_references_previous_run():
+    pipeline_def = define_addy_pipeline()
+    instance = DagsterInstance.ephemeral()
+    environment_dict = merge_dicts(
+        {'solids': {'add_one': {'inputs': {'num': {'value': 3}}}}},
+        {'storage': {'filesystem': {'config': {'reference_previous_run': True}}}},
+    )
+    result = execute_pipeline(pipeline_def, environment_dict=environment_dict, instance=instance)
+    assert result.success
+
+    ## re-execute add_two, then add_three, without copying intermediates
+
+    reexecution_result = execute_pipeline(
+        pipeline_def,
+        environment_dict=environment_dict,
+        run_config=RunConfig(
+            previous_run_id=result.run_id, step_keys_to_execute=['add_two.compute']
+        ),
+        instance=instance,
+    )
+    assert reexecution_result.success
+    assert reexecution_result.result_for_solid('add_two').output_value() == 6
+
+    second_reexecution_result = execute_pipeline(
+        pipeline_def,
+        environment_dict=environment_dict,
+        run_config=RunConfig(
+            previous_run_id=reexecution_result.run_id, step_keys_to_execute=['add_three.compute']
+        ),
+        instance=instance,
+    )
+    assert second_reexecution_result.success
+    assert second_reexecution_result.result_for_solid('add_three').output_value() == 9
+
+    for run_result in [reexecution_result, second_reexecution_result]:
+        assert ObjectStoreOperationType.CP_OBJECT.value not in [
+            event.event_specific_data.op
+            for event in run_result.event_list
+            if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        ]
+
+    store = build_fs_intermediate_store(
+        instance.intermediates_directory, second_reexecution_result.run_id
+    )
+    assert not store.has_intermediate(None, 'add_one.compute')
+    assert not store.has_intermediate(None, 'add_two.compute')
+    assert store.get_intermediate(None, 'add_three.compute', Int).obj == 9
+
+
 def test_pipeline_step_key_subset_execution_wrong_step_key_in_subset():
     pipeline_def = define_addy_pipeline()
     old_run_id = str(uuid.uuid4())
@@ -0,0 +1,156 @@
+import os
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.definitions.events import ObjectStoreOperationType
+from dagster.core.execution.memoization import output_handles_from_event_logs
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.instance import DagsterInstance
+
+
+def define_chain_pipeline():
+    @lambda_solid
+    def emit_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_two(num):
+        return num + 2
+
+    @lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='release_chain',
+        solid_defs=[emit_one, add_one, add_two, adder],
+        dependencies={
+            'add_one': {'num': DependencyDefinition('emit_one')},
+            'add_two': {'num': DependencyDefinition('add_one')},
+            'adder': {
+                'left': DependencyDefinition('add_one'),
+                'right': DependencyDefinition('add_two'),
+            },
+        },
+    )
+
+
+def _removed_step_keys(result):
+    return [
+        event.step_key
+        for event in result.event_list
+        if event.event_type_value == 'OBJECT_STORE_OPERATION'
+        and event.event_specific_data.op == ObjectStoreOperationType.RM_OBJECT.value
+    ]
+
+
+def _intermediate_path(instance, result, step_key):
+    return os.path.join(
+        instance.intermediates_directory(result.run_id), 'intermediates', step_key, 'result'
+    )
+
+
+def test_release_intermediates_in_process():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        define_chain_pipeline(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'in_process': {'config': {'release_intermediates': True}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 6
+
+    # add_one is consumed by both add_two and adder, so is only released after adder
+    assert _removed_step_keys(result) == [
+        'emit_one.compute',
+        'add_one.compute',
+        'add_two.compute',
+    ]
+    assert not os.path.exists(_intermediate_path(instance, result, 'add_one.compute'))
+    assert os.path.exists(_intermediate_path(instance, result, 'adder.compute'))
+
+    # released intermediates are not offered up for re-execution
+    assert output_handles_from_event_logs(instance.all_logs(result.run_id)) == {
+        StepOutputHandle('adder.compute', 'result')
+    }
+
+
+def test_release_intermediates_leaves_previous_run():
+    instance = DagsterInstance.local_temp()
+    storage = {'filesystem': {'config': {'reference_previous_run': True}}}
+    result = execute_pipeline(
+        define_chain_pipeline(), environment_dict={'storage': storage}, instance=instance
+    )
+    assert result.success
+
+    reexecution_result = execute_pipeline(
+        define_chain_pipeline(),
+        environment_dict={
+            'storage': storage,
+            'execution': {'in_process': {'config': {'release_intermediates': True}}},
+        },
+        run_config=RunConfig(
+            previous_run_id=result.run_id, step_keys_to_execute=['add_two.compute', 'adder.compute']
+        ),
+        instance=instance,
+    )
+    assert reexecution_result.success
+    assert reexecution_result.result_for_solid('adder').output_value() == 6
+
+    # add_one is read from the previous run, so is neither removed nor reported as removed
+    assert _removed_step_keys(reexecution_result) == ['add_two.compute']
+    assert os.path.exists(_intermediate_path(instance, result, 'add_one.compute'))
+    assert not os.path.exists(_intermediate_path(instance, reexecution_result, 'add_two.compute'))
+
+
+def test_release_intermediates_in_memory():
+    result = execute_pipeline(
+        define_chain_pipeline(),
+        environment_dict={'execution': {'in_process': {'config': {'release_intermediates': True}}}},
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 6
+
+
+def test_retain_intermediates_by_default():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        define_chain_pipeline(), environment_dict={'storage': {'filesystem': {}}}, instance=instance
+    )
+    assert result.success
+    assert _removed_step_keys(result) == []
+    assert os.path.exists(_intermediate_path(instance, result, 'add_one.compute'))
+
+
+def test_release_intermediates_multiprocess():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_chain_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'release_intermediates': True}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 6
+    assert set(_removed_step_keys(result)) == {
+        'emit_one.compute',
+        'add_one.compute',
+        'add_two.compute',
+    }
+    assert not os.path.exists(_intermediate_path(instance, result, 'emit_one.compute'))
@@ -0,0 +1,152 @@
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    Output,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    composite_solid,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    solid,
+)
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.results import PipelineExecutionResult
+
+NUM_SOLIDS = 500
+
+
+@lambda_solid(output_def=OutputDefinition(Int))
+def return_one():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num', Int)], output_def=OutputDefinition(Int))
+def add_one(num):
+    return num + 1
+
+
+@solid(output_defs=[OutputDefinition(Int, 'one'), OutputDefinition(Int, 'two')])
+def return_one_and_two(_context):
+    yield Output(1, 'one')
+    yield Output(2, 'two')
+
+
+@composite_solid(output_defs=[OutputDefinition(Int)])
+def add_two(num):
+    return add_one.alias('second')(add_one.alias('first')(num))
+
+
+@composite_solid(output_defs=[OutputDefinition(Int)])
+def add_four(num):
+    return add_two.alias('second_two')(add_two.alias('first_two')(num))
+
+
+@pipeline
+def nested_pipeline():
+    add_four(return_one())
+    return_one_and_two()
+
+
+def _with_counted_reconstructions(result):
+    '''Rebuild a result with a reconstruct_context that counts its calls.'''
+    calls = []
+
+    def _reconstruct_context():
+        calls.append(None)
+        return result.reconstruct_context()
+
+    return (
+        PipelineExecutionResult(
+            result.pipeline, result.run_id, result.event_list, _reconstruct_context
+        ),
+        calls,
+    )
+
+
+def test_results_are_built_once():
+    result = execute_pipeline(nested_pipeline)
+    assert result.success
+
+    assert result.result_for_solid('add_four') is result.result_for_solid('add_four')
+    assert result.result_for_handle('add_four.first_two') is result.result_for_solid(
+        'add_four'
+    ).result_for_solid('first_two')
+    assert result.result_for_handle('add_four.first_two.first') is result.result_for_handle(
+        'add_four'
+    ).result_for_handle('first_two.first')
+
+    first = result.result_for_handle('add_four.first_two.first')
+    assert first.success
+    assert not first.skipped
+    assert len(first.compute_step_events) == len(
+        result.events_by_step_key['add_four.first_two.first.compute']
+    )
+    assert list(first.compute_input_event_dict.keys()) == ['num']
+    assert list(first.compute_output_event_dict.keys()) == ['result']
+    assert first.get_step_success_event().step_key == 'add_four.first_two.first.compute'
+    assert first.failure_data is None
+
+
+def test_output_values_are_loaded_once():
+    result, calls = _with_counted_reconstructions(execute_pipeline(nested_pipeline))
+
+    assert result.result_for_solid('add_four').output_value() == 5
+    assert len(calls) == 1
+    assert result.result_for_solid('add_four').output_values == {'result': 5}
+    assert result.result_for_handle('add_four.second_two.second').output_value() == 5
+    assert len(calls) == 1
+
+    one_and_two = result.result_for_solid('return_one_and_two')
+    assert one_and_two.output_value('one') == 1
+    assert len(calls) == 2
+
+    # Only the output which has not been loaded yet is read
+    assert one_and_two.output_values == {'one': 1, 'two': 2}
+    assert one_and_two.output_value('two') == 2
+    assert len(calls) == 3
+
+    # Mutating the returned dict does not affect the results
+    one_and_two.output_values['one'] = 3
+    assert one_and_two.output_values == {'one': 1, 'two': 2}
+
+
+def define_wide_pipeline(num_solids):
+    dependencies = {'return_one': {}}
+    for index in range(num_solids):
+        dependencies[SolidInvocation('add_one', 'add_one_{index}'.format(index=index))] = {
+            'num': DependencyDefinition('return_one')
+        }
+
+    return PipelineDefinition(
+        name='wide_pipeline', solid_defs=[return_one, add_one], dependencies=dependencies
+    )
+
+
+def test_wide_pipeline_results(monkeypatch):
+    result = execute_pipeline(define_wide_pipeline(NUM_SOLIDS))
+    assert result.success
+
+    is_step_event_calls = []
+    is_step_event = DagsterEvent.is_step_event
+    monkeypatch.setattr(
+        DagsterEvent,
+        'is_step_event',
+        property(lambda event: is_step_event_calls.append(event) or is_step_event.fget(event)),
+    )
+
+    result = PipelineExecutionResult(
+        result.pipeline, result.run_id, result.event_list, result.reconstruct_context
+    )
+    solid_results = result.solid_result_list
+    successes = [solid_result.success for solid_result in solid_results]
+    output_events = [solid_result.compute_output_event_dict for solid_result in solid_results]
+
+    # The event list is scanned once, rather than once for each solid
+    assert len(is_step_event_calls) == len(result.event_list)
+
+    assert len(solid_results) == NUM_SOLIDS + 1
+    assert all(successes)
+    assert all(list(events.keys()) == ['result'] for events in output_events)
@@ -1,3 +1,6 @@
+import logging
+import sqlite3
+import threading
 import time
 
 import pytest
@@ -5,6 +8,12 @@ import pytest
 from dagster import seven
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.objects import (
+    StepFailureData,
+    StepOutputData,
+    StepOutputHandle,
+    StepSuccessData,
+)
 from dagster.core.storage.event_log import (
     EventLogInvalidForRun,
     InMemoryEventLogStorage,
@@ -13,7 +22,9 @@ from dagster.core.storage.event_log import (
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import (
     CREATE_EVENT_LOG_SQL,
     INSERT_EVENT_SQL,
+    MAX_FLUSH_ATTEMPTS,
 )
+from dagster.core.storage.pipeline_run import PipelineRunStatus
 
 
 def test_in_memory_event_log_storage_run_not_found():
@@ -113,14 +124,506 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data():
         storage = SqliteEventLogStorage(tmpdir_path)
         with storage._connect('foo') as conn:  # pylint: disable=protected-access
             conn.cursor().execute(CREATE_EVENT_LOG_SQL)
-            conn.cursor().execute(INSERT_EVENT_SQL, ('{bar}', None, None))
+            conn.cursor().execute(INSERT_EVENT_SQL, ('{bar}', None, None, None, None))
         with pytest.raises(EventLogInvalidForRun) as exc:
             storage.get_logs_for_run('foo')
         assert exc.value.run_id == 'foo'
 
         with storage._connect('bar') as conn:  # pylint: disable=protected-access
             conn.cursor().execute(CREATE_EVENT_LOG_SQL)
-            conn.cursor().execute(INSERT_EVENT_SQL, ('3', None, None))
+            conn.cursor().execute(INSERT_EVENT_SQL, ('3', None, None, None, None))
         with pytest.raises(EventLogInvalidForRun) as exc:
             storage.get_logs_for_run('bar')
         assert exc.value.run_id == 'bar'
+
+
+def _step_event_record(run_id, message='Message2'):
+    return DagsterEventRecord(
+        None,
+        message,
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.STEP_START.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def _pipeline_event_record(run_id, event_type):
+    return DagsterEventRecord(
+        None,
+        'Message2',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(event_type.value, 'nonce'),
+    )
+
+
+def test_filesystem_event_log_storage_batches_writes():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=3, flush_interval=60.0)
+        # a second storage over the same directory sees only what has been written to disk
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_step_event_record('foo'))
+        storage.store_event(_step_event_record('foo'))
+        assert len(reader.get_logs_for_run('foo')) == 0
+
+        storage.store_event(_step_event_record('foo'))
+        assert len(reader.get_logs_for_run('foo')) == 3
+
+        storage.store_event(_step_event_record('foo'))
+        assert len(reader.get_logs_for_run('foo')) == 3
+
+        # reads through the writing storage see buffered events
+        assert len(storage.get_logs_for_run('foo')) == 4
+        assert len(reader.get_logs_for_run('foo')) == 4
+
+        storage.wipe()
+
+
+def test_filesystem_event_log_storage_flushes_after_interval():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=0.05)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_step_event_record('foo'))
+        assert len(reader.get_logs_for_run('foo')) == 0
+
+        deadline = time.time() + 5
+        while not reader.get_logs_for_run('foo') and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(reader.get_logs_for_run('foo')) == 1
+
+        storage.wipe()
+
+
+def test_filesystem_event_log_storage_flushes_with_one_thread():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        # Long enough that no events are due before all of them are buffered, so the thread
+        # cannot exit and be replaced while they are stored
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=0.5)
+        reader = SqliteEventLogStorage(tmpdir_path)
+        run_ids = ['run_{index}'.format(index=index) for index in range(20)]
+
+        def _flusher_threads():
+            return [
+                thread
+                for thread in threading.enumerate()
+                if thread.name == 'dagster-sqlite-event-log-flusher'
+            ]
+
+        # The flushers of other storages may still be running
+        other_flushers = _flusher_threads()
+
+        for run_id in run_ids:
+            storage.store_event(_step_event_record(run_id))
+
+        assert [thread for thread in _flusher_threads() if thread not in other_flushers] == [
+            storage._flusher  # pylint: disable=protected-access
+        ]
+
+        assert _wait_for(
+            lambda: all(len(reader.get_logs_for_run(run_id)) == 1 for run_id in run_ids)
+        )
+        # The thread exits once nothing is buffered
+        assert _wait_for(lambda: storage._flusher is None)  # pylint: disable=protected-access
+
+
+def test_filesystem_event_log_storage_flush():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=60.0)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_step_event_record('foo'))
+        storage.store_event(_step_event_record('bar'))
+        assert len(reader.get_logs_for_run('foo')) == 0
+
+        storage.flush()
+        assert len(reader.get_logs_for_run('foo')) == 1
+        assert len(reader.get_logs_for_run('bar')) == 1
+
+
+class _FailingConnection(object):
+    '''Wraps a sqlite3 connection, failing its first num_failures batch inserts.'''
+
+    def __init__(self, conn, num_failures):
+        self._conn = conn
+        self.num_failures = num_failures
+
+    def __enter__(self):
+        return self._conn.__enter__()
+
+    def __exit__(self, *args):
+        return self._conn.__exit__(*args)
+
+    def executemany(self, sql, params):
+        if self.num_failures:
+            self.num_failures -= 1
+            raise sqlite3.OperationalError('disk I/O error')
+        return self._conn.executemany(sql, params)
+
+    def execute(self, sql, params=()):
+        return self._conn.execute(sql, params)
+
+    def close(self):
+        self._conn.close()
+
+
+def test_filesystem_event_log_storage_retries_failed_flushes():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=0.05)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        # pylint: disable=protected-access
+        writer = storage._get_writer('foo')
+        writer._conn = _FailingConnection(writer._conn, num_failures=2)
+
+        storage.store_event(_step_event_record('foo'))
+        assert _wait_for(lambda: len(reader.get_logs_for_run('foo')) == 1)
+        assert writer._conn.num_failures == 0
+
+
+def test_filesystem_event_log_storage_drops_unwritable_events(caplog):
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=0.01)
+
+        # pylint: disable=protected-access
+        writer = storage._get_writer('foo')
+        writer._conn = _FailingConnection(writer._conn, num_failures=MAX_FLUSH_ATTEMPTS + 1)
+
+        storage.store_event(_step_event_record('foo'))
+        assert _wait_for(lambda: storage._flusher is None)
+
+        assert 'foo' not in storage._writers
+        assert writer._conn is None
+        assert writer.num_pending == 0
+        assert [record.levelno for record in caplog.records] == [logging.WARNING] * (
+            MAX_FLUSH_ATTEMPTS - 1
+        ) + [logging.ERROR]
+
+        # The run gets a new writer if more of its events are stored
+        storage.store_event(_step_event_record('foo'))
+        assert len(storage.get_logs_for_run('foo')) == 1
+
+
+def test_filesystem_event_log_storage_flushes_on_pipeline_end():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=60.0)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_START))
+        storage.store_event(_step_event_record('foo'))
+        assert [event.dagster_event.event_type for event in reader.get_logs_for_run('foo')] == [
+            DagsterEventType.PIPELINE_START
+        ]
+
+        storage.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_SUCCESS))
+        assert [event.dagster_event.event_type for event in reader.get_logs_for_run('foo')] == [
+            DagsterEventType.PIPELINE_START,
+            DagsterEventType.STEP_START,
+            DagsterEventType.PIPELINE_SUCCESS,
+        ]
+        stats = reader.get_stats_for_run('foo')
+        assert stats.start_time and stats.end_time
+
+        # events stored after the run has ended are still written
+        storage.store_event(_step_event_record('foo'))
+        assert len(storage.get_logs_for_run('foo')) == 4
+
+
+def test_event_log_delete_discards_buffered_events():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=60.0)
+        storage.store_event(_step_event_record('foo'))
+        storage.delete_events('foo')
+        assert len(storage.get_logs_for_run('foo')) == 0
+
+        storage.store_event(_step_event_record('foo'))
+        assert len(storage.get_logs_for_run('foo')) == 1
+
+
+def _step_event_records(run_id):
+    def _record(event_type, step_key, event_specific_data=None, level='debug'):
+        return DagsterEventRecord(
+            None,
+            'Message',
+            level,
+            '',
+            run_id,
+            time.time(),
+            step_key=step_key,
+            dagster_event=DagsterEvent(
+                event_type.value,
+                'nonce',
+                step_key=step_key,
+                event_specific_data=event_specific_data,
+            ),
+        )
+
+    return [
+        _record(DagsterEventType.STEP_START, 'a.compute'),
+        _record(
+            DagsterEventType.STEP_OUTPUT,
+            'a.compute',
+            StepOutputData(StepOutputHandle('a.compute', 'result')),
+        ),
+        _record(DagsterEventType.STEP_SUCCESS, 'a.compute', StepSuccessData(1.0)),
+        _record(DagsterEventType.STEP_START, 'b.compute'),
+        _record(
+            DagsterEventType.STEP_FAILURE,
+            'b.compute',
+            StepFailureData(error=None, user_failure_data=None),
+            level='error',
+        ),
+    ]
+
+
+def _assert_query_logs_for_run(storage):
+    for event in _step_event_records('foo'):
+        storage.store_event(event)
+    storage.store_event(_step_event_record('bar'))
+
+    def _query(**kwargs):
+        return [
+            (entry.event_record.dagster_event.event_type, entry.event_record.dagster_event.step_key)
+            for entry in storage.query_logs_for_run('foo', **kwargs)
+        ]
+
+    assert len(_query()) == 5
+    assert _query(event_types=[DagsterEventType.STEP_OUTPUT, DagsterEventType.STEP_FAILURE]) == [
+        (DagsterEventType.STEP_OUTPUT, 'a.compute'),
+        (DagsterEventType.STEP_FAILURE, 'b.compute'),
+    ]
+    assert _query(step_keys=['b.compute']) == [
+        (DagsterEventType.STEP_START, 'b.compute'),
+        (DagsterEventType.STEP_FAILURE, 'b.compute'),
+    ]
+    assert _query(event_types=[DagsterEventType.STEP_START], step_keys=['a.compute']) == [
+        (DagsterEventType.STEP_START, 'a.compute')
+    ]
+    assert _query(min_level=logging.ERROR) == [(DagsterEventType.STEP_FAILURE, 'b.compute')]
+    assert _query(event_types=[]) == []
+
+    entries = storage.query_logs_for_run('foo')
+    assert [entry.cursor for entry in entries] == [0, 1, 2, 3, 4]
+    page = storage.query_logs_for_run('foo', cursor=entries[1].cursor, limit=2)
+    assert [entry.cursor for entry in page] == [2, 3]
+    assert storage.query_logs_for_run('foo', cursor=entries[-1].cursor) == []
+
+    page = storage.query_logs_for_run('foo', before_cursor=4, limit=2, newest_first=True)
+    assert [entry.cursor for entry in page] == [3, 2]
+    page = storage.query_logs_for_run('foo', cursor=0, before_cursor=3)
+    assert [entry.cursor for entry in page] == [1, 2]
+    page = storage.query_logs_for_run('foo', step_keys=['a.compute'], newest_first=True, limit=1)
+    assert [entry.cursor for entry in page] == [2]
+
+    assert storage.get_logs_count_for_run('foo') == 5
+    assert storage.get_logs_count_for_run('foo', step_keys=['b.compute']) == 2
+    assert storage.get_logs_count_for_run('foo', min_level=logging.ERROR) == 1
+    assert storage.get_logs_count_for_run('baz') == 0
+
+    assert storage.get_stats_for_run('foo').steps_succeeded == 1
+    assert storage.get_stats_for_run('foo').steps_failed == 1
+
+
+def test_in_memory_event_log_storage_query_logs_for_run():
+    _assert_query_logs_for_run(InMemoryEventLogStorage())
+
+
+def test_filesystem_event_log_storage_query_logs_for_run():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        _assert_query_logs_for_run(storage)
+        # Write the events buffered for bar before their database is deleted
+        storage.flush()
+
+
+def _assert_stats_for_runs(storage):
+    storage.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_START))
+    for event in _step_event_records('foo'):
+        storage.store_event(event)
+    storage.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_FAILURE))
+    storage.store_event(_step_event_record('bar'))
+
+    stats = storage.get_stats_for_runs(['foo', 'bar'])
+    assert set(stats.keys()) == {'foo', 'bar'}
+
+    assert stats['foo'] == storage.get_stats_for_run('foo')
+    assert stats['foo'].steps_succeeded == 1
+    assert stats['foo'].steps_failed == 1
+    assert stats['foo'].materializations == 0
+    assert stats['foo'].start_time <= stats['foo'].end_time
+
+    assert stats['bar'].steps_succeeded == 0
+    assert stats['bar'].start_time is None
+    assert stats['bar'].end_time is None
+
+
+def test_in_memory_event_log_storage_stats_for_runs():
+    _assert_stats_for_runs(InMemoryEventLogStorage())
+
+
+def test_filesystem_event_log_storage_stats_for_runs():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        _assert_stats_for_runs(SqliteEventLogStorage(tmpdir_path))
+
+
+def test_filesystem_event_log_storage_writes_stats_with_batch():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval=60.0)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        for event in _step_event_records('foo'):
+            storage.store_event(event)
+        assert reader.get_stats_for_run('foo').steps_succeeded == 0
+
+        storage.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_SUCCESS))
+        stats = reader.get_stats_for_run('foo')
+        assert stats.steps_succeeded == 1
+        assert stats.steps_failed == 1
+        assert stats.end_time is not None
+
+
+def test_filesystem_event_log_storage_migrates_schema():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+
+        # a run database written before step_key and level were indexed
+        with storage._connect('foo') as conn:  # pylint: disable=protected-access
+            conn.cursor().execute(
+                '''CREATE TABLE event_logs (
+                    row_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event TEXT NOT NULL,
+                    dagster_event_type TEXT,
+                    timestamp TEXT
+                )'''
+            )
+            for event in _step_event_records('foo'):
+                conn.cursor().execute(
+                    'INSERT INTO event_logs (event, dagster_event_type, timestamp) '
+                    'VALUES (?, ?, ?)',
+                    (event.to_json(), event.dagster_event.event_type_value, event.timestamp),
+                )
+
+        assert len(storage.get_logs_for_run('foo')) == 5
+
+        entries = storage.query_logs_for_run(
+            'foo', event_types=[DagsterEventType.STEP_FAILURE], step_keys=['b.compute']
+        )
+        assert len(entries) == 1
+        assert entries[0].cursor == 4
+
+        assert [
+            entry.cursor for entry in storage.query_logs_for_run('foo', min_level=logging.ERROR)
+        ] == [4]
+
+        # events stored after the migration are indexed as they are written
+        storage.store_event(_step_event_records('foo')[1])
+        assert (
+            len(storage.query_logs_for_run('foo', event_types=[DagsterEventType.STEP_OUTPUT])) == 2
+        )
+
+        # the run's stats are backfilled from the events stored before the migration
+        stats = storage.get_stats_for_run('foo')
+        assert stats.steps_succeeded == 1
+        assert stats.steps_failed == 1
+
+
+def _assert_store_events(storage):
+    events = [_step_event_record('foo', message=str(index)) for index in range(5)] + [
+        _pipeline_event_record('bar', DagsterEventType.PIPELINE_START),
+        _pipeline_event_record('foo', DagsterEventType.PIPELINE_SUCCESS),
+    ]
+    storage.store_events(events)
+
+    assert [event.message for event in storage.get_logs_for_run('foo')] == [
+        '0',
+        '1',
+        '2',
+        '3',
+        '4',
+        'Message2',
+    ]
+    assert len(storage.get_logs_for_run('bar')) == 1
+    assert storage.get_stats_for_run('foo').end_time is not None
+
+
+def test_in_memory_event_log_storage_store_events():
+    _assert_store_events(InMemoryEventLogStorage())
+
+
+def test_filesystem_event_log_storage_store_events():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        _assert_store_events(SqliteEventLogStorage(tmpdir_path))
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_filesystem_event_log_storage_watch():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        # events are written by a separate storage, as by another process
+        writer = SqliteEventLogStorage(tmpdir_path, batch_size=1)
+
+        writer.store_event(_step_event_record('foo', message='0'))
+        writer.store_event(_step_event_record('foo', message='1'))
+
+        from_start, from_cursor, other_run = [], [], []
+        storage.watch('foo', -1, from_start.append)
+        storage.watch('foo', 0, from_cursor.append)
+        storage.watch('bar', -1, other_run.append)
+
+        # events stored before the watch began are seen straight away
+        assert [event.message for event in from_start] == ['0', '1']
+        assert [event.message for event in from_cursor] == ['1']
+
+        for index in range(2, 20):
+            writer.store_event(_step_event_record('foo', message=str(index)))
+
+        assert _wait_for(lambda: len(from_start) == 20)
+        assert [event.message for event in from_start] == [str(index) for index in range(20)]
+        assert _wait_for(lambda: len(from_cursor) == 19)
+        assert [event.message for event in from_cursor] == [str(index) for index in range(1, 20)]
+        assert other_run == []
+
+        # every run is watched through a single watch on the directory
+        assert len(storage._obs.emitters) == 1  # pylint: disable=protected-access
+
+        storage.end_watch('foo', from_cursor.append)
+        writer.store_event(_step_event_record('foo', message='20'))
+        assert _wait_for(lambda: len(from_start) == 21)
+        assert len(from_cursor) == 19
+
+
+def test_filesystem_event_log_storage_watch_ends_on_run_end():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        writer = SqliteEventLogStorage(tmpdir_path)
+        events = []
+
+        def _callback(event):
+            events.append(event)
+            if event.dagster_event.event_type == DagsterEventType.PIPELINE_SUCCESS:
+                return PipelineRunStatus.SUCCESS
+
+        storage.watch('foo', -1, _callback)
+        writer.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_START))
+        writer.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_SUCCESS))
+        assert _wait_for(lambda: len(events) == 2)
+
+        writer.store_event(_pipeline_event_record('foo', DagsterEventType.PIPELINE_START))
+        time.sleep(0.2)
+        assert len(events) == 2
+        assert not storage._watcher._run_watches  # pylint: disable=protected-access
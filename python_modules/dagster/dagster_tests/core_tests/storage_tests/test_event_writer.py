@@ -0,0 +1,253 @@
+import threading
+import time
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    DagsterInvalidConfigError,
+    ExecutionTargetHandle,
+    RunConfig,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.events import DagsterEvent
+from dagster.core.events.log import DagsterEventRecord, LogMessageRecord
+from dagster.core.execution.api import flush_events_on_exit
+from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.instance.event_writer import BackgroundEventWriter, EventWriterFullPolicy
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.core.storage.pipeline_run import PipelineRunStatus
+
+
+def _log_record(run_id, message):
+    return LogMessageRecord(None, message, 'debug', message, run_id, time.time())
+
+
+def _pipeline_event_record(run_id, event_type):
+    return DagsterEventRecord(
+        None,
+        'Message',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(event_type.value, 'nonce'),
+    )
+
+
+def test_background_event_writer_batches_in_order():
+    batches = []
+    writer = BackgroundEventWriter(batches.append, max_batch_size=10)
+
+    for index in range(100):
+        writer.put(_log_record('run_{index}'.format(index=index % 3), str(index)))
+    writer.flush()
+
+    assert all(0 < len(batch) <= 10 for batch in batches)
+    assert [event.message for batch in batches for event in batch] == [
+        str(index) for index in range(100)
+    ]
+
+
+def test_background_event_writer_when_full():
+    writing = threading.Event()
+    can_write = threading.Event()
+    batches = []
+
+    def _write_events(events):
+        writing.set()
+        can_write.wait()
+        batches.append(events)
+
+    writer = BackgroundEventWriter(
+        _write_events, max_queue_size=2, when_full=EventWriterFullPolicy.DROP_LOGS
+    )
+
+    # The writer thread takes the first event, then the queue fills
+    writer.put(_log_record('foo', 'first'))
+    writing.wait()
+    writer.put(_log_record('foo', 'second'))
+    writer.put(_log_record('foo', 'third'))
+    writer.put(_log_record('foo', 'dropped'))
+    assert writer.num_dropped_events == 1
+
+    # Dagster events wait for room in the queue
+    put_thread = threading.Thread(
+        target=writer.put, args=(_pipeline_event_record('foo', DagsterEventType.PIPELINE_START),)
+    )
+    put_thread.start()
+    time.sleep(0.05)
+    assert put_thread.is_alive()
+
+    can_write.set()
+    put_thread.join()
+    writer.flush()
+
+    assert [event.message for batch in batches for event in batch] == [
+        'first',
+        'second',
+        'third',
+        'Message',
+    ]
+
+
+def test_background_event_writer_raises_errors_on_flush():
+    def _write_events(_events):
+        raise Exception('storage unavailable')
+
+    writer = BackgroundEventWriter(_write_events)
+    writer.put(_log_record('foo', 'lost'))
+
+    with pytest.raises(Exception, match='storage unavailable'):
+        writer.flush()
+
+    # The error is only raised once
+    writer.flush()
+
+
+def test_background_event_writer_thread_exits_when_idle():
+    batches = []
+    writer = BackgroundEventWriter(batches.append, idle_timeout=0.01)
+
+    writer.put(_log_record('foo', 'first'))
+    writer.flush()
+
+    deadline = time.time() + 5
+    while writer._thread is not None and time.time() < deadline:  # pylint: disable=W0212
+        time.sleep(0.01)
+    assert writer._thread is None  # pylint: disable=W0212
+
+    writer.put(_log_record('foo', 'second'))
+    writer.flush()
+    assert [event.message for batch in batches for event in batch] == ['first', 'second']
+
+
+@pipeline
+def logging_pipeline():
+    @solid
+    def log_a_lot(context):
+        for index in range(100):
+            context.log.info(str(index))
+
+    log_a_lot()
+
+
+def test_instance_event_writer():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(
+            temp_dir, overrides={'event_writer': {'max_batch_size': 10}}
+        )
+        events = []
+        run_config = RunConfig()
+        instance.add_event_listener(run_config.run_id, events.append)
+
+        result = execute_pipeline(logging_pipeline, run_config=run_config, instance=instance)
+        assert result.success
+
+        # The run's events and status are stored by the time it returns
+        assert instance.get_run_by_id(result.run_id).status == PipelineRunStatus.SUCCESS
+        logs = instance.all_logs(result.run_id)
+        assert [event.message for event in logs] == [event.message for event in events]
+        assert [
+            event.user_message for event in logs if event.user_message in map(str, range(100))
+        ] == [str(index) for index in range(100)]
+        assert logs[-1].dagster_event.event_type == DagsterEventType.PIPELINE_SUCCESS
+
+
+def test_instance_ref_event_writer_config():
+    with seven.TemporaryDirectory() as temp_dir:
+        ref = InstanceRef.from_dir(temp_dir)
+        assert ref.event_writer_config is None
+
+        ref = InstanceRef.from_dir(temp_dir, overrides={'event_writer': {}})
+        assert ref.event_writer_config == {
+            'max_queue_size': 10000,
+            'max_batch_size': 100,
+            'when_full': 'block',
+        }
+        assert deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(ref)) == ref
+
+        with pytest.raises(DagsterInvalidConfigError):
+            InstanceRef.from_dir(temp_dir, overrides={'event_writer': {'when_full': 'explode'}})
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid
+    def adder(left, right):
+        return left + right
+
+    @pipeline
+    def diamond_pipeline():
+        two = return_two()
+        adder(left=add_three(two), right=mult_three(two))
+
+    return diamond_pipeline
+
+
+def test_multiprocess_instance_event_writer():
+    pipeline_def = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir, overrides={'event_writer': {}})
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}},
+            instance=instance,
+        )
+        assert result.success
+
+        event_types = [
+            event.dagster_event.event_type
+            for event in instance.all_logs(result.run_id)
+            if event.is_dagster_event
+        ]
+        assert event_types[0] == DagsterEventType.PIPELINE_START
+        assert event_types[-1] == DagsterEventType.PIPELINE_SUCCESS
+        assert event_types.count(DagsterEventType.STEP_SUCCESS) == 4
+
+        # Each step's events are stored before the parent handles the step's success
+        for step_key in ['return_two.compute', 'add_three.compute', 'adder.compute']:
+            step_event_types = [
+                event.dagster_event.event_type
+                for event in instance.all_logs(result.run_id)
+                if event.is_dagster_event and event.dagster_event.step_key == step_key
+            ]
+            assert step_event_types[0] == DagsterEventType.STEP_START
+            assert DagsterEventType.STEP_SUCCESS in step_event_types
+
+
+def test_flush_events_on_exit():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir, overrides={'event_writer': {}})
+
+        def _flush_events():
+            raise Exception('storage unavailable')
+
+        instance.flush_events = _flush_events
+
+        with pytest.raises(Exception, match='storage unavailable'):
+            with flush_events_on_exit(instance):
+                pass
+
+        # An error storing the events does not replace the error which interrupted execution
+        with pytest.raises(Exception, match='step failed'):
+            with flush_events_on_exit(instance):
+                raise Exception('step failed')
@@ -4,6 +4,7 @@ import uuid
 import pytest
 
 from dagster import Bool, List, Optional, String, check
+from dagster.core.definitions.events import ObjectStoreOperationType
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_store import build_fs_intermediate_store
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
@@ -61,9 +62,17 @@ def test_file_system_intermediate_store():
         assert intermediate_store.has_object(context, ['true'])
         assert intermediate_store.get_object(context, RuntimeBool.inst(), ['true']).obj is True
         assert intermediate_store.uri_for_paths(['true']).startswith('file:///')
-        assert intermediate_store.rm_object(context, ['true']) is None
-        assert intermediate_store.rm_object(context, ['true']) is None
-        assert intermediate_store.rm_object(context, ['dslkfhjsdflkjfs']) is None
+        assert (
+            intermediate_store.rm_object(context, ['true']).op == ObjectStoreOperationType.RM_OBJECT
+        )
+        assert not intermediate_store.has_object(context, ['true'])
+        assert (
+            intermediate_store.rm_object(context, ['true']).op == ObjectStoreOperationType.RM_OBJECT
+        )
+        assert (
+            intermediate_store.rm_object(context, ['dslkfhjsdflkjfs']).op
+            == ObjectStoreOperationType.RM_OBJECT
+        )
 
 
 def test_file_system_intermediate_store_composite_types():
@@ -179,3 +188,64 @@ def test_file_system_intermediate_store_with_composite_type_storage_plugin():
             intermediate_store.set_value(
                 ['hello'], context, resolve_to_runtime_type(Optional[List[String]]), ['obj_name']
             )
+
+
+def test_file_system_intermediate_store_has_objects():
+    run_id = str(uuid.uuid4())
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object(True, context, RuntimeBool.inst(), ['true'])
+        intermediate_store.set_object(False, context, RuntimeBool.inst(), ['nested', 'false'])
+
+        assert intermediate_store.has_objects(
+            context, [['true'], ['nested', 'false'], ['nested'], ['missing'], ['nested', 'true']]
+        ) == [True, True, True, False, False]
+        assert intermediate_store.has_objects(context, []) == []
+
+
+def test_file_system_intermediate_store_copy_objects_from_prev_run():
+    instance = DagsterInstance.ephemeral()
+    prev_run_id = str(uuid.uuid4())
+    prev_intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=prev_run_id
+    )
+    run_id = str(uuid.uuid4())
+    intermediate_store = build_fs_intermediate_store(
+        instance.intermediates_directory, run_id=run_id
+    )
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        prev_intermediate_store.set_object(True, context, RuntimeBool.inst(), ['true'])
+        prev_intermediate_store.set_object(False, context, RuntimeBool.inst(), ['nested', 'false'])
+
+        operations = intermediate_store.copy_objects_from_prev_run(
+            context, prev_run_id, [['true'], ['nested']]
+        )
+        assert [operation.op for operation in operations] == [
+            ObjectStoreOperationType.CP_OBJECT,
+            ObjectStoreOperationType.CP_OBJECT,
+        ]
+        assert [operation.dest_key for operation in operations] == [
+            intermediate_store.key_for_paths(['true']),
+            intermediate_store.key_for_paths(['nested']),
+        ]
+        assert intermediate_store.get_object(context, RuntimeBool.inst(), ['true']).obj is True
+        assert (
+            intermediate_store.get_object(context, RuntimeBool.inst(), ['nested', 'false']).obj
+            is False
+        )
+
+        # Files are hard linked rather than copied
+        assert os.path.samefile(
+            prev_intermediate_store.key_for_paths(['nested', 'false']),
+            intermediate_store.key_for_paths(['nested', 'false']),
+        )
+
+        # Overwriting the copy leaves the previous run's object as it was
+        intermediate_store.set_object(False, context, RuntimeBool.inst(), ['true'])
+        assert intermediate_store.get_object(context, RuntimeBool.inst(), ['true']).obj is False
+        assert prev_intermediate_store.get_object(context, RuntimeBool.inst(), ['true']).obj is True
@@ -5,11 +5,12 @@ from contextlib import contextmanager
 
 import pytest
 
-from dagster import ModeDefinition, check, execute_solid, pipeline, solid
+from dagster import ModeDefinition, check, execute_pipeline, execute_solid, pipeline, solid
 from dagster.core.definitions import SolidHandle
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.logger import InitLoggerContext
 from dagster.core.execution.plan.objects import StepFailureData
+from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.loggers import colored_console_logger, json_console_logger
 from dagster.utils.error import SerializableErrorInfo
@@ -198,3 +199,101 @@ def test_json_console_logger(capsys):
                 found_msg = True
 
     assert found_msg
+
+
+def test_logging_skips_disabled_loggers():
+    with _setup_logger('debug') as (debug_results, debug_logger):
+        with _setup_logger('info') as (info_results, info_logger):
+            info_logger.setLevel(logging.INFO)
+
+            dl = DagsterLogManager('123', {}, [debug_logger, info_logger])
+            dl.debug('test')
+            dl.info('test')
+
+            assert debug_results == ['system - 123 - test'] * 2
+            assert info_results == ['system - 123 - test']
+
+            # Messages are checked whether or not they are logged
+            info_logger.setLevel(logging.CRITICAL)
+            debug_logger.setLevel(logging.CRITICAL)
+            with pytest.raises(check.CheckError):
+                dl.debug('test', orig_message='reserved')
+
+
+def test_disabled_debug_logging_skips_formatting(monkeypatch):
+    @pipeline
+    def pipe():
+        pass
+
+    console_logger = colored_console_logger.logger_fn(
+        InitLoggerContext(
+            {'name': 'dagster', 'log_level': 'INFO'}, pipe, colored_console_logger, ''
+        )
+    )
+    dl = DagsterLogManager('123', {'pipeline': 'pipe', 'solid': 'a_solid'}, [console_logger])
+
+    prepared_messages = []
+    prepare_message = DagsterLogManager._prepare_message  # pylint: disable=protected-access
+    monkeypatch.setattr(
+        DagsterLogManager,
+        '_prepare_message',
+        lambda self, orig_message, message_props: prepared_messages.append(orig_message)
+        or prepare_message(self, orig_message, message_props),
+    )
+
+    for index in range(100):
+        dl.debug('Processed row', row=index, status='ok')
+
+    # No message is built for the calls which no logger would log
+    assert prepared_messages == []
+
+    dl.info('Processed rows')
+    assert prepared_messages == ['Processed rows']
+
+
+def test_debug_logging_in_run(capsys, monkeypatch):
+    prepared_messages = []
+    prepare_message = DagsterLogManager._prepare_message  # pylint: disable=protected-access
+    monkeypatch.setattr(
+        DagsterLogManager,
+        '_prepare_message',
+        lambda self, orig_message, message_props: prepared_messages.append(orig_message)
+        or prepare_message(self, orig_message, message_props),
+    )
+
+    @solid
+    def process_rows(context):
+        for index in range(3):
+            context.log.debug('Processed row', row=index)
+        context.log.info('Processed rows')
+
+    @pipeline(mode_defs=[ModeDefinition(logger_defs={'json': json_console_logger})])
+    def pipe():
+        process_rows()
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        pipe,
+        environment_dict={'loggers': {'json': {'config': {'log_level': 'INFO'}}}},
+        instance=instance,
+    )
+    assert result.success
+
+    # A run's log manager also logs to the instance, which stores messages of every level in the
+    # event log, so debug messages are still built once each even though the console skips them
+    assert [message for message in prepared_messages if message.startswith('Processed row')] == [
+        'Processed row'
+    ] * 3 + ['Processed rows']
+    assert [
+        record.user_message
+        for record in instance.all_logs(result.run_id)
+        if record.user_message.startswith('Processed row')
+    ] == ['Processed row'] * 3 + ['Processed rows']
+
+    console_messages = [
+        json.loads(line)['dagster_meta']['orig_message']
+        for line in capsys.readouterr().err.split('\n')
+        if line
+    ]
+    assert 'Processed rows' in console_messages
+    assert 'Processed row' not in console_messages
@@ -1,12 +1,16 @@
+import os
 import uuid
 from contextlib import contextmanager
 
 import pytest
+import sqlalchemy as db
 
 from dagster import PipelineDefinition, seven
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunSummary
 from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.core.storage.runs.sqlite import RunStorageSQLMetadata, create_engine
 
 
 def do_test_single_write_read(instance):
@@ -307,3 +311,98 @@ def test_delete(run_storage_factory_cm_fn):
         assert len(storage.all_runs()) == 1
         storage.delete_run(run_id)
         assert list(storage.all_runs()) == []
+
+
+@run_storage_test
+def test_fetch_run_summaries(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        assert storage
+        one, two, three = [str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())]
+        storage.add_run(
+            build_run(
+                run_id=one,
+                pipeline_name='some_pipeline',
+                tags={'mytag': 'hello', 'mytag2': 'world'},
+                status=PipelineRunStatus.SUCCESS,
+            )
+        )
+        storage.add_run(
+            build_run(
+                run_id=two,
+                pipeline_name='some_other_pipeline',
+                tags={'mytag': 'hello'},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(build_run(run_id=three, pipeline_name='some_pipeline'))
+
+        summaries = storage.get_run_summaries()
+        assert [summary.run_id for summary in summaries] == [three, two, one]
+        assert summaries[2] == PipelineRunSummary(
+            run_id=one,
+            pipeline_name='some_pipeline',
+            status=PipelineRunStatus.SUCCESS,
+            tags={'mytag': 'hello', 'mytag2': 'world'},
+            create_timestamp=summaries[2].create_timestamp,
+            update_timestamp=summaries[2].update_timestamp,
+        )
+        assert summaries[0].tags == {}
+
+        def _run_ids(**kwargs):
+            return [summary.run_id for summary in storage.get_run_summaries(**kwargs)]
+
+        assert _run_ids(pipeline_name='some_pipeline') == [three, one]
+        assert _run_ids(status=PipelineRunStatus.FAILURE) == [two]
+        assert _run_ids(tags=[('mytag', 'hello')]) == [two, one]
+        assert _run_ids(tags=[('mytag', 'hello'), ('mytag2', 'world')]) == [one]
+        assert _run_ids(pipeline_name='some_pipeline', tags=[('mytag', 'hello')]) == [one]
+        assert _run_ids(pipeline_name='some_pipeline', status=PipelineRunStatus.FAILURE) == []
+        assert _run_ids(cursor=three, limit=1) == [two]
+
+
+@run_storage_test
+def test_handle_run_event_updates_status(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        assert storage
+        run_id = str(uuid.uuid4())
+        storage.add_run(build_run(run_id=run_id, pipeline_name='some_pipeline'))
+
+        storage.handle_run_event(
+            run_id, DagsterEvent(DagsterEventType.PIPELINE_START.value, 'some_pipeline')
+        )
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.STARTED
+        assert storage.get_run_summaries()[0].status == PipelineRunStatus.STARTED
+
+        storage.handle_run_event(
+            run_id, DagsterEvent(DagsterEventType.PIPELINE_SUCCESS.value, 'some_pipeline')
+        )
+        assert storage.get_run_by_id(run_id).status == PipelineRunStatus.SUCCESS
+        assert [run.run_id for run in storage.get_runs_with_status(PipelineRunStatus.SUCCESS)] == [
+            run_id
+        ]
+        assert storage.all_runs()[0].status == PipelineRunStatus.SUCCESS
+
+
+def test_sqlite_run_storage_creates_missing_indexes():
+    with seven.TemporaryDirectory() as tempdir:
+        # a database created before the runs and run_tags tables were indexed
+        engine = create_engine('sqlite:///{}'.format(os.path.join(tempdir, 'runs.db')))
+        RunStorageSQLMetadata.create_all(engine)
+        for table in RunStorageSQLMetadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(engine)
+
+        run_id = str(uuid.uuid4())
+        storage = SqliteRunStorage.from_local(tempdir)
+        storage.add_run(build_run(run_id=run_id, pipeline_name='some_pipeline'))
+
+        inspector = db.inspect(storage.engine)
+        assert {index['name'] for index in inspector.get_indexes('runs')} == {
+            'idx_runs_pipeline_name',
+            'idx_runs_status',
+        }
+        assert {index['name'] for index in inspector.get_indexes('run_tags')} == {
+            'idx_run_tags_key_value',
+            'idx_run_tags_run_id',
+        }
+        assert storage.get_run_summaries(pipeline_name='some_pipeline')[0].run_id == run_id
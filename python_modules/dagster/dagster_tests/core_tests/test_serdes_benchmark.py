@@ -0,0 +1,79 @@
+import time
+
+from dagster import seven
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord, LogMessageRecord
+from dagster.core.execution.plan.objects import StepOutputData, StepOutputHandle, StepSuccessData
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+NUM_EVENTS = 10000
+
+
+def _event_record_corpus(run_id):
+    def _dagster_event_record(index, event_type, step_key=None, event_specific_data=None):
+        return DagsterEventRecord(
+            None,
+            'Message {index}'.format(index=index),
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            step_key=step_key,
+            dagster_event=DagsterEvent(
+                event_type.value,
+                'pipeline',
+                step_key=step_key,
+                event_specific_data=event_specific_data,
+            ),
+        )
+
+    records = []
+    for index in range(NUM_EVENTS):
+        step_key = 'solid_{index}.compute'.format(index=index % 100)
+        kind = index % 4
+        if kind == 0:
+            records.append(
+                LogMessageRecord(
+                    None, 'Log {index}'.format(index=index), 'info', '', run_id, time.time()
+                )
+            )
+        elif kind == 1:
+            records.append(
+                _dagster_event_record(
+                    index,
+                    DagsterEventType.STEP_OUTPUT,
+                    step_key,
+                    StepOutputData(StepOutputHandle(step_key, 'result')),
+                )
+            )
+        elif kind == 2:
+            records.append(
+                _dagster_event_record(
+                    index, DagsterEventType.STEP_SUCCESS, step_key, StepSuccessData(0.1)
+                )
+            )
+        else:
+            records.append(
+                _dagster_event_record(
+                    index, DagsterEventType.ENGINE_EVENT, None, EngineEventData.in_process(999)
+                )
+            )
+    return records
+
+
+def test_serdes_event_record_corpus(monkeypatch):
+    records = _event_record_corpus('run_id')
+
+    serialized = [serialize_dagster_namedtuple(record) for record in records]
+
+    # Constructor arguments are inspected once per class as it is whitelisted, not per object
+    get_args_calls = []
+    get_args = seven.get_args
+    monkeypatch.setattr(
+        seven, 'get_args', lambda klass: get_args_calls.append(klass) or get_args(klass)
+    )
+
+    deserialized = [deserialize_json_to_dagster_namedtuple(json_str) for json_str in serialized]
+
+    assert deserialized == records
+    assert get_args_calls == []
@@ -0,0 +1,218 @@
+import pytest
+
+from dagster import (
+    Any,
+    Bool,
+    Dict,
+    Enum,
+    EnumValue,
+    Field,
+    InputDefinition,
+    Int,
+    List,
+    Optional,
+    PermissiveDict,
+    PipelineDefinition,
+    Set,
+    String,
+    Tuple,
+    composite_solid,
+    pipeline,
+    solid,
+)
+from dagster.core.definitions import create_environment_schema
+from dagster.core.types import Selector
+from dagster.core.types.evaluator import evaluate_config
+from dagster.core.types.evaluator.compiled import get_compiled_evaluator
+from dagster.core.types.evaluator.traversal_context import TraversalContext
+from dagster.core.types.field import resolve_to_config_type
+
+NUM_SOLIDS = 500
+
+
+def assert_same_result(config_type, config_value, pipeline_def=None):
+    interpreted = evaluate_config(config_type, config_value, pipeline_def)
+    compiled = evaluate_config(config_type, config_value, pipeline_def, compiled=True)
+    assert compiled == interpreted
+    return compiled
+
+
+NestedDict = Dict(
+    {
+        'required_str': Field(String),
+        'optional_int': Field(Int, is_optional=True),
+        'default_bool': Field(Bool, is_optional=True, default_value=True),
+        'nested': Field(
+            Dict({'list_of_int': Field(List[Int]), 'any': Field(Any, is_optional=True)}),
+            is_optional=True,
+        ),
+        'nullable': Field(Optional[String], is_optional=True),
+        'set_of_str': Field(Set[String], is_optional=True),
+        'tuple': Field(Tuple[Int, String], is_optional=True),
+        'permissive': Field(PermissiveDict({'known': Field(Int)}), is_optional=True),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    'config_value',
+    [
+        {'required_str': 'foo'},
+        {'required_str': 'foo', 'optional_int': 2, 'default_bool': False},
+        {'required_str': 'foo', 'nested': {'list_of_int': [1, 2, 3], 'any': object}},
+        {'required_str': 'foo', 'nullable': None},
+        {'required_str': 'foo', 'set_of_str': ['a', 'b', 'a']},
+        {'required_str': 'foo', 'tuple': [1, 'one']},
+        {'required_str': 'foo', 'permissive': {'known': 1, 'unknown': 'bar'}},
+        # Invalid values
+        None,
+        'not a dict',
+        {},
+        {'required_str': 1},
+        {'required_str': 'foo', 'extra': 1, 'another_extra': 2},
+        {'required_str': 'foo', 'nested': {'list_of_int': ['one']}},
+        {'required_str': 'foo', 'nested': {'list_of_int': 1}},
+        {'required_str': 'foo', 'set_of_str': [1]},
+        {'required_str': 'foo', 'tuple': [1]},
+        {'required_str': 'foo', 'permissive': {}},
+    ],
+)
+def test_compiled_dict(config_value):
+    assert_same_result(resolve_to_config_type(NestedDict), config_value)
+
+
+@pytest.mark.parametrize(
+    'config_value',
+    [{'a': 'foo'}, {'b': {'c': 1}}, None, {}, {'a': 'foo', 'b': {'c': 1}}, {'d': 1}, 'a'],
+)
+def test_compiled_selector(config_value):
+    assert_same_result(
+        resolve_to_config_type(Selector({'a': Field(String), 'b': Field(Dict({'c': Field(Int)}))})),
+        config_value,
+    )
+
+
+@pytest.mark.parametrize('config_value', [None, {}, {'a': 'bar'}])
+def test_compiled_selector_with_default(config_value):
+    result = assert_same_result(
+        resolve_to_config_type(
+            Selector({'a': Field(String, is_optional=True, default_value='foo')})
+        ),
+        config_value,
+    )
+    assert result.success
+
+
+@pytest.mark.parametrize('config_value', ['FOO', 'BAZ', 1])
+def test_compiled_enum(config_value):
+    assert_same_result(
+        resolve_to_config_type(
+            Enum('AnEnum', [EnumValue('FOO', python_value=1), EnumValue('BAR')])
+        ),
+        config_value,
+    )
+
+
+def test_compiled_evaluator_is_cached():
+    config_type = resolve_to_config_type(NestedDict)
+    assert get_compiled_evaluator(config_type) is get_compiled_evaluator(config_type)
+
+
+@solid(config={'str_config': Field(String)})
+def mapped_solid(context):
+    return context.solid_config['str_config']
+
+
+@composite_solid(
+    config={'override': Field(String)},
+    config_fn=lambda _, cfg: {'mapped_solid': {'config': {'str_config': cfg['override']}}},
+)
+def mapping_composite():
+    return mapped_solid()
+
+
+@pipeline
+def config_mapping_pipeline():
+    return mapping_composite()
+
+
+@pytest.mark.parametrize(
+    'environment_dict',
+    [
+        {'solids': {'mapping_composite': {'config': {'override': 'foo'}}}},
+        {'solids': {'mapping_composite': {'config': {'override': 1}}}},
+        {'solids': {}},
+    ],
+)
+def test_compiled_config_mapping(environment_dict):
+    assert_same_result(
+        create_environment_schema(config_mapping_pipeline).environment_type,
+        environment_dict,
+        config_mapping_pipeline,
+    )
+
+
+def define_wide_pipeline(num_solids):
+    solid_defs = []
+    for index in range(num_solids):
+
+        @solid(
+            name='solid_{index}'.format(index=index),
+            input_defs=[InputDefinition('num', Int)],
+            config={
+                'name': Field(String),
+                'factor': Field(Int, is_optional=True, default_value=1),
+                'tags': Field(List[String], is_optional=True),
+            },
+        )
+        def _solid(context, num):
+            return num * context.solid_config['factor']
+
+        solid_defs.append(_solid)
+
+    return PipelineDefinition(name='wide_pipeline', solid_defs=solid_defs)
+
+
+def wide_pipeline_environment_dict(num_solids):
+    return {
+        'solids': {
+            'solid_{index}'.format(index=index): {
+                'config': {'name': 'solid {index}'.format(index=index), 'tags': ['a', 'b']},
+                'inputs': {'num': {'value': index}},
+            }
+            for index in range(num_solids)
+        },
+        'storage': {'filesystem': {}},
+    }
+
+
+def test_compiled_evaluator_wide_pipeline(monkeypatch):
+    pipeline_def = define_wide_pipeline(NUM_SOLIDS)
+    environment_type = create_environment_schema(pipeline_def).environment_type
+    environment_dict = wide_pipeline_environment_dict(NUM_SOLIDS)
+
+    interpreted = evaluate_config(environment_type, environment_dict, pipeline_def)
+
+    # Compile the evaluator before counting the traversals of evaluations
+    evaluate_config(environment_type, environment_dict, pipeline_def, compiled=True)
+
+    traversals = []
+    new_traversal_context = TraversalContext.__new__
+    monkeypatch.setattr(
+        TraversalContext,
+        '__new__',
+        lambda cls, *args, **kwargs: traversals.append(args)
+        or new_traversal_context(cls, *args, **kwargs),
+    )
+
+    compiled = evaluate_config(environment_type, environment_dict, pipeline_def, compiled=True)
+
+    assert interpreted.success
+    assert compiled == interpreted
+
+    # Valid config is evaluated without falling back to the interpreter
+    assert traversals == []
+
+    # Errors are still reported by the interpreter
+    del environment_dict['solids']['solid_7']['config']['name']
+    assert assert_same_result(environment_type, environment_dict, pipeline_def).errors
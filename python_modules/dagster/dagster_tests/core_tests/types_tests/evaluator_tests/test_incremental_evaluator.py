@@ -0,0 +1,135 @@
+from dagster.core.definitions import create_environment_schema
+from dagster.core.types.evaluator import evaluate_config, evaluate_config_incremental, incremental
+
+from .test_compiled_evaluator import define_wide_pipeline, wide_pipeline_environment_dict
+
+NUM_SOLIDS = 50
+
+
+def _evaluate(pipeline_def, environment_dict, previous_evaluation=None, changed_path=None):
+    environment_type = create_environment_schema(pipeline_def).environment_type
+    evaluation = evaluate_config_incremental(
+        environment_type,
+        environment_dict,
+        previous_evaluation=previous_evaluation,
+        changed_path=changed_path,
+        pipeline=pipeline_def,
+    )
+    assert evaluation.result == evaluate_config(environment_type, environment_dict, pipeline_def)
+    return evaluation
+
+
+def test_incremental_evaluation_reuses_unchanged_branches():
+    pipeline_def = define_wide_pipeline(NUM_SOLIDS)
+    environment_dict = wide_pipeline_environment_dict(NUM_SOLIDS)
+
+    evaluation = _evaluate(pipeline_def, environment_dict)
+    assert evaluation.result.success
+    assert len(evaluation.branch_results) == NUM_SOLIDS
+
+    # Introduce an error in one solid
+    environment_dict['solids']['solid_3']['config']['factor'] = 'not an int'
+    next_evaluation = _evaluate(
+        pipeline_def, environment_dict, evaluation, ['solids', 'solid_3', 'config', 'factor']
+    )
+    assert not next_evaluation.result.success
+    assert len(next_evaluation.result.errors) == 1
+    assert next_evaluation.result.errors[0].stack.levels == [
+        'solids',
+        'solid_3',
+        'config',
+        'factor',
+    ]
+
+    for branch_path, branch_result in next_evaluation.branch_results.items():
+        if branch_path == ('solids', 'solid_3'):
+            assert branch_result is not evaluation.branch_results[branch_path]
+        else:
+            assert branch_result is evaluation.branch_results[branch_path]
+
+    # Introduce an error in another solid, without saying where
+    del environment_dict['solids']['solid_7']['config']['name']
+    evaluation = _evaluate(pipeline_def, environment_dict, next_evaluation)
+    assert len(evaluation.result.errors) == 2
+    assert (
+        evaluation.branch_results[('solids', 'solid_3')]
+        is next_evaluation.branch_results[('solids', 'solid_3')]
+    )
+
+    # Fix both
+    environment_dict['solids']['solid_3']['config']['factor'] = 3
+    environment_dict['solids']['solid_7']['config']['name'] = 'seven'
+    evaluation = _evaluate(pipeline_def, environment_dict, evaluation)
+    assert evaluation.result.success
+    assert evaluation.result.value['solids']['solid_3']['config']['factor'] == 3
+
+
+def test_incremental_evaluation_is_type_strict():
+    pipeline_def = define_wide_pipeline(2)
+    environment_dict = wide_pipeline_environment_dict(2)
+    environment_dict['solids']['solid_0']['config']['factor'] = 1
+
+    evaluation = _evaluate(pipeline_def, environment_dict)
+    assert evaluation.result.success
+
+    # 1 == 1.0, but only one of them is a valid Int
+    environment_dict['solids']['solid_0']['config']['factor'] = 1.0
+    evaluation = _evaluate(pipeline_def, environment_dict, evaluation)
+    assert not evaluation.result.success
+
+
+def test_incremental_evaluation_of_missing_and_extra_branches():
+    pipeline_def = define_wide_pipeline(3)
+    environment_dict = wide_pipeline_environment_dict(3)
+
+    evaluation = _evaluate(pipeline_def, environment_dict)
+
+    del environment_dict['solids']['solid_1']
+    evaluation = _evaluate(pipeline_def, environment_dict, evaluation, ['solids', 'solid_1'])
+    assert not evaluation.result.success
+    assert ('solids', 'solid_1') not in evaluation.branch_results
+
+    environment_dict['solids']['solid_1'] = wide_pipeline_environment_dict(3)['solids']['solid_1']
+    environment_dict['solids']['not_a_solid'] = {}
+    evaluation = _evaluate(pipeline_def, environment_dict, evaluation, ['solids'])
+    assert not evaluation.result.success
+
+    del environment_dict['solids']
+    evaluation = _evaluate(pipeline_def, environment_dict, evaluation, ['solids'])
+    assert not evaluation.result.success
+    assert evaluation.branch_results == {}
+
+
+def test_incremental_evaluation_wide_pipeline(monkeypatch):
+    num_solids = 500
+    pipeline_def = define_wide_pipeline(num_solids)
+    environment_type = create_environment_schema(pipeline_def).environment_type
+    environment_dict = wide_pipeline_environment_dict(num_solids)
+    environment_dict['solids']['solid_0']['config']['factor'] = 'invalid'
+
+    evaluated_branches = []
+    evaluate_branch = incremental._evaluate_config  # pylint: disable=protected-access
+    monkeypatch.setattr(
+        incremental,
+        '_evaluate_config',
+        lambda context: evaluated_branches.append(context.config_value) or evaluate_branch(context),
+    )
+
+    evaluation = evaluate_config_incremental(
+        environment_type, environment_dict, pipeline=pipeline_def
+    )
+    assert len(evaluated_branches) == num_solids
+
+    environment_dict['solids']['solid_1']['config']['factor'] = 'invalid'
+    evaluated_branches[:] = []
+    evaluation = evaluate_config_incremental(
+        environment_type,
+        environment_dict,
+        previous_evaluation=evaluation,
+        changed_path=['solids', 'solid_1', 'config', 'factor'],
+        pipeline=pipeline_def,
+    )
+
+    # Only the changed solid is re-evaluated
+    assert evaluated_branches == [environment_dict['solids']['solid_1']]
+    assert len(evaluation.result.errors) == 2
@@ -1,9 +1,59 @@
-from dagster.core.types.marshal import PickleSerializationStrategy
+import io
+import pickle
+
+import pytest
+
+from dagster import check
+from dagster.core.types.marshal import (
+    CompressedPickleSerializationStrategy,
+    PickleSerializationStrategy,
+)
 from dagster.utils import safe_tempfile_path
 
 
+class TrickleFile(object):
+    '''A file object which returns fewer bytes than asked for from each read.'''
+
+    def __init__(self, data):
+        self._bytes_io = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._bytes_io.read(min(size, 7) if size > 0 else size)
+
+
 def test_serialization_strategy():
     serialization_strategy = PickleSerializationStrategy()
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file('foo', tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
+
+
+def test_pickle_protocol():
+    serialization_strategy = PickleSerializationStrategy(protocol=pickle.HIGHEST_PROTOCOL)
+    bytes_io = io.BytesIO()
+    serialization_strategy.serialize('foo', bytes_io)
+    bytes_io.seek(0)
+    assert serialization_strategy.deserialize(bytes_io) == 'foo'
+
+
+def test_compressed_pickle_serialization_strategy():
+    serialization_strategy = CompressedPickleSerializationStrategy()
+    value = {'repeated': 'foo' * 1000000, 'list': list(range(1000))}
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(value, tempfile_path)
+        with open(tempfile_path, 'rb') as read_obj:
+            data = read_obj.read()
+        assert serialization_strategy.deserialize_from_file(tempfile_path) == value
+
+    assert len(data) < len(pickle.dumps(value)) // 10
+    assert serialization_strategy.deserialize(TrickleFile(data)) == value
+    assert (
+        CompressedPickleSerializationStrategy(compression_level=9).deserialize(TrickleFile(data))
+        == value
+    )
+
+
+def test_invalid_compression_level():
+    with pytest.raises(check.ParameterCheckError):
+        CompressedPickleSerializationStrategy(compression_level=0)
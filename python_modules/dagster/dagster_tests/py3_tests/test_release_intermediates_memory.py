@@ -0,0 +1,87 @@
+import tracemalloc
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    MultiDependencyDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    execute_pipeline,
+    lambda_solid,
+)
+
+VALUE_SIZE = 5 * 1024 * 1024
+NUM_BRANCHES = 4
+BRANCH_DEPTH = 3
+
+
+def define_fan_out_fan_in_pipeline():
+    @lambda_solid
+    def emit_big():
+        return b'x' * VALUE_SIZE
+
+    @lambda_solid(input_defs=[InputDefinition('value')])
+    def transform_big(value):
+        # always build a new value, bytes.replace hands back its input when nothing matches
+        return value[1:] + value[:1]
+
+    @lambda_solid(input_defs=[InputDefinition('values')])
+    def total_size(values):
+        return sum(len(value) for value in values)
+
+    dependencies = {}
+    for branch in range(NUM_BRANCHES):
+        upstream = 'emit_big'
+        for depth in range(BRANCH_DEPTH):
+            name = 'transform_{branch}_{depth}'.format(branch=branch, depth=depth)
+            dependencies[SolidInvocation('transform_big', name)] = {
+                'value': DependencyDefinition(upstream)
+            }
+            upstream = name
+
+    dependencies['total_size'] = {
+        'values': MultiDependencyDefinition(
+            [
+                DependencyDefinition(
+                    'transform_{branch}_{depth}'.format(branch=branch, depth=BRANCH_DEPTH - 1)
+                )
+                for branch in range(NUM_BRANCHES)
+            ]
+        )
+    }
+
+    return PipelineDefinition(
+        name='fan_out_fan_in',
+        solid_defs=[emit_big, transform_big, total_size],
+        dependencies=dependencies,
+    )
+
+
+def _peak_memory(release_intermediates):
+    pipeline_def = define_fan_out_fan_in_pipeline()
+    tracemalloc.start()
+    try:
+        result = execute_pipeline(
+            pipeline_def,
+            environment_dict={
+                'execution': {
+                    'in_process': {'config': {'release_intermediates': release_intermediates}}
+                }
+            },
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.success
+    assert result.result_for_solid('total_size').output_value() == VALUE_SIZE * NUM_BRANCHES
+    return peak
+
+
+def test_release_intermediates_peak_memory():
+    retained_peak = _peak_memory(release_intermediates=False)
+    released_peak = _peak_memory(release_intermediates=True)
+
+    # Retaining holds all 13 values by the end of the run, while releasing holds at most two
+    # levels of the fan out at once
+    assert released_peak < retained_peak * 0.75
@@ -0,0 +1,38 @@
+import pytest
+
+from dagster import check
+from dagster.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    # Reading 'a' makes 'b' the least recently used entry
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert len(cache) == 2
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('b', 'default') == 'default'
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_lru_cache_put_replaces_value():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('a', 2)
+    assert len(cache) == 1
+    assert cache.get('a') == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert 'a' not in cache
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(check.ParameterCheckError):
+        LRUCache(0)
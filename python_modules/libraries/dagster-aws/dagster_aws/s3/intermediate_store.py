@@ -2,15 +2,28 @@ from dagster import check
 from dagster.core.storage.intermediate_store import IntermediateStore
 from dagster.core.storage.type_storage import TypeStoragePluginRegistry
 
-from .object_store import S3ObjectStore
+from .object_store import DEFAULT_MAX_CONCURRENCY, DEFAULT_MULTIPART_CHUNKSIZE, S3ObjectStore
 
 
 class S3IntermediateStore(IntermediateStore):
-    def __init__(self, s3_bucket, run_id, s3_session=None, type_storage_plugin_registry=None):
+    def __init__(
+        self,
+        s3_bucket,
+        run_id,
+        s3_session=None,
+        type_storage_plugin_registry=None,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
         check.str_param(s3_bucket, 's3_bucket')
         check.str_param(run_id, 'run_id')
 
-        object_store = S3ObjectStore(s3_bucket, s3_session=s3_session)
+        object_store = S3ObjectStore(
+            s3_bucket,
+            s3_session=s3_session,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
 
         def root_for_run_id(r_id):
             return object_store.key_for_paths(['dagster', 'storage', r_id])
@@ -1,7 +1,10 @@
+import io
 import logging
-from io import BytesIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+from botocore.exceptions import ClientError
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
@@ -9,10 +12,54 @@ from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
 
+# S3 rejects multipart uploads with parts (other than the last) smaller than this
+MIN_MULTIPART_CHUNKSIZE = 5 * 1024 * 1024
+
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+
+# The most keys a single delete_objects request may delete
+MAX_DELETE_OBJECTS_KEYS = 1000
+
+# The number of keys from which has_objects lists keys rather than checking each key
+HAS_OBJECTS_LIST_THRESHOLD = 16
+
+
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    '''An object store backed by an S3 bucket.
+
+    Objects are serialized straight into a multipart upload, and deserialized straight from the
+    body of the download, so that neither is held in memory in full.
+
+    Args:
+        bucket (str): The S3 bucket.
+        s3_session (Optional[botocore.client.S3]): The S3 client to use.
+        multipart_chunksize (Optional[int]): The size in bytes of each part of a multipart upload,
+            at least 5MiB. Objects which serialize to less than this are uploaded with a single
+            put_object. (default: 8MiB)
+        max_concurrency (Optional[int]): The maximum number of parts uploaded at once. At most
+            this many parts, plus the one being serialized, are held in memory. Also the maximum
+            number of objects copied at once by cp_objects. (default: 10)
+    '''
+
+    def __init__(
+        self,
+        bucket,
+        s3_session=None,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
         self.bucket = check.str_param(bucket, 'bucket')
         self.s3 = s3_session or boto3.client('s3')
+        self.multipart_chunksize = check.int_param(multipart_chunksize, 'multipart_chunksize')
+        check.param_invariant(
+            multipart_chunksize >= MIN_MULTIPART_CHUNKSIZE,
+            'multipart_chunksize',
+            'must be at least {min_size} bytes'.format(min_size=MIN_MULTIPART_CHUNKSIZE),
+        )
+        self.max_concurrency = check.int_param(max_concurrency, 'max_concurrency')
+        check.param_invariant(max_concurrency > 0, 'max_concurrency', 'must be positive')
+
         self.s3.head_bucket(Bucket=bucket)
         super(S3ObjectStore, self).__init__('s3', sep='/')
 
@@ -26,14 +73,11 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning('Removing existing S3 key: {key}'.format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
-            serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+        # Any existing object at the key is overwritten in place
+        with _S3MultipartWriter(
+            self.s3, self.bucket, key, self.multipart_chunksize, self.max_concurrency
+        ) as writer:
+            serialization_strategy.serialize(obj, writer)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -49,9 +93,10 @@ class S3ObjectStore(ObjectStore):
         check.param_invariant(len(key) > 0, 'key')
 
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
-        )
+        body = self.s3.get_object(Bucket=self.bucket, Key=key)['Body']
+        with io.BufferedReader(_S3StreamingReader(body)) as reader:
+            obj = serialization_strategy.deserialize(reader)
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -65,32 +110,60 @@ class S3ObjectStore(ObjectStore):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)['KeyCount']
-        return bool(key_count > 0)
+        try:
+            self.s3.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if not _is_not_found_error(e):
+                raise
+
+        # Objects written by type storage plugins may be stored as many keys under the key
+        results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key + self.sep, MaxKeys=1)
+        return results['KeyCount'] > 0
+
+    def has_objects(self, keys):
+        check.list_param(keys, 'keys', of_type=str)
+
+        # Listing everything under the common prefix of the keys (e.g. all of the intermediates of
+        # a run) only pays off when there are many keys, so check a few keys one at a time
+        prefix = _common_prefix(keys, self.sep)
+        if len(keys) < HAS_OBJECTS_LIST_THRESHOLD or not prefix:
+            return [self.has_object(key) for key in keys]
+
+        # A key exists if it was listed itself, or if keys were listed under it
+        existing_keys = set()
+        for listed_key in self._list_keys(prefix):
+            existing_keys.add(listed_key)
+            parent_key = listed_key
+            while self.sep in parent_key[len(prefix) :]:
+                parent_key = parent_key.rsplit(self.sep, 1)[0]
+                if parent_key in existing_keys:
+                    break
+                existing_keys.add(parent_key)
+
+        return [key in existing_keys for key in keys]
 
     def rm_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        def delete_for_results(store, results):
-            store.s3.delete_objects(
-                Bucket=store.bucket,
-                Delete={'Objects': [{'Key': result['Key']} for result in results['Contents']]},
+        # Remove the key and any keys under it, but not other keys which merely share its prefix
+        keys_to_delete = [
+            listed_key
+            for listed_key in self._list_keys(key)
+            if listed_key == key or listed_key.startswith(key + self.sep)
+        ]
+        for index in range(0, len(keys_to_delete), MAX_DELETE_OBJECTS_KEYS):
+            self.s3.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    'Objects': [
+                        {'Key': key_to_delete}
+                        for key_to_delete in keys_to_delete[index : index + MAX_DELETE_OBJECTS_KEYS]
+                    ]
+                },
             )
 
-        if self.has_object(key):
-            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
-            delete_for_results(self, results)
-
-            continuation = results['IsTruncated']
-            while continuation:
-                continuation_token = results['NextContinuationToken']
-                results = self.s3.list_objects_v2(
-                    Bucket=self.bucket, Prefix=key, ContinuationToken=continuation_token
-                )
-                delete_for_results(self, results)
-                continuation = results['IsTruncated']
-
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.RM_OBJECT,
             key=self.uri_for_key(key),
@@ -100,6 +173,17 @@ class S3ObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def _list_keys(self, prefix):
+        kwargs = {}
+        while True:
+            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix, **kwargs)
+            for result in results.get('Contents', []):
+                yield result['Key']
+
+            if not results['IsTruncated']:
+                return
+            kwargs['ContinuationToken'] = results['NextContinuationToken']
+
     def cp_object(self, src, dst):
         check.str_param(src, 'src')
         check.str_param(dst, 'dst')
@@ -115,7 +199,176 @@ class S3ObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def cp_objects(self, src_dst_pairs):
+        check.list_param(src_dst_pairs, 'src_dst_pairs', of_type=tuple)
+        if len(src_dst_pairs) <= 1:
+            return [self.cp_object(src, dst) for src, dst in src_dst_pairs]
+
+        # Each copy happens server side, so the time taken is mostly request latency
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(src_dst_pairs))
+        ) as executor:
+            return list(executor.map(lambda src_dst: self.cp_object(*src_dst), src_dst_pairs))
+
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, 'key')
         protocol = check.opt_str_param(protocol, 'protocol', default='s3://')
         return protocol + self.bucket + '/' + '{key}'.format(key=key)
+
+
+def _is_not_found_error(error):
+    return error.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound')
+
+
+def _common_prefix(keys, sep):
+    '''The longest prefix of all of keys which ends with sep, or the empty string.'''
+    if not keys:
+        return ''
+
+    prefix = keys[0]
+    for key in keys[1:]:
+        while not key.startswith(prefix):
+            prefix = prefix[:-1]
+
+    return prefix[: prefix.rfind(sep) + 1]
+
+
+class _S3MultipartWriter(io.RawIOBase):
+    '''A writable stream which uploads what is written to it to an S3 key.
+
+    Writes are buffered until they make up a part of multipart_chunksize bytes, which is then
+    uploaded in the background. The upload is completed when the writer is used as a context
+    manager and exits, or aborted if it exits with an exception. If less than one part is written,
+    the object is uploaded with a single put_object instead.
+    '''
+
+    def __init__(self, s3, bucket, key, multipart_chunksize, max_concurrency):
+        super(_S3MultipartWriter, self).__init__()
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._multipart_chunksize = multipart_chunksize
+        self._max_concurrency = max_concurrency
+
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._executor = None
+
+        # Futures of the parts being uploaded, in part number order, and the parts uploaded
+        self._pending_parts = deque()
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self.closed:
+            raise ValueError('write to closed file')
+
+        # Serializers may write a large object at once, so fill the buffer a part at a time rather
+        # than appending everything and slicing parts off its front
+        data = memoryview(b)
+        offset = 0
+        while offset < len(data):
+            num_bytes = min(self._multipart_chunksize - len(self._buffer), len(data) - offset)
+            self._buffer += data[offset : offset + num_bytes]
+            offset += num_bytes
+
+            if len(self._buffer) == self._multipart_chunksize:
+                self._upload_part(bytes(self._buffer))
+                self._buffer = bytearray()
+
+        return len(data)
+
+    def _upload_part(self, part):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                'UploadId'
+            ]
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+
+        # Bound the number of parts held in memory by waiting for the oldest upload to finish
+        while len(self._pending_parts) >= self._max_concurrency:
+            self._parts.append(self._pending_parts.popleft().result())
+
+        part_number = len(self._parts) + len(self._pending_parts) + 1
+        self._pending_parts.append(self._executor.submit(self._put_part, part_number, part))
+
+    def _put_part(self, part_number, part):
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=part,
+        )
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    def _complete(self):
+        if self._upload_id is None:
+            self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=io.BytesIO(self._buffer))
+            return
+
+        if self._buffer:
+            self._upload_part(bytes(self._buffer))
+
+        while self._pending_parts:
+            self._parts.append(self._pending_parts.popleft().result())
+
+        self._s3.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={'Parts': self._parts},
+        )
+
+    def _abort(self):
+        if self._upload_id is None:
+            return
+
+        for pending_part in self._pending_parts:
+            pending_part.cancel()
+
+        self._s3.abort_multipart_upload(
+            Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+        )
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                try:
+                    self._complete()
+                except Exception:  # pylint: disable=broad-except
+                    self._abort()
+                    raise
+            else:
+                self._abort()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._buffer = bytearray()
+            self.close()
+
+
+class _S3StreamingReader(io.RawIOBase):
+    '''A readable stream over the body of an S3 object, which is read from the response as it is
+    consumed rather than all at once. Wrap in an io.BufferedReader for readline, peek, etc.
+    '''
+
+    def __init__(self, body):
+        super(_S3StreamingReader, self).__init__()
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._body.read(len(b))
+        num_bytes = len(data)
+        b[:num_bytes] = data
+        return num_bytes
+
+    def close(self):
+        if not self.closed:
+            self._body.close()
+        super(_S3StreamingReader, self).close()
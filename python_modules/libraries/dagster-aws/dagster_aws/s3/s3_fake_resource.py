@@ -15,26 +15,73 @@ class S3FakeSession:
     def __init__(self, buckets=None):
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
         self.mock_extras = mock.MagicMock()
+        # upload id -> (bucket, key, {part number -> part})
+        self.multipart_uploads = {}
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
 
     def head_object(self, Bucket, Key, *args, **kwargs):
         self.mock_extras.head_object(*args, **kwargs)
-        return {'ContentLength': len(self.buckets.get(Bucket, {}).get(Key, b''))}
-
-    def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
-        self.mock_extras.list_objects_v2(*args, **kwargs)
-        key = self.buckets.get(Bucket, {}).get(Prefix)
-        if key:
-            return {'KeyCount': 1, 'Contents': [{'Key': key}], 'IsTruncated': False}
-        else:
-            return {'KeyCount': 0, 'Contents': [], 'IsTruncated': False}
+        if not self._has_object(Bucket, Key):
+            raise ClientError({'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+
+        return {'ContentLength': len(self.buckets[Bucket][Key])}
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys=1000, ContinuationToken=None, **kwargs):
+        self.mock_extras.list_objects_v2(**kwargs)
+        keys = sorted(key for key in self.buckets.get(Bucket, {}) if key.startswith(Prefix))
+        start = int(ContinuationToken) if ContinuationToken else 0
+        page = keys[start : start + MaxKeys]
+        results = {
+            'KeyCount': len(page),
+            'Contents': [{'Key': key} for key in page],
+            'IsTruncated': start + MaxKeys < len(keys),
+        }
+        if results['IsTruncated']:
+            results['NextContinuationToken'] = str(start + MaxKeys)
+        return results
+
+    def delete_objects(self, Bucket, Delete, *args, **kwargs):
+        self.mock_extras.delete_objects(*args, **kwargs)
+        for obj in Delete['Objects']:
+            self.buckets[Bucket].pop(obj['Key'], None)
+
+    def copy_object(self, Bucket, Key, CopySource, *args, **kwargs):
+        self.mock_extras.copy_object(*args, **kwargs)
+        self.buckets[Bucket][Key] = self.buckets[CopySource['Bucket']][CopySource['Key']]
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
         self.buckets[Bucket][Key] = Body.read()
 
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = 'upload-{num}'.format(num=len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = (Bucket, Key, {})
+        return {'Bucket': Bucket, 'Key': Key, 'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self.mock_extras.upload_part(*args, **kwargs)
+        _, _, parts = self.multipart_uploads[UploadId]
+        parts[PartNumber] = Body
+        return {'ETag': 'etag-{part_number}'.format(part_number=PartNumber)}
+
+    def complete_multipart_upload(
+        self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        _, _, parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            parts[part['PartNumber']] for part in MultipartUpload['Parts']
+        )
+
+    def abort_multipart_upload(
+        self, Bucket, Key, UploadId, *args, **kwargs
+    ):  # pylint: disable=unused-argument
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        self.multipart_uploads.pop(UploadId)
+
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self._has_object(Bucket, Key):
             raise ClientError({}, None)
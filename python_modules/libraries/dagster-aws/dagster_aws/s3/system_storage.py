@@ -1,15 +1,37 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
-from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
+from dagster.core.storage.system_storage import (
+    REFERENCE_PREVIOUS_RUN_FIELD,
+    fs_system_storage,
+    mem_system_storage,
+)
 
 from .file_manager import S3FileManager
 from .intermediate_store import S3IntermediateStore
+from .object_store import DEFAULT_MAX_CONCURRENCY, DEFAULT_MULTIPART_CHUNKSIZE
 
 
 @system_storage(
     name='s3',
     is_persistent=True,
-    config={'s3_bucket': Field(String)},
+    config={
+        's3_bucket': Field(String),
+        'multipart_chunksize': Field(
+            Int,
+            is_optional=True,
+            default_value=DEFAULT_MULTIPART_CHUNKSIZE,
+            description='The size in bytes of each part of the multipart uploads of '
+            'intermediates, at least 5MiB.',
+        ),
+        'max_concurrency': Field(
+            Int,
+            is_optional=True,
+            default_value=DEFAULT_MAX_CONCURRENCY,
+            description='The maximum number of parts of an intermediate uploaded at once, and '
+            'of intermediates copied at once.',
+        ),
+        'reference_previous_run': REFERENCE_PREVIOUS_RUN_FIELD,
+    },
     required_resource_keys={'s3'},
 )
 def s3_system_storage(init_context):
@@ -27,7 +49,10 @@ def s3_system_storage(init_context):
                 s3_bucket=init_context.system_storage_config['s3_bucket'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
-            )
+                multipart_chunksize=init_context.system_storage_config['multipart_chunksize'],
+                max_concurrency=init_context.system_storage_config['max_concurrency'],
+            ),
+            reference_previous_run=init_context.system_storage_config['reference_previous_run'],
         ),
     )
 
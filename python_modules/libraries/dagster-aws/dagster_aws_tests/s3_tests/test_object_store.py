@@ -0,0 +1,205 @@
+import io
+import os
+import pickle
+
+import pytest
+from dagster_aws.s3.object_store import (
+    HAS_OBJECTS_LIST_THRESHOLD,
+    MIN_MULTIPART_CHUNKSIZE,
+    S3ObjectStore,
+)
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster import check
+from dagster.core.types.marshal import PickleSerializationStrategy, SerializationStrategy
+from dagster.utils import PICKLE_PROTOCOL
+
+
+class RecordingBody(object):
+    '''An S3 response body which records the sizes of its reads.'''
+
+    def __init__(self, data):
+        self._bytes_io = io.BytesIO(data)
+        self.read_sizes = []
+        self.closed = False
+
+    def read(self, amt=None):
+        self.read_sizes.append(amt)
+        return self._bytes_io.read(amt)
+
+    def close(self):
+        self.closed = True
+
+
+class FailingSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Writes num_bytes, then raises.'''
+
+    def __init__(self, num_bytes):
+        self.num_bytes = num_bytes
+        super(FailingSerializationStrategy, self).__init__('failing')
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(os.urandom(self.num_bytes))
+        raise Exception('serialization failed')
+
+    def deserialize(self, read_file_obj):
+        raise NotImplementedError()
+
+
+def test_set_small_object():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    object_store.set_object('small', {'foo': 'bar'}, PickleSerializationStrategy())
+
+    assert s3_session.mock_extras.put_object.call_count == 1
+    assert s3_session.mock_extras.create_multipart_upload.call_count == 0
+    assert object_store.get_object('small', PickleSerializationStrategy()).obj == {'foo': 'bar'}
+
+
+def test_set_large_object_in_parts():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore(
+        'bucket',
+        s3_session=s3_session,
+        multipart_chunksize=MIN_MULTIPART_CHUNKSIZE,
+        max_concurrency=2,
+    )
+    obj = os.urandom(MIN_MULTIPART_CHUNKSIZE * 5 // 2)
+    num_parts = -(-len(pickle.dumps(obj, PICKLE_PROTOCOL)) // MIN_MULTIPART_CHUNKSIZE)
+
+    object_store.set_object('large', obj, PickleSerializationStrategy())
+
+    assert s3_session.mock_extras.put_object.call_count == 0
+    assert s3_session.mock_extras.upload_part.call_count == num_parts > 2
+    assert s3_session.mock_extras.complete_multipart_upload.call_count == 1
+    assert not s3_session.multipart_uploads
+    assert object_store.get_object('large', PickleSerializationStrategy()).obj == obj
+
+
+def test_failed_serialization_aborts_upload():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore(
+        'bucket', s3_session=s3_session, multipart_chunksize=MIN_MULTIPART_CHUNKSIZE
+    )
+
+    with pytest.raises(Exception, match='serialization failed'):
+        object_store.set_object(
+            'failed', None, FailingSerializationStrategy(MIN_MULTIPART_CHUNKSIZE + 1)
+        )
+
+    assert s3_session.mock_extras.abort_multipart_upload.call_count == 1
+    assert s3_session.mock_extras.complete_multipart_upload.call_count == 0
+    assert not s3_session.multipart_uploads
+    assert 'failed' not in s3_session.buckets['bucket']
+
+    # Nothing is uploaded if serialization fails before a full part is written
+    with pytest.raises(Exception, match='serialization failed'):
+        object_store.set_object('failed', None, FailingSerializationStrategy(1))
+
+    assert s3_session.mock_extras.put_object.call_count == 0
+    assert 'failed' not in s3_session.buckets['bucket']
+
+
+def test_get_object_streams_body():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+    obj = [os.urandom(1024) for _ in range(1024)]
+    object_store.set_object('streamed', obj, PickleSerializationStrategy())
+
+    body = RecordingBody(s3_session.buckets['bucket']['streamed'])
+    s3_session.get_object = lambda Bucket, Key: {'Body': body}
+
+    assert object_store.get_object('streamed', PickleSerializationStrategy()).obj == obj
+    assert body.closed
+    assert None not in body.read_sizes
+    assert max(body.read_sizes) < 1024 * 1024
+
+
+def test_invalid_multipart_config():
+    with pytest.raises(check.ParameterCheckError):
+        S3ObjectStore('bucket', s3_session=S3FakeSession(), multipart_chunksize=1024)
+
+    with pytest.raises(check.ParameterCheckError):
+        S3ObjectStore('bucket', s3_session=S3FakeSession(), max_concurrency=0)
+
+
+def test_set_object_overwrites_in_place():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    object_store.set_object('key', 1, PickleSerializationStrategy())
+    object_store.set_object('key', 2, PickleSerializationStrategy())
+
+    assert s3_session.mock_extras.put_object.call_count == 2
+    assert s3_session.mock_extras.head_object.call_count == 0
+    assert s3_session.mock_extras.list_objects_v2.call_count == 0
+    assert s3_session.mock_extras.delete_objects.call_count == 0
+    assert object_store.get_object('key', PickleSerializationStrategy()).obj == 2
+
+
+def _fake_session_with_keys(keys):
+    return S3FakeSession({'bucket': {key: b'' for key in keys}})
+
+
+def test_has_object():
+    s3_session = _fake_session_with_keys(['run/key', 'run/key_2', 'run/dir/part-0'])
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    assert object_store.has_object('run/key')
+    assert s3_session.mock_extras.list_objects_v2.call_count == 0
+
+    # Prefixes which are not keys, or keys under them, do not exist
+    assert not object_store.has_object('run/k')
+    assert not object_store.has_object('run/key_2/other')
+
+    # Objects stored as many keys under a key do
+    assert object_store.has_object('run/dir')
+
+
+@pytest.mark.parametrize('num_keys', [2, HAS_OBJECTS_LIST_THRESHOLD, 2500])
+def test_has_objects(num_keys):
+    keys = [
+        'run/intermediates/step_{index}/result'.format(index=index) for index in range(num_keys)
+    ]
+    s3_session = _fake_session_with_keys(keys[::2] + ['run/intermediates/dir/part-0'])
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    assert object_store.has_objects(keys + ['run/intermediates/dir', 'run/intermediates/d']) == (
+        [index % 2 == 0 for index in range(num_keys)] + [True, False]
+    )
+
+    if num_keys >= HAS_OBJECTS_LIST_THRESHOLD:
+        assert s3_session.mock_extras.head_object.call_count == 0
+        # One request per 1000 keys listed
+        assert s3_session.mock_extras.list_objects_v2.call_count == num_keys // 2 // 1000 + 1
+    else:
+        assert s3_session.mock_extras.head_object.call_count == num_keys + 2
+
+
+def test_rm_object():
+    s3_session = _fake_session_with_keys(['run/key', 'run/key_2', 'run/key/part-0'])
+    object_store = S3ObjectStore('bucket', s3_session=s3_session)
+
+    object_store.rm_object('run/key')
+    assert list(s3_session.buckets['bucket'].keys()) == ['run/key_2']
+    assert s3_session.mock_extras.delete_objects.call_count == 1
+
+    object_store.rm_object('run/key')
+    assert list(s3_session.buckets['bucket'].keys()) == ['run/key_2']
+    assert s3_session.mock_extras.delete_objects.call_count == 1
+
+
+def test_cp_objects():
+    keys = ['prev_run/key_{index}'.format(index=index) for index in range(25)]
+    s3_session = _fake_session_with_keys(keys)
+    object_store = S3ObjectStore('bucket', s3_session=s3_session, max_concurrency=4)
+
+    operations = object_store.cp_objects([(key, key.replace('prev_run', 'run')) for key in keys])
+
+    assert [operation.dest_key for operation in operations] == [
+        object_store.uri_for_key(key.replace('prev_run', 'run')) for key in keys
+    ]
+    assert s3_session.mock_extras.copy_object.call_count == len(keys)
+    assert object_store.has_objects([key.replace('prev_run', 'run') for key in keys]) == [True] * 25
+    assert object_store.cp_objects([]) == []
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 from google.cloud import storage
@@ -8,6 +9,9 @@ from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOpe
 from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
+# The maximum number of objects copied at once by cp_objects
+MAX_COPY_CONCURRENCY = 10
+
 
 class GCSObjectStore(ObjectStore):
     def __init__(self, bucket, client=None):
@@ -99,6 +103,17 @@ class GCSObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
+    def cp_objects(self, src_dst_pairs):
+        check.list_param(src_dst_pairs, 'src_dst_pairs', of_type=tuple)
+        if len(src_dst_pairs) <= 1:
+            return [self.cp_object(src, dst) for src, dst in src_dst_pairs]
+
+        # Each copy happens server side, so the time taken is mostly request latency
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_COPY_CONCURRENCY, len(src_dst_pairs))
+        ) as executor:
+            return list(executor.map(lambda src_dst: self.cp_object(*src_dst), src_dst_pairs))
+
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, 'key')
         protocol = check.opt_str_param(protocol, 'protocol', default='gs://')
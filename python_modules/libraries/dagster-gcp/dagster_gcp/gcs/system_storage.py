@@ -1,6 +1,10 @@
 from dagster import Field, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
-from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
+from dagster.core.storage.system_storage import (
+    REFERENCE_PREVIOUS_RUN_FIELD,
+    fs_system_storage,
+    mem_system_storage,
+)
 
 from .file_manager import GCSFileManager
 from .intermediate_store import GCSIntermediateStore
@@ -9,7 +13,7 @@ from .intermediate_store import GCSIntermediateStore
 @system_storage(
     name='gcs',
     is_persistent=True,
-    config={'gcs_bucket': Field(String)},
+    config={'gcs_bucket': Field(String), 'reference_previous_run': REFERENCE_PREVIOUS_RUN_FIELD},
     required_resource_keys={'gcs'},
 )
 def gcs_system_storage(init_context):
@@ -27,7 +31,8 @@ def gcs_system_storage(init_context):
                 gcs_bucket=init_context.system_storage_config['gcs_bucket'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
-            )
+            ),
+            reference_previous_run=init_context.system_storage_config['reference_previous_run'],
         ),
     )
 
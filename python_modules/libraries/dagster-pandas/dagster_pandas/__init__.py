@@ -1,3 +1,3 @@
-from .data_frame import DataFrame
+from .data_frame import DataFrame, DataFrameArrowSerializationStrategy
 
-__all__ = ['DataFrame']
+__all__ = ['DataFrame', 'DataFrameArrowSerializationStrategy']
@@ -0,0 +1,84 @@
+import io
+
+import pandas as pd
+import pytest
+from dagster_pandas import DataFrame, DataFrameArrowSerializationStrategy
+from dagster_pandas.data_frame import ARROW_STREAM_MARKER
+
+from dagster import InputDefinition, Int, OutputDefinition, execute_pipeline, lambda_solid, pipeline
+from dagster.utils import safe_tempfile_path
+
+
+class _UnseekableReader(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._data.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+def _round_trip(df):
+    serialization_strategy = DataFrameArrowSerializationStrategy()
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(df, tempfile_path)
+        with open(tempfile_path, 'rb') as read_obj:
+            data = read_obj.read()
+        from_file = serialization_strategy.deserialize_from_file(tempfile_path)
+
+    from_stream = serialization_strategy.deserialize(io.BytesIO(data))
+    # As read from e.g. the body of an S3 object, which cannot seek
+    from_buffered_stream = serialization_strategy.deserialize(
+        io.BufferedReader(_UnseekableReader(data))
+    )
+    pd.testing.assert_frame_equal(from_file, df)
+    pd.testing.assert_frame_equal(from_stream, df)
+    pd.testing.assert_frame_equal(from_buffered_stream, df)
+    return data
+
+
+def test_data_frame_serialization():
+    pytest.importorskip('pyarrow')
+
+    df = pd.DataFrame(
+        {
+            'num': [1, 2, 3],
+            'float': [1.0, None, 3.0],
+            'str': ['a', None, 'c'],
+            'time': pd.to_datetime(['2019-01-01', '2019-01-02', '2019-01-03']),
+        },
+        index=pd.Index(['x', 'y', 'z'], name='key'),
+    )
+    assert _round_trip(df).startswith(ARROW_STREAM_MARKER)
+
+
+def test_data_frame_serialization_falls_back_to_pickle():
+    # Arrow would read lists back as arrays, and cannot store columns of mixed types
+    assert not _round_trip(pd.DataFrame({'lists': [[1], [2, 3]]})).startswith(ARROW_STREAM_MARKER)
+    assert not _round_trip(pd.DataFrame({'mixed': [1, 'two']})).startswith(ARROW_STREAM_MARKER)
+    assert not _round_trip(pd.DataFrame([[1, 2]], columns=['a', 'a'])).startswith(
+        ARROW_STREAM_MARKER
+    )
+
+
+def test_data_frame_intermediates():
+    @lambda_solid(output_def=OutputDefinition(DataFrame))
+    def make_df():
+        return pd.DataFrame({'num': [1, 2, 3]})
+
+    @lambda_solid(input_defs=[InputDefinition('df', DataFrame)], output_def=OutputDefinition(Int))
+    def sum_df(df):
+        return int(df['num'].sum())
+
+    @pipeline
+    def df_pipeline():
+        sum_df(make_df())
+
+    result = execute_pipeline(df_pipeline, environment_dict={'storage': {'filesystem': {}}})
+    assert result.success
+    assert result.result_for_solid('sum_df').output_value() == 6
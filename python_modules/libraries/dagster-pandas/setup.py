@@ -52,6 +52,7 @@ def _do_setup(name='dagster-pandas'):
         packages=find_packages(exclude=['dagster_pandas_tests']),
         include_package_data=True,
         install_requires=['dagster', 'pandas', 'matplotlib'],
+        extras_require={'pyarrow': ['pyarrow>=0.15']},
     )
 
 
@@ -2,13 +2,20 @@ import multiprocessing
 import threading
 import time
 import warnings
-from collections import namedtuple
-
-from dagster_postgres.utils import get_conn
+from collections import OrderedDict, namedtuple
+
+from dagster_postgres.utils import (
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_MAX_SIZE,
+    get_engine,
+    pool_config_fields,
+    pooled_conn,
+)
 from six.moves.queue import Empty
 
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
 from dagster.core.serdes import (
     ConfigurableClass,
@@ -16,7 +23,10 @@ from dagster.core.serdes import (
     deserialize_json_to_dagster_namedtuple,
     serialize_dagster_namedtuple,
 )
-from dagster.core.storage.event_log import WatchableEventLogStorage
+from dagster.core.execution.stats import build_stats_from_events
+from dagster.core.storage.event_log import EventLogEntry, WatchableEventLogStorage
+from dagster.core.storage.event_log.event_log import STATS_EVENT_TYPES, get_event_record_step_key
+from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster.core.types import Field, String
 
 from .pynotify import await_pg_notifications
@@ -25,30 +35,245 @@ CREATE_EVENT_LOG_SQL = '''
 CREATE TABLE IF NOT EXISTS event_log (
     id BIGSERIAL PRIMARY KEY,
     run_id VARCHAR(255) NOT NULL,
-    event_body VARCHAR NOT NULL
+    event_body VARCHAR NOT NULL,
+    dagster_event_type VARCHAR(255),
+    step_key VARCHAR,
+    level INTEGER
 )
 '''
 
+# Columns added to event_log after its initial release, which older tables are migrated to
+MIGRATED_COLUMNS = [
+    ('dagster_event_type', 'VARCHAR(255)'),
+    ('step_key', 'VARCHAR'),
+    ('level', 'INTEGER'),
+]
+
+SELECT_EVENT_LOG_COLUMNS_SQL = '''
+SELECT column_name FROM information_schema.columns WHERE table_name = 'event_log'
+'''
+
+# Every stored event has a level, so rows without one predate the migration. The indexed columns
+# are backfilled from the serialized event.
+BACKFILL_EVENT_LOG_SQL = '''
+UPDATE event_log SET
+    dagster_event_type = event_body::json -> 'dagster_event' ->> 'event_type_value',
+    step_key = COALESCE(
+        event_body::json -> 'dagster_event' ->> 'step_key', event_body::json ->> 'step_key'
+    ),
+    level = (event_body::json ->> 'level')::INTEGER
+WHERE level IS NULL
+'''
+
+CREATE_INDEXES_SQL = [
+    'CREATE INDEX IF NOT EXISTS idx_event_log_run_id_id ON event_log (run_id, id)',
+    'CREATE INDEX IF NOT EXISTS idx_event_log_run_id_dagster_event_type '
+    'ON event_log (run_id, dagster_event_type)',
+    'CREATE INDEX IF NOT EXISTS idx_event_log_run_id_step_key ON event_log (run_id, step_key)',
+    'CREATE INDEX IF NOT EXISTS idx_event_log_run_id_level ON event_log (run_id, level)',
+]
+
+# One row per run summarizing its events, updated in the same statement as each event which
+# affects it is inserted
+CREATE_RUN_STATS_SQL = '''
+CREATE TABLE IF NOT EXISTS run_stats (
+    run_id VARCHAR(255) PRIMARY KEY,
+    steps_succeeded INTEGER NOT NULL DEFAULT 0,
+    steps_failed INTEGER NOT NULL DEFAULT 0,
+    materializations INTEGER NOT NULL DEFAULT 0,
+    expectations INTEGER NOT NULL DEFAULT 0,
+    start_time DOUBLE PRECISION,
+    end_time DOUBLE PRECISION
+)
+'''
+
+SELECT_RUN_STATS_EXISTS_SQL = '''
+SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'run_stats')
+'''
+
+# Builds the stats of the runs stored before run_stats was introduced from their events
+BACKFILL_RUN_STATS_SQL = '''
+INSERT INTO run_stats
+SELECT
+    run_id,
+    COUNT(*) FILTER (WHERE dagster_event_type = %(step_success)s),
+    COUNT(*) FILTER (WHERE dagster_event_type = %(step_failure)s),
+    COUNT(*) FILTER (WHERE dagster_event_type = %(step_materialization)s),
+    COUNT(*) FILTER (WHERE dagster_event_type = %(step_expectation_result)s),
+    MAX((event_body::json ->> 'timestamp')::DOUBLE PRECISION)
+        FILTER (WHERE dagster_event_type = %(pipeline_start)s),
+    COALESCE(
+        MAX((event_body::json ->> 'timestamp')::DOUBLE PRECISION)
+            FILTER (WHERE dagster_event_type = %(pipeline_success)s),
+        MAX((event_body::json ->> 'timestamp')::DOUBLE PRECISION)
+            FILTER (WHERE dagster_event_type = %(pipeline_failure)s)
+    )
+FROM event_log GROUP BY run_id
+ON CONFLICT (run_id) DO NOTHING
+'''
+
+SELECT_RUN_STATS_SQL = '''
+SELECT run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+FROM run_stats WHERE run_id = ANY(%s)
+'''
+
 WIPE_EVENT_LOG_SQL = 'DELETE FROM event_log'
 
+WIPE_RUN_STATS_SQL = 'DELETE FROM run_stats'
+
 DELETE_EVENT_LOG_SQL = 'DELETE FROM event_log WHERE run_id = %s'
 
+DELETE_RUN_STATS_SQL = 'DELETE FROM run_stats WHERE run_id = %s'
+
 DROP_EVENT_LOG_SQL = 'DROP TABLE IF EXISTS event_log'
 
+DROP_RUN_STATS_SQL = 'DROP TABLE IF EXISTS run_stats'
+
 SELECT_EVENT_LOG_SQL = 'SELECT event_body FROM event_log WHERE id = %s'
 
+# Reads page through a run's events by id, so the rows of a run must become visible in id order:
+# a row committed after a read with an id below the last id read would be skipped. Concurrent
+# writers to a run, e.g. the step processes of the multiprocess engine, are serialized by this
+# lock on the run, which is held until the writing transaction commits. Each row's id is assigned
+# once the lock is held, so it is greater than the id of every row of the run committed before.
+LOCK_RUN_SQL = 'SELECT pg_advisory_xact_lock(hashtext(%s))'
+
+# Inserts an event and notifies watchers of it in a single round trip, under the run's lock
+INSERT_AND_NOTIFY_EVENT_SQL = '''
+WITH run_lock AS (
+    SELECT pg_advisory_xact_lock(hashtext(%s))
+), inserted AS (
+    INSERT INTO event_log (run_id, event_body, dagster_event_type, step_key, level)
+    SELECT %s, %s, %s, %s, %s FROM run_lock
+    RETURNING run_id, id
+)
+SELECT pg_notify(%s, inserted.run_id || '_' || inserted.id) FROM inserted
+'''
+
+# As above, additionally adding the stats built from the event to the run's stats row
+INSERT_AND_NOTIFY_EVENT_WITH_STATS_SQL = '''
+WITH run_lock AS (
+    SELECT pg_advisory_xact_lock(hashtext(%s))
+), inserted AS (
+    INSERT INTO event_log (run_id, event_body, dagster_event_type, step_key, level)
+    SELECT %s, %s, %s, %s, %s FROM run_lock
+    RETURNING run_id, id
+), stats AS (
+    INSERT INTO run_stats AS current (
+        run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (run_id) DO UPDATE SET
+        steps_succeeded = current.steps_succeeded + EXCLUDED.steps_succeeded,
+        steps_failed = current.steps_failed + EXCLUDED.steps_failed,
+        materializations = current.materializations + EXCLUDED.materializations,
+        expectations = current.expectations + EXCLUDED.expectations,
+        start_time = COALESCE(EXCLUDED.start_time, current.start_time),
+        end_time = COALESCE(EXCLUDED.end_time, current.end_time)
+)
+SELECT pg_notify(%s, inserted.run_id || '_' || inserted.id) FROM inserted
+'''
+
+SELECT_EVENT_LOG_AFTER_ID_SQL = '''
+SELECT id, event_body FROM event_log WHERE run_id = %s AND id > %s ORDER BY id ASC
+'''
+
+SELECT_EVENT_LOG_ID_AT_OFFSET_SQL = '''
+SELECT id FROM event_log WHERE run_id = %s ORDER BY id ASC LIMIT 1 OFFSET %s
+'''
+
+SELECT_MAX_EVENT_LOG_ID_SQL = 'SELECT COALESCE(MAX(id), -1) FROM event_log WHERE run_id = %s'
+
+SELECT_EVENT_LOG_COUNT_AND_MAX_ID_SQL = '''
+SELECT COUNT(*), COALESCE(MAX(id), -1) FROM event_log WHERE run_id = %s
+'''
+
+# The number of runs for which the storage id of the last fetched offset is remembered
+MAX_CACHED_RUN_CURSORS = 1000
+
 CHANNEL_NAME = 'run_events'
 
 # Why? Because this is about as long as we expect a roundtrip to RDS to take.
 WATCHER_POLL_INTERVAL = 0.2
 
 
+def _logs_query_filters(event_types, step_keys, min_level):
+    '''The conditions, and their parameters, which select the events matching a query.'''
+    check.opt_list_param(event_types, 'event_types', of_type=DagsterEventType)
+    check.opt_list_param(step_keys, 'step_keys', of_type=str)
+    check.opt_int_param(min_level, 'min_level')
+
+    sql = ''
+    params = []
+
+    if event_types is not None:
+        sql += ' AND dagster_event_type = ANY(%s)'
+        params.append([event_type.value for event_type in event_types])
+
+    if step_keys is not None:
+        sql += ' AND step_key = ANY(%s)'
+        params.append(list(step_keys))
+
+    if min_level is not None:
+        sql += ' AND level >= %s'
+        params.append(min_level)
+
+    return sql, params
+
+
+def _store_event_statement(event):
+    '''The statement and parameters which insert an event, update its run's stats if the event
+    affects them, and notify listeners of it.'''
+    event_params = (
+        # The run's lock, then the inserted row
+        event.run_id,
+        event.run_id,
+        serialize_dagster_namedtuple(event),
+        event.dagster_event.event_type_value if event.is_dagster_event else None,
+        get_event_record_step_key(event),
+        event.level,
+    )
+
+    if event.is_dagster_event and event.dagster_event.event_type in STATS_EVENT_TYPES:
+        stats = build_stats_from_events(event.run_id, [event])
+        return (
+            INSERT_AND_NOTIFY_EVENT_WITH_STATS_SQL,
+            event_params
+            + (
+                stats.run_id,
+                stats.steps_succeeded,
+                stats.steps_failed,
+                stats.materializations,
+                stats.expectations,
+                stats.start_time,
+                stats.end_time,
+                CHANNEL_NAME,
+            ),
+        )
+
+    return (INSERT_AND_NOTIFY_EVENT_SQL, event_params + (CHANNEL_NAME,))
+
+
 class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(
+        self,
+        postgres_url,
+        pool_max_size=DEFAULT_POOL_MAX_SIZE,
+        pool_idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT,
+        inst_data=None,
+    ):
         self.conn_string = check.str_param(postgres_url, 'postgres_url')
-        self._event_watcher = create_event_watcher(self.conn_string)
-        conn = get_conn(self.conn_string)
-        conn.cursor().execute(CREATE_EVENT_LOG_SQL)
+        self._engine = get_engine(self.conn_string, pool_max_size, pool_idle_timeout)
+        self._event_watcher = create_event_watcher(self.conn_string, self._engine)
+        with pooled_conn(self._engine) as conn:
+            migrate_event_log_schema(conn)
+
+        # run_id -> (offset, id) of the last event returned by get_logs_for_run, so that a caller
+        # tailing a run with offset cursors is served by keyset pagination on (run_id, id). This
+        # relies on the rows of a run committing in id order, see LOCK_RUN_SQL
+        self._run_cursors = OrderedDict()
+        self._run_cursors_lock = threading.Lock()
+
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -57,7 +282,10 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('PostgresRunStorageConfig', {'postgres_url': Field(String)})
+        return SystemNamedDict(
+            'PostgresEventLogStorageConfig',
+            dict({'postgres_url': Field(String)}, **pool_config_fields()),
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
@@ -67,8 +295,9 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
     def create_clean_storage(conn_string):
         check.str_param(conn_string, 'conn_string')
 
-        conn = get_conn(conn_string)
-        conn.cursor().execute(DROP_EVENT_LOG_SQL)
+        with pooled_conn(get_engine(conn_string)) as conn:
+            conn.cursor().execute(DROP_EVENT_LOG_SQL)
+            conn.cursor().execute(DROP_RUN_STATS_SQL)
         return PostgresEventLogStorage(conn_string)
 
     def get_logs_for_run(self, run_id, cursor=-1):
@@ -83,14 +312,157 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
         check.int_param(cursor, 'cursor')
         check.invariant(cursor >= -1, 'Cursor must be -1 or greater')
 
-        with get_conn(self.conn_string).cursor() as curs:
-            FETCH_SQL = (
-                'SELECT event_body FROM event_log WHERE run_id = %s ORDER BY id ASC OFFSET %s;'
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            storage_id = self._storage_id_for_offset(curs, run_id, cursor)
+            if storage_id is None:
+                return []
+
+            curs.execute(SELECT_EVENT_LOG_AFTER_ID_SQL, (run_id, storage_id))
+            rows = curs.fetchall()
+
+        if rows:
+            self._cache_run_cursor(run_id, cursor + len(rows), rows[-1][0])
+
+        return [deserialize_json_to_dagster_namedtuple(event_body) for _, event_body in rows]
+
+    def _storage_id_for_offset(self, curs, run_id, cursor):
+        '''Translate a zero-indexed offset cursor into the id of the row at that offset within the
+        run, returning None if the run has no such row. The offset -1 translates to -1, which
+        precedes every row.'''
+        if cursor == -1:
+            return -1
+
+        with self._run_cursors_lock:
+            cached = self._run_cursors.get(run_id)
+        if cached is not None and cached[0] == cursor:
+            return cached[1]
+
+        # Only reached when a caller skips around the log; the scan is index-only on (run_id, id)
+        curs.execute(SELECT_EVENT_LOG_ID_AT_OFFSET_SQL, (run_id, cursor))
+        row = curs.fetchone()
+        if row is None:
+            return None
+
+        self._cache_run_cursor(run_id, cursor, row[0])
+        return row[0]
+
+    def _count_run_rows(self, curs, run_id):
+        '''The number of rows of the run, and the id of its last row, or -1 if it has none.'''
+        curs.execute(SELECT_EVENT_LOG_COUNT_AND_MAX_ID_SQL, (run_id,))
+        return curs.fetchone()
+
+    def _cache_run_cursor(self, run_id, offset, storage_id):
+        with self._run_cursors_lock:
+            self._run_cursors.pop(run_id, None)
+            self._run_cursors[run_id] = (offset, storage_id)
+            if len(self._run_cursors) > MAX_CACHED_RUN_CURSORS:
+                self._run_cursors.popitem(last=False)
+
+    def _clear_run_cursors(self, run_id=None):
+        with self._run_cursors_lock:
+            if run_id is None:
+                self._run_cursors.clear()
+            else:
+                self._run_cursors.pop(run_id, None)
+
+    def query_logs_for_run(
+        self,
+        run_id,
+        event_types=None,
+        step_keys=None,
+        min_level=None,
+        cursor=-1,
+        limit=None,
+        before_cursor=None,
+        newest_first=False,
+    ):
+        '''Get the logs corresponding to a run which match the given filters.
+
+        As for get_logs_for_run and watch, cursors are zero-indexed offsets into the run's log.
+        Offset cursors are translated into the ids of the rows at those offsets, and each entry's
+        offset is numbered by its position within the range of rows read.
+        '''
+        check.str_param(run_id, 'run_id')
+        check.int_param(cursor, 'cursor')
+        check.invariant(cursor >= -1, 'Cursor must be -1 or greater')
+        check.opt_int_param(limit, 'limit')
+        check.opt_int_param(before_cursor, 'before_cursor')
+        check.bool_param(newest_first, 'newest_first')
+
+        filters_sql, filter_params = _logs_query_filters(event_types, step_keys, min_level)
+
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            after_id = self._storage_id_for_offset(curs, run_id, cursor)
+            if after_id is None:
+                return []
+
+            # Rows at or past before_cursor are excluded. If the run has no row at before_cursor
+            # yet, every row after cursor is read.
+            before_id = (
+                self._storage_id_for_offset(curs, run_id, before_cursor)
+                if before_cursor is not None
+                else None
+            )
+
+            if newest_first:
+                # Offsets count down from the first offset past the range of rows read
+                if before_id is not None:
+                    end_offset = before_cursor
+                else:
+                    # Rows appended after the count would shift every offset, so the range of rows
+                    # read ends at the last row counted
+                    end_offset, max_id = self._count_run_rows(curs, run_id)
+                    before_id = max_id + 1
+                offset_sql = '%s - ROW_NUMBER() OVER (ORDER BY id DESC)'
+                params = [end_offset]
+            else:
+                offset_sql = '%s + ROW_NUMBER() OVER (ORDER BY id ASC)'
+                params = [cursor]
+
+            sql = (
+                'SELECT id, event_body, run_offset FROM ('
+                'SELECT id, event_body, dagster_event_type, step_key, level, '
+                + offset_sql
+                + ' AS run_offset FROM event_log WHERE run_id = %s AND id > %s'
             )
-            curs.execute(FETCH_SQL, (run_id, cursor + 1))
+            params += [run_id, after_id]
 
+            if before_id is not None:
+                sql += ' AND id < %s'
+                params.append(before_id)
+
+            # The filters apply after the offsets are numbered, which count every row of the run
+            sql += ') AS run_events WHERE TRUE' + filters_sql
+            params += filter_params
+
+            sql += ' ORDER BY id DESC' if newest_first else ' ORDER BY id ASC'
+
+            if limit is not None:
+                sql += ' LIMIT %s'
+                params.append(limit)
+
+            curs.execute(sql, params)
             rows = curs.fetchall()
-            return list(map(lambda r: deserialize_json_to_dagster_namedtuple(r[0]), rows))
+
+        # The next page is most likely read from the last cursor of this one
+        if rows:
+            self._cache_run_cursor(run_id, rows[-1][2], rows[-1][0])
+
+        return [
+            EventLogEntry(run_offset, deserialize_json_to_dagster_namedtuple(event_body))
+            for _, event_body, run_offset in rows
+        ]
+
+    def get_logs_count_for_run(self, run_id, event_types=None, step_keys=None, min_level=None):
+        check.str_param(run_id, 'run_id')
+
+        filters_sql, filter_params = _logs_query_filters(event_types, step_keys, min_level)
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            curs.execute(
+                'SELECT COUNT(*) FROM event_log WHERE run_id = %s' + filters_sql,
+                [run_id] + filter_params,
+            )
+            return curs.fetchone()[0]
 
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
@@ -102,30 +474,84 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
         check.inst_param(event, 'event', EventRecord)
 
-        with get_conn(self.conn_string).cursor() as curs:
-            event_body = serialize_dagster_namedtuple(event)
-            curs.execute(
-                '''INSERT INTO event_log (run_id, event_body) VALUES (%s, %s) RETURNING run_id, id;''',
-                (event.run_id, event_body),
-            )
-            res = curs.fetchone()
-            curs.execute(
-                '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
-                (res[0] + '_' + str(res[1]),),
-            )
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            curs.execute(*_store_event_statement(event))
+
+    def store_events(self, events):
+        '''Store many events in a single transaction over one connection.
+
+        Listeners are notified of the events when the transaction commits. Other writers to the
+        same runs wait for the transaction to commit, see LOCK_RUN_SQL.
+
+        Args:
+            events (List[EventRecord]): The events to store, possibly from many runs.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        if not events:
+            return
+
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            # Pooled connections are in autocommit mode, so the transaction is explicit
+            curs.execute('BEGIN')
+            try:
+                # Lock every run up front, in a consistent order, so that concurrent batches
+                # cannot deadlock on each other's runs
+                for run_id in sorted(set(event.run_id for event in events)):
+                    curs.execute(LOCK_RUN_SQL, (run_id,))
+                for event in events:
+                    curs.execute(*_store_event_statement(event))
+            except (Exception, KeyboardInterrupt):
+                curs.execute('ROLLBACK')
+                raise
+            curs.execute('COMMIT')
+
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+        return self.get_stats_for_runs([run_id])[run_id]
+
+    def get_stats_for_runs(self, run_ids):
+        '''Read the stats of every run in a single query against the run_stats table. Runs with
+        no stats recorded are given empty stats.'''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            curs.execute(SELECT_RUN_STATS_SQL, (list(run_ids),))
+            stats = {row[0]: PipelineRunStatsSnapshot(*row) for row in curs.fetchall()}
+
+        return {
+            run_id: stats[run_id] if run_id in stats else build_stats_from_events(run_id, [])
+            for run_id in run_ids
+        }
 
     def wipe(self):
         '''Clear the log storage.'''
 
-        with get_conn(self.conn_string).cursor() as curs:
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
             curs.execute(WIPE_EVENT_LOG_SQL)
+            curs.execute(WIPE_RUN_STATS_SQL)
+        self._clear_run_cursors()
 
     def delete_events(self, run_id):
-        with get_conn(self.conn_string).cursor() as curs:
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
             curs.execute(DELETE_EVENT_LOG_SQL, (run_id,))
+            curs.execute(DELETE_RUN_STATS_SQL, (run_id,))
+        self._clear_run_cursors(run_id)
 
     def watch(self, run_id, start_cursor, callback):
-        self._event_watcher.watch_run(run_id, start_cursor, callback)
+        '''Watch for events stored after the zero-indexed start_cursor. Notifications are filtered
+        by storage id, so the cursor is translated before being handed to the watcher.'''
+        check.str_param(run_id, 'run_id')
+        check.int_param(start_cursor, 'start_cursor')
+
+        with pooled_conn(self._engine) as conn, conn.cursor() as curs:
+            storage_id = self._storage_id_for_offset(curs, run_id, start_cursor)
+            if storage_id is None:
+                # The run has not reached start_cursor yet, so watch from its latest event
+                curs.execute(SELECT_MAX_EVENT_LOG_ID_SQL, (run_id,))
+                storage_id = curs.fetchone()[0]
+
+        self._event_watcher.watch_run(run_id, storage_id + 1, callback)
 
     def end_watch(self, run_id, handler):
         self._event_watcher.unwatch_run(run_id, handler)
@@ -139,6 +565,50 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
         self._event_watcher.close()
 
 
+def migrate_event_log_schema(conn):
+    '''Create the event_log and run_stats tables if they do not exist, bringing tables created by
+    an earlier version up to date by adding and backfilling the columns events are indexed by, and
+    the stats of each run.'''
+    with conn.cursor() as curs:
+        curs.execute(CREATE_EVENT_LOG_SQL)
+
+        curs.execute(SELECT_EVENT_LOG_COLUMNS_SQL)
+        columns = set(row[0] for row in curs.fetchall())
+        missing_columns = [
+            (column, column_type)
+            for column, column_type in MIGRATED_COLUMNS
+            if column not in columns
+        ]
+
+        if missing_columns:
+            for column, column_type in missing_columns:
+                curs.execute(
+                    'ALTER TABLE event_log ADD COLUMN IF NOT EXISTS {column} {column_type}'.format(
+                        column=column, column_type=column_type
+                    )
+                )
+            curs.execute(BACKFILL_EVENT_LOG_SQL)
+
+        for create_index_sql in CREATE_INDEXES_SQL:
+            curs.execute(create_index_sql)
+
+        curs.execute(SELECT_RUN_STATS_EXISTS_SQL)
+        if not curs.fetchone()[0]:
+            curs.execute(CREATE_RUN_STATS_SQL)
+            curs.execute(
+                BACKFILL_RUN_STATS_SQL,
+                {
+                    'step_success': DagsterEventType.STEP_SUCCESS.value,
+                    'step_failure': DagsterEventType.STEP_FAILURE.value,
+                    'step_materialization': DagsterEventType.STEP_MATERIALIZATION.value,
+                    'step_expectation_result': DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    'pipeline_start': DagsterEventType.PIPELINE_START.value,
+                    'pipeline_success': DagsterEventType.PIPELINE_SUCCESS.value,
+                    'pipeline_failure': DagsterEventType.PIPELINE_FAILURE.value,
+                },
+            )
+
+
 EventWatcherProcessStartedEvent = namedtuple('EventWatcherProcessStartedEvent', '')
 EventWatcherStart = namedtuple('EventWatcherStart', '')
 EventWatcherEvent = namedtuple('EventWatcherEvent', 'payload')
@@ -183,7 +653,7 @@ def _postgres_event_watcher_event_loop(conn_string, queue, run_id_dict):
         queue.put(EventWatcherEnd())
 
 
-def create_event_watcher(conn_string):
+def create_event_watcher(conn_string, engine):
     check.str_param(conn_string, 'conn_string')
 
     queue = multiprocessing.Queue()
@@ -198,10 +668,10 @@ def create_event_watcher(conn_string):
     # to get processes to start in linux in buildkite.
     check.inst(queue.get(block=True), EventWatcherProcessStartedEvent)
 
-    return PostgresEventWatcher(process, queue, m_dict, conn_string)
+    return PostgresEventWatcher(process, queue, m_dict, engine)
 
 
-def watcher_thread(conn_string, queue, handlers_dict, dict_lock, watcher_thread_exit):
+def watcher_thread(engine, queue, handlers_dict, dict_lock, watcher_thread_exit):
     done = False
     while not done and not watcher_thread_exit.is_set():
         event_list = []
@@ -228,7 +698,7 @@ def watcher_thread(conn_string, queue, handlers_dict, dict_lock, watcher_thread_
                 with dict_lock:
                     handlers = handlers_dict.get(run_id, [])
 
-                with get_conn(conn_string).cursor() as curs:
+                with pooled_conn(engine) as conn, conn.cursor() as curs:
                     curs.execute(SELECT_EVENT_LOG_SQL, (index,))
                     dagster_event = deserialize_json_to_dagster_namedtuple(curs.fetchone()[0])
 
@@ -239,7 +709,7 @@ def watcher_thread(conn_string, queue, handlers_dict, dict_lock, watcher_thread_
 
 
 class PostgresEventWatcher:
-    def __init__(self, process, queue, run_id_dict, conn_string):
+    def __init__(self, process, queue, run_id_dict, engine):
         self.process = check.inst_param(process, 'process', multiprocessing.Process)
         self.run_id_dict = check.inst_param(
             run_id_dict, 'run_id_dict', multiprocessing.managers.DictProxy
@@ -247,12 +717,12 @@ class PostgresEventWatcher:
         self.handlers_dict = {}
         self.dict_lock = threading.Lock()
         self.queue = check.inst_param(queue, 'queue', multiprocessing.queues.Queue)
-        self.conn_string = conn_string
+        self.engine = engine
         self.watcher_thread_exit = threading.Event()
         self.watcher_thread = threading.Thread(
             target=watcher_thread,
             args=(
-                self.conn_string,
+                self.engine,
                 self.queue,
                 self.handlers_dict,
                 self.dict_lock,
@@ -1,14 +1,26 @@
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.core.storage.runs.sqlite import RunStorageSQLMetadata, SQLRunStorage, create_engine
+from dagster.core.storage.runs.sqlite import (
+    RunStorageSQLMetadata,
+    SQLRunStorage,
+    create_run_storage_schema,
+)
 from dagster.core.types import Field, String
 
+from .utils import DEFAULT_POOL_IDLE_TIMEOUT, DEFAULT_POOL_MAX_SIZE, get_engine, pool_config_fields
+
 
 class PostgresRunStorage(SQLRunStorage, ConfigurableClass):
-    def __init__(self, postgres_url, inst_data=None):
-        self.engine = create_engine(postgres_url)
-        RunStorageSQLMetadata.create_all(self.engine)
+    def __init__(
+        self,
+        postgres_url,
+        pool_max_size=DEFAULT_POOL_MAX_SIZE,
+        pool_idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT,
+        inst_data=None,
+    ):
+        self.engine = get_engine(postgres_url, pool_max_size, pool_idle_timeout)
+        create_run_storage_schema(self.engine)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -17,7 +29,10 @@ class PostgresRunStorage(SQLRunStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('PostgresRunStorageConfig', {'postgres_url': Field(String)})
+        return SystemNamedDict(
+            'PostgresRunStorageConfig',
+            dict({'postgres_url': Field(String)}, **pool_config_fields()),
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
@@ -25,8 +40,7 @@ class PostgresRunStorage(SQLRunStorage, ConfigurableClass):
 
     @staticmethod
     def create_clean_storage(postgres_url):
-        engine = create_engine(postgres_url)
-        RunStorageSQLMetadata.drop_all(engine)
+        RunStorageSQLMetadata.drop_all(get_engine(postgres_url))
         return PostgresRunStorage(postgres_url)
 
     def connect(self):
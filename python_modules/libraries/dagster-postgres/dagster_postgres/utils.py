@@ -1,6 +1,24 @@
+import os
+import threading
 import time
+from contextlib import contextmanager
 
 import psycopg2
+import sqlalchemy as db
+
+from dagster import check
+from dagster.core.types import Field, Float, Int
+
+DEFAULT_POOL_MAX_SIZE = 5
+
+# Seconds a pooled connection may sit unused before it is replaced on its next checkout
+DEFAULT_POOL_IDLE_TIMEOUT = 300.0
+
+# Seconds to wait for a connection when every pooled connection is in use
+POOL_CHECKOUT_TIMEOUT = 30
+
+_engines = {}
+_engines_lock = threading.Lock()
 
 
 def get_conn(conn_string):
@@ -30,3 +48,92 @@ def wait_for_connection(conn_string):
 
     assert retry_limit == 0
     raise Exception('too many retries for db at {conn_string}'.format(conn_string=conn_string))
+
+
+def pool_config_fields():
+    '''Config fields for the connection pool settings shared by the postgres storages.'''
+    return {
+        'pool_max_size': Field(
+            Int,
+            is_optional=True,
+            default_value=DEFAULT_POOL_MAX_SIZE,
+            description='The maximum number of connections held open to the database by each '
+            'process.',
+        ),
+        'pool_idle_timeout': Field(
+            Float,
+            is_optional=True,
+            default_value=DEFAULT_POOL_IDLE_TIMEOUT,
+            description='The number of seconds a pooled connection may go unused before it is '
+            'replaced.',
+        ),
+    }
+
+
+def _on_pool_connect(dbapi_connection, connection_record):
+    connection_record.info['pid'] = os.getpid()
+
+
+def _on_pool_checkin(dbapi_connection, connection_record):
+    connection_record.info['checkin_time'] = time.time()
+
+
+def _make_pool_checkout_listener(idle_timeout):
+    def _on_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info['pid'] != os.getpid():
+            # The connection was inherited across a fork. Drop it without closing it, which would
+            # terminate the session the parent process is still using.
+            connection_record.connection = connection_proxy.connection = None
+            raise db.exc.DisconnectionError(
+                'Connection record belongs to pid {record_pid}, attempting to check out in pid '
+                '{pid}'.format(record_pid=connection_record.info['pid'], pid=os.getpid())
+            )
+
+        checkin_time = connection_record.info.get('checkin_time')
+        if checkin_time is not None and time.time() - checkin_time > idle_timeout:
+            # The pool replaces the connection and retries the checkout
+            raise db.exc.DisconnectionError('Connection idle for longer than the pool idle timeout')
+
+    return _on_pool_checkout
+
+
+def get_engine(
+    conn_string, pool_max_size=DEFAULT_POOL_MAX_SIZE, pool_idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT
+):
+    '''Get the SQLAlchemy engine, and with it the pool of autocommit connections, for a database.
+
+    Engines are shared by every storage in the process connecting to the same database with the
+    same pool settings. Connections are checked for having been inherited across a fork and for
+    having idled for longer than pool_idle_timeout seconds when they are checked out, and are
+    replaced if so.
+    '''
+    check.str_param(conn_string, 'conn_string')
+    check.int_param(pool_max_size, 'pool_max_size')
+    check.float_param(pool_idle_timeout, 'pool_idle_timeout')
+
+    key = (conn_string, pool_max_size, pool_idle_timeout)
+    with _engines_lock:
+        if key not in _engines:
+            engine = db.create_engine(
+                conn_string,
+                isolation_level='AUTOCOMMIT',
+                pool_size=pool_max_size,
+                max_overflow=0,
+                pool_timeout=POOL_CHECKOUT_TIMEOUT,
+            )
+            db.event.listen(engine, 'connect', _on_pool_connect)
+            db.event.listen(engine, 'checkin', _on_pool_checkin)
+            db.event.listen(engine, 'checkout', _make_pool_checkout_listener(pool_idle_timeout))
+            _engines[key] = engine
+
+        return _engines[key]
+
+
+@contextmanager
+def pooled_conn(engine):
+    '''Check out a raw psycopg2 connection from an engine's pool, returning it when done.'''
+    conn = engine.raw_connection()
+    try:
+        yield conn
+    finally:
+        conn.close()
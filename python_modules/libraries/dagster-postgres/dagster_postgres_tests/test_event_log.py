@@ -1,13 +1,19 @@
+import threading
 import time
 import uuid
 
-from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log import (
+    DROP_EVENT_LOG_SQL,
+    DROP_RUN_STATS_SQL,
+    PostgresEventLogStorage,
+    _store_event_statement,
+)
 from dagster_postgres.utils import get_conn
 
 from dagster import ModeDefinition, RunConfig, execute_pipeline, pipeline, solid
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import DagsterEventRecord, construct_event_logger
-from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.loggers import colored_console_logger
 
 TEST_TIMEOUT = 3
@@ -316,6 +322,343 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(conn_string):
     assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
 
+def test_get_logs_for_run_tailing_interleaved_runs(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    events_two, _result_two = gather_events(_solids)
+
+    # tail run one with offset cursors while run two's events are interleaved with it
+    cursor = -1
+    fetched = []
+    for event_one, event_two in zip(events_one, events_two):
+        event_log_storage.store_event(event_one)
+        event_log_storage.store_event(event_two)
+
+        new_events = event_log_storage.get_logs_for_run(result_one.run_id, cursor)
+        assert len(new_events) == 1
+        cursor += len(new_events)
+        fetched.extend(new_events)
+
+    assert event_types(fetched) == event_types(events_one)
+    assert set(event.run_id for event in fetched) == {result_one.run_id}
+
+    # offsets which were never fetched are still translated
+    assert event_types(event_log_storage.get_logs_for_run(result_one.run_id, 4)) == event_types(
+        events_one[5:]
+    )
+    assert event_log_storage.get_logs_for_run(result_one.run_id, 6) == []
+    assert event_log_storage.get_logs_for_run(result_one.run_id, 100) == []
+
+
+def test_watch_translates_offset_cursor(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    run_id = str(uuid.uuid4())
+    events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+
+    for event in events[:3]:
+        event_log_storage.store_event(event)
+
+    event_list = []
+    event_log_storage.watch(run_id, 2, event_list.append)
+
+    try:
+        for event in events[3:]:
+            event_log_storage.store_event(event)
+
+        start = time.time()
+        while len(event_list) < 4 and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert event_types(event_list) == event_types(events[3:])
+    finally:
+        del event_log_storage
+
+
+def test_watch_from_query_logs_cursor(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    run_id = str(uuid.uuid4())
+    events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+
+    for event in events[:5]:
+        event_log_storage.store_event(event)
+
+    # Page to the end of the stored events, then tail the run from the last cursor of the page
+    page = event_log_storage.query_logs_for_run(run_id, limit=3)
+    page += event_log_storage.query_logs_for_run(run_id, cursor=page[-1].cursor, limit=3)
+    assert event_types([entry.event_record for entry in page]) == event_types(events[:5])
+
+    event_list = []
+    event_log_storage.watch(run_id, page[-1].cursor, event_list.append)
+
+    try:
+        for event in events[5:]:
+            event_log_storage.store_event(event)
+
+        start = time.time()
+        while len(event_list) < len(events[5:]) and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert event_types(event_list) == event_types(events[5:])
+    finally:
+        del event_log_storage
+
+
+def test_query_logs_for_run(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    for event in events_one:
+        event_log_storage.store_event(event)
+
+    events_two, _result_two = gather_events(_solids)
+    for event in events_two:
+        event_log_storage.store_event(event)
+
+    entries = event_log_storage.query_logs_for_run(
+        result_one.run_id,
+        event_types=[DagsterEventType.STEP_OUTPUT, DagsterEventType.STEP_SUCCESS],
+        step_keys=['return_one.compute'],
+    )
+    assert event_types([entry.event_record for entry in entries]) == [
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.STEP_SUCCESS,
+    ]
+    assert set(entry.event_record.run_id for entry in entries) == {result_one.run_id}
+
+    all_entries = event_log_storage.query_logs_for_run(result_one.run_id)
+    assert [entry.cursor for entry in all_entries] == list(range(7))
+
+    # Cursors are offsets into the run's log whatever the filters, as on the other storages
+    assert [entry.cursor for entry in entries] == [
+        entry.cursor
+        for entry in all_entries
+        if entry.event_record.dagster_event
+        and entry.event_record.dagster_event.event_type
+        in [DagsterEventType.STEP_OUTPUT, DagsterEventType.STEP_SUCCESS]
+    ]
+
+    page = event_log_storage.query_logs_for_run(result_one.run_id, cursor=1, limit=2)
+    assert [entry.cursor for entry in page] == [2, 3]
+
+    page = event_log_storage.query_logs_for_run(
+        result_one.run_id, before_cursor=5, limit=2, newest_first=True
+    )
+    assert [entry.cursor for entry in page] == [4, 3]
+
+    page = event_log_storage.query_logs_for_run(result_one.run_id, limit=2, newest_first=True)
+    assert [entry.cursor for entry in page] == [6, 5]
+
+    assert event_log_storage.get_logs_count_for_run(result_one.run_id) == 7
+    assert event_log_storage.get_logs_count_for_run(
+        result_one.run_id, step_keys=['return_one.compute']
+    ) == len(
+        event_log_storage.query_logs_for_run(result_one.run_id, step_keys=['return_one.compute'])
+    )
+    assert event_log_storage.get_logs_count_for_run('foo') == 0
+
+
+def test_query_logs_newest_first_while_appending(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    run_id = str(uuid.uuid4())
+    events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+
+    for event in events[:5]:
+        event_log_storage.store_event(event)
+
+    # Append a row between counting the run's rows and reading the newest of them
+    count_run_rows = event_log_storage._count_run_rows  # pylint: disable=protected-access
+
+    def _count_run_rows_then_append(curs, count_run_id):
+        result = count_run_rows(curs, count_run_id)
+        event_log_storage.store_event(events[5])
+        return result
+
+    event_log_storage._count_run_rows = _count_run_rows_then_append
+
+    page = event_log_storage.query_logs_for_run(run_id, limit=2, newest_first=True)
+    assert [entry.cursor for entry in page] == [4, 3]
+    assert event_types([entry.event_record for entry in page]) == event_types(events[3:5][::-1])
+
+    # The cursors of the page, and so the cursor remembered for the run, are still correct
+    del event_log_storage._count_run_rows
+    assert event_types(event_log_storage.get_logs_for_run(run_id, cursor=page[-1].cursor)) == (
+        event_types(events[4:6])
+    )
+
+
+def test_migrate_event_log_schema(conn_string):
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events, result = gather_events(_solids)
+
+    conn = get_conn(conn_string)
+    with conn.cursor() as curs:
+        curs.execute(DROP_EVENT_LOG_SQL)
+        curs.execute(DROP_RUN_STATS_SQL)
+        curs.execute(
+            '''CREATE TABLE event_log (
+                id BIGSERIAL PRIMARY KEY,
+                run_id VARCHAR(255) NOT NULL,
+                event_body VARCHAR NOT NULL
+            )'''
+        )
+        for event in events:
+            curs.execute(
+                'INSERT INTO event_log (run_id, event_body) VALUES (%s, %s)',
+                (event.run_id, serialize_dagster_namedtuple(event)),
+            )
+
+    event_log_storage = PostgresEventLogStorage(conn_string)
+
+    entries = event_log_storage.query_logs_for_run(
+        result.run_id,
+        event_types=[DagsterEventType.STEP_OUTPUT],
+        step_keys=['return_one.compute'],
+        min_level=10,
+    )
+    assert event_types([entry.event_record for entry in entries]) == [DagsterEventType.STEP_OUTPUT]
+
+    stats = event_log_storage.get_stats_for_run(result.run_id)
+    assert stats.steps_succeeded == 1
+    assert stats.start_time is not None
+    assert stats.end_time is not None
+
+
+def test_get_stats_for_runs(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    for event in events_one:
+        event_log_storage.store_event(event)
+
+    events_two, result_two = gather_events(_solids)
+    for event in events_two:
+        event_log_storage.store_event(event)
+
+    stats = event_log_storage.get_stats_for_runs([result_one.run_id, result_two.run_id, 'foo'])
+    for result in [result_one, result_two]:
+        assert stats[result.run_id].steps_succeeded == 1
+        assert stats[result.run_id].steps_failed == 0
+        assert stats[result.run_id].start_time <= stats[result.run_id].end_time
+
+    assert stats['foo'].steps_succeeded == 0
+    assert stats['foo'].start_time is None
+
+    event_log_storage.delete_events(result_one.run_id)
+    assert event_log_storage.get_stats_for_run(result_one.run_id).steps_succeeded == 0
+    assert event_log_storage.get_stats_for_run(result_two.run_id).steps_succeeded == 1
+
+
+def test_store_events(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    events_two, result_two = gather_events(_solids)
+    event_log_storage.store_events(events_one + events_two)
+    event_log_storage.store_events([])
+
+    for events, result in [(events_one, result_one), (events_two, result_two)]:
+        assert [
+            serialize_dagster_namedtuple(event)
+            for event in event_log_storage.get_logs_for_run(result.run_id)
+        ] == [serialize_dagster_namedtuple(event) for event in events]
+        assert event_log_storage.get_stats_for_run(result.run_id).steps_succeeded == 1
+
+
+def test_concurrent_writers_commit_run_events_in_id_order(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events, result = gather_events(_solids)
+
+    # A batch of the run's events is being written in an open transaction
+    conn = get_conn(conn_string)
+    curs = conn.cursor()
+    curs.execute('BEGIN')
+    curs.execute(*_store_event_statement(events[0]))
+
+    # so a concurrent write to the run waits for it, rather than committing a later id first
+    store_thread = threading.Thread(target=event_log_storage.store_event, args=(events[1],))
+    store_thread.start()
+    time.sleep(0.5)
+    assert store_thread.is_alive()
+    assert event_log_storage.get_logs_for_run(result.run_id) == []
+
+    curs.execute('COMMIT')
+    store_thread.join()
+    conn.close()
+
+    # a reader tailing the run with cursors sees both events, in order
+    assert event_types(event_log_storage.get_logs_for_run(result.run_id)) == event_types(events[:2])
+    assert event_types(event_log_storage.get_logs_for_run(result.run_id, 0)) == event_types(
+        events[1:2]
+    )
+
+
 def test_listen_notify_single_run_event(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 
@@ -0,0 +1,97 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.run_storage import PostgresRunStorage
+from dagster_postgres.utils import get_engine, pooled_conn
+
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+
+
+def _event_record(run_id):
+    return DagsterEventRecord(
+        None,
+        'Message',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def test_storages_share_pool(conn_string):
+    run_storage = PostgresRunStorage.create_clean_storage(conn_string)
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+    try:
+        assert run_storage.engine is event_log_storage._engine  # pylint: disable=protected-access
+        assert get_engine(conn_string, pool_max_size=2) is not run_storage.engine
+    finally:
+        del event_log_storage
+
+
+def test_store_events_reuses_connections(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+    try:
+        engine = event_log_storage._engine  # pylint: disable=protected-access
+        for _ in range(50):
+            event_log_storage.store_event(_event_record('foo'))
+
+        assert len(event_log_storage.get_logs_for_run('foo')) == 50
+        assert engine.pool.checkedout() == 0
+    finally:
+        del event_log_storage
+
+
+def test_idle_connections_are_replaced(conn_string):
+    engine = get_engine(conn_string, pool_idle_timeout=0.1)
+
+    with pooled_conn(engine) as conn:
+        first = conn.connection
+    with pooled_conn(engine) as conn:
+        assert conn.connection is first
+
+    time.sleep(0.2)
+    with pooled_conn(engine) as conn:
+        assert conn.connection is not first
+        assert first.closed
+
+
+def _use_inherited_engine(conn_string, queue):
+    with pooled_conn(get_engine(conn_string)) as conn:
+        with conn.cursor() as curs:
+            curs.execute('SELECT pg_backend_pid()')
+            queue.put(curs.fetchone()[0])
+
+
+def test_pool_is_fork_safe(conn_string):
+    if not hasattr(os, 'fork'):
+        pytest.skip('Requires fork')
+
+    engine = get_engine(conn_string)
+    with pooled_conn(engine) as conn:
+        with conn.cursor() as curs:
+            curs.execute('SELECT pg_backend_pid()')
+            parent_backend_pid = curs.fetchone()[0]
+
+    # the default start method on linux forks, so the child inherits the module level engines
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_use_inherited_engine, args=(conn_string, queue))
+    process.start()
+    child_backend_pid = queue.get(timeout=10)
+    process.join()
+
+    assert child_backend_pid != parent_backend_pid
+
+    # the parent's connection is still usable
+    with pooled_conn(engine) as conn:
+        with conn.cursor() as curs:
+            curs.execute('SELECT pg_backend_pid()')
+            assert curs.fetchone()[0] == parent_backend_pid
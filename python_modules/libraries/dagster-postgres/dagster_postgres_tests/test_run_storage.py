@@ -278,3 +278,40 @@ def test_fetch_by_status_cursored(clean_storage):
     )
     assert len(cursor_four_limit_one) == 1
     assert cursor_four_limit_one[0].run_id == two
+
+
+def test_fetch_run_summaries(clean_storage):
+    storage = clean_storage
+    one, two, three = [str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())]
+    storage.add_run(
+        build_run(
+            run_id=one,
+            pipeline_name='some_pipeline',
+            tags={'mytag': 'hello', 'mytag2': 'world'},
+            status=PipelineRunStatus.SUCCESS,
+        )
+    )
+    storage.add_run(
+        build_run(
+            run_id=two,
+            pipeline_name='some_other_pipeline',
+            tags={'mytag': 'hello'},
+            status=PipelineRunStatus.FAILURE,
+        )
+    )
+    storage.add_run(build_run(run_id=three, pipeline_name='some_pipeline'))
+
+    summaries = storage.get_run_summaries()
+    assert [summary.run_id for summary in summaries] == [three, two, one]
+    assert summaries[2].tags == {'mytag': 'hello', 'mytag2': 'world'}
+    assert summaries[2].status == PipelineRunStatus.SUCCESS
+    assert summaries[2].create_timestamp is not None
+
+    def _run_ids(**kwargs):
+        return [summary.run_id for summary in storage.get_run_summaries(**kwargs)]
+
+    assert _run_ids(pipeline_name='some_pipeline') == [three, one]
+    assert _run_ids(status=PipelineRunStatus.FAILURE) == [two]
+    assert _run_ids(tags=[('mytag', 'hello')]) == [two, one]
+    assert _run_ids(tags=[('mytag', 'hello'), ('mytag2', 'world')]) == [one]
+    assert _run_ids(cursor=three, limit=1) == [two]